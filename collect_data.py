@@ -3,10 +3,11 @@
 GitHub Actions에서 실행되어 날짜별 JSON 파일로 저장합니다.
 """
 
-import json
 import os
 from datetime import datetime
+from crawlers.market_aggregates import compute_aggregates
 from crawlers.market_crawler import crawler
+from utils.fast_json import dump_file
 
 
 def collect_and_save():
@@ -42,9 +43,13 @@ def collect_and_save():
         print(f"  - 유럽 시장: {len(market_data['europe_market'])}개 지수")
         print(f"  - 총 {market_data['total_count']}개 지수")
 
-        # JSON 파일로 저장
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(market_data, f, ensure_ascii=False, indent=2)
+        # 지역별 평균 등락률/상승·하락 수/상위 지수 집계를 함께 저장
+        market_data['aggregates'] = compute_aggregates(market_data)
+        if market_data['aggregates']['all_regions_up']:
+            print("  - 미국/아시아/유럽 모두 상승")
+
+        # JSON 파일로 저장 (JSON_COMPACT=1이면 공백 없이)
+        dump_file(market_data, filename)
 
         print(f"\n✅ 데이터 저장 완료: {filename}")
 
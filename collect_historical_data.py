@@ -3,10 +3,12 @@
 오늘 이전 30일간의 데이터를 날짜별 JSON 파일로 저장합니다.
 """
 
-import json
 import os
 from datetime import datetime, timedelta
+from crawlers.market_aggregates import compute_aggregates
+from crawlers.market_columns import export_history_columns
 from crawlers.market_crawler import crawler
+from utils.fast_json import dump_file
 
 
 def collect_last_30_days():
@@ -55,9 +57,9 @@ def collect_last_30_days():
                     fail_count += 1
                     continue
 
-                # JSON 파일로 저장
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(market_data, f, ensure_ascii=False, indent=2)
+                # 집계를 함께 저장 (JSON_COMPACT=1이면 공백 없이)
+                market_data['aggregates'] = compute_aggregates(market_data)
+                dump_file(market_data, filename)
 
                 file_size = os.path.getsize(filename)
                 print(f"✅ 저장 완료 ({market_data['total_count']}개 지수, {file_size} bytes)")
@@ -67,6 +69,9 @@ def collect_last_30_days():
                 print(f"❌ 실패: {e}")
                 fail_count += 1
 
+        # 열 저장소(.npy)도 함께 갱신 (numpy가 없으면 건너뜀)
+        columns_dir = export_history_columns('data')
+
         # 결과 요약
         print("\n" + "="*60)
         print("📊 수집 결과 요약")
@@ -74,6 +79,7 @@ def collect_last_30_days():
         print(f"✅ 성공: {success_count}개 파일")
         print(f"❌ 실패: {fail_count}개 파일")
         print(f"📁 저장 위치: data/")
+        print(f"🧮 열 저장소: {columns_dir or '건너뜀 (numpy 미설치 또는 데이터 없음)'}")
         print("="*60 + "\n")
 
         # 저장된 파일 목록 출력
@@ -3,10 +3,12 @@
 오늘 이전 30일간의 데이터를 하나의 JSON 파일에 저장합니다.
 """
 
-import json
 import os
 from datetime import datetime, timedelta
+from crawlers.market_aggregates import compute_aggregates
+from crawlers.market_columns import export_history_columns
 from crawlers.market_crawler import crawler
+from utils.fast_json import dump_file
 
 
 def collect_monthly_data_to_single_file():
@@ -67,7 +69,8 @@ def collect_monthly_data_to_single_file():
                         'us_market': market_data['us_market'],
                         'asia_market': market_data['asia_market'],
                         'europe_market': market_data['europe_market'],
-                        'total_count': market_data['total_count']
+                        'total_count': market_data['total_count'],
+                        'aggregates': compute_aggregates(market_data)
                     })
 
             except Exception as e:
@@ -99,11 +102,14 @@ def collect_monthly_data_to_single_file():
             'data': all_data
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(monthly_data, f, ensure_ascii=False, indent=2)
+        # JSON_COMPACT=1이면 공백 없이 저장
+        dump_file(monthly_data, filename)
 
         file_size = os.path.getsize(filename)
 
+        # 열 저장소(.npy)도 함께 갱신 (numpy가 없으면 건너뜀)
+        columns_dir = export_history_columns('data')
+
         # 결과 요약
         print("\n" + "="*60)
         print("[DATA] 수집 결과 요약")
@@ -112,6 +118,7 @@ def collect_monthly_data_to_single_file():
         print(f"[SKIP] 실패/휴일: {fail_count}일")
         print(f"[FILE] 저장 파일: {filename}")
         print(f"[SIZE] 파일 크기: {file_size:,} bytes ({file_size/1024:.2f} KB)")
+        print(f"[COLUMNS] 열 저장소: {columns_dir or '건너뜀 (numpy 미설치 또는 데이터 없음)'}")
         print("="*60 + "\n")
 
         print(f"[OK] 한 달간 데이터가 하나의 파일로 저장되었습니다!")
@@ -0,0 +1,157 @@
+"""
+해외시장 일별 집계
+지역별 평균 등락률, 상승/하락 종목 수, 상위 상승/하락 지수, 전 지역 상승 여부를
+시세가 들어올 때마다 이어서 계산합니다.
+지수별 마지막 값을 기억해 두고 값이 바뀐 지수만 합계에서 빼고 더하며,
+등락률 순위는 정렬 리스트에 bisect로 넣고 빼므로 종목 수가 늘어도 갱신 비용이 작습니다.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional
+
+# 요약 데이터의 시장 키 → 지역 이름
+MARKET_REGIONS = {'us_market': 'us', 'asia_market': 'asia', 'europe_market': 'europe'}
+
+# 상위 상승/하락 지수 개수
+TOP_MOVERS = 3
+
+
+def _field(record, name: str):
+    """dict 레코드와 Quote에서 같은 방식으로 필드 읽기"""
+    return record.get(name) if isinstance(record, dict) else getattr(record, name, None)
+
+
+class _RegionTotals:
+    """지역 하나의 누적 합계"""
+
+    __slots__ = ('count', 'change_sum', 'advancers', 'decliners', 'unchanged')
+
+    def __init__(self):
+        self.count = 0
+        self.change_sum = 0.0
+        self.advancers = 0
+        self.decliners = 0
+        self.unchanged = 0
+
+    def add(self, change_percent: float, sign: int) -> None:
+        """지수 하나의 기여분을 더하거나(sign=1) 뺌(sign=-1)"""
+        self.count += sign
+        self.change_sum += sign * change_percent
+        if change_percent > 0:
+            self.advancers += sign
+        elif change_percent < 0:
+            self.decliners += sign
+        else:
+            self.unchanged += sign
+
+    def to_dict(self) -> Dict:
+        average = round(self.change_sum / self.count, 2) if self.count else 0.0
+        return {
+            'count': self.count,
+            'avg_change_percent': average,
+            'advancers': self.advancers,
+            'decliners': self.decliners,
+            'unchanged': self.unchanged,
+            'up': self.count > 0 and average > 0,
+        }
+
+
+class MarketAggregator:
+    """지수별 최신 값으로 지역/전체 집계를 이어서 계산"""
+
+    def __init__(self, top_movers: int = TOP_MOVERS):
+        self.top_movers = top_movers
+        self._latest: Dict[str, tuple] = {}  # 심볼 → (지역, 이름, 현재가, 등락률)
+        self._regions: Dict[str, _RegionTotals] = {region: _RegionTotals() for region in MARKET_REGIONS.values()}
+        self._total = _RegionTotals()
+        self._ranking: List[tuple] = []  # (등락률, 심볼) 오름차순
+        self._overview: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def apply(self, region: str, records: Iterable, full: bool = False) -> int:
+        """
+        지역 하나의 시세 반영 (값이 바뀐 지수만 합계/순위 갱신)
+
+        Args:
+            region: 지역 이름
+            records: 지수 레코드 (dict 또는 Quote)
+            full: records가 지역 전체 목록이면 True (목록에 없는 지수는 집계에서 뺌)
+
+        Returns:
+            갱신(추가/변경/삭제)한 지수 수
+        """
+        changed = 0
+        with self._lock:
+            seen = set()
+            for record in records:
+                symbol = _field(record, 'symbol')
+                change_percent = _field(record, 'change_percent')
+                if not symbol or change_percent is None:
+                    continue
+                seen.add(symbol)
+                entry = (region, _field(record, 'name'), _field(record, 'current_price'), change_percent)
+                previous = self._latest.get(symbol)
+                if previous == entry:
+                    continue
+
+                if previous is not None:
+                    self._subtract(symbol, previous)
+                self._regions.setdefault(region, _RegionTotals()).add(change_percent, 1)
+                self._total.add(change_percent, 1)
+                insort(self._ranking, (change_percent, symbol))
+                self._latest[symbol] = entry
+                changed += 1
+
+            if full:
+                missing = [symbol for symbol, entry in self._latest.items() if entry[0] == region and symbol not in seen]
+                for symbol in missing:
+                    self._subtract(symbol, self._latest.pop(symbol))
+                changed += len(missing)
+
+            if changed:
+                self._overview = None
+        return changed
+
+    def _subtract(self, symbol: str, entry: tuple) -> None:
+        """지수 하나의 이전 기여분을 합계와 순위에서 뺌 (잠금 안에서 호출)"""
+        self._regions.setdefault(entry[0], _RegionTotals()).add(entry[3], -1)
+        self._total.add(entry[3], -1)
+        del self._ranking[bisect_left(self._ranking, (entry[3], symbol))]
+
+    def apply_summary(self, summary: Dict) -> int:
+        """get_market_summary 형식(시장별 리스트) 반영 (시장별 목록을 전체 목록으로 봄)"""
+        return sum(
+            self.apply(region, summary.get(market_key, []), full=True)
+            for market_key, region in MARKET_REGIONS.items()
+        )
+
+    def _mover(self, symbol: str) -> Dict:
+        _, name, current_price, change_percent = self._latest[symbol]
+        return {'symbol': symbol, 'name': name, 'current_price': current_price, 'change_percent': change_percent}
+
+    def overview(self) -> Dict:
+        """
+        현재 집계 결과 (변경이 없으면 이전 결과 재사용)
+
+        Returns:
+            {'regions': {지역: {...}}, 'total': {...}, 'top_gainers', 'top_losers', 'all_regions_up'}
+        """
+        with self._lock:
+            if self._overview is None:
+                regions = {region: totals.to_dict() for region, totals in self._regions.items()}
+                self._overview = {
+                    'regions': regions,
+                    'total': self._total.to_dict(),
+                    'top_gainers': [self._mover(symbol) for _, symbol in reversed(self._ranking[-self.top_movers:])],
+                    'top_losers': [self._mover(symbol) for _, symbol in self._ranking[:self.top_movers]],
+                    'all_regions_up': all(regions[region]['up'] for region in MARKET_REGIONS.values()),
+                }
+            return self._overview
+
+
+def compute_aggregates(summary: Dict) -> Dict:
+    """요약 데이터 하나의 집계 (수집 스크립트가 파일에 함께 저장)"""
+    aggregator = MarketAggregator()
+    aggregator.apply_summary(summary)
+    return aggregator.overview()
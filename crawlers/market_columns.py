@@ -0,0 +1,176 @@
+"""
+해외시장 지수 과거 데이터 열 저장소
+수집한 과거 데이터(global_point_monthly.json, global_point_YYYY-MM-DD.json)를
+필드별 .npy 배열(지수 × 날짜), 날짜 축, 심볼 표로 저장합니다.
+읽을 때는 배열을 메모리 맵으로 열어 지수 하나의 구간만 잘라 읽으므로
+기간이 길어져도 JSON 전체를 파싱하지 않습니다.
+
+파일 구성 (data/columns/):
+    meta.json            심볼 표(심볼, 이름, 통화)와 필드 목록, 행/열 수, 원본 파일 서명
+    dates.npy            날짜 축 (datetime64[D], 오름차순)
+    <필드>.npy            float64 [지수 수 × 날짜 수], 데이터가 없는 칸은 NaN
+
+numpy가 설치되어 있지 않으면 내보내기/읽기를 건너뜁니다.
+"""
+
+import logging
+import os
+from typing import Dict, Optional, Sequence
+
+from crawlers.market_history import MarketHistoryStore
+from utils.fast_json import dump_file, load_file
+
+# numpy가 설치되어 있으면 사용
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# 열 저장소 기본 위치
+COLUMNS_DIRNAME = "columns"
+
+# 열로 저장하는 숫자 필드
+COLUMN_FIELDS = ('current_price', 'previous_close', 'change', 'change_percent')
+
+
+def _save_array(path: str, array) -> None:
+    """배열을 임시 파일에 쓴 뒤 교체 (열려 있는 메모리 맵은 이전 파일을 계속 봄)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+def export_history_columns(data_dir: str = "data", out_dir: Optional[str] = None) -> Optional[str]:
+    """
+    수집 파일 전체를 열 저장소로 내보내기
+
+    Args:
+        data_dir: 수집 파일 폴더
+        out_dir: 저장 폴더 (기본: data_dir/columns)
+
+    Returns:
+        저장 폴더 경로 (numpy가 없거나 데이터가 없으면 None)
+    """
+    if np is None:
+        logger.warning("numpy is not installed; skipping column export")
+        return None
+
+    store = MarketHistoryStore(data_dir)
+    quotes = list(store.quotes())
+    source_signature = store.source_signature()
+    if not quotes:
+        return None
+
+    symbols = sorted({quote.symbol for quote in quotes})
+    dates = sorted({quote.date for quote in quotes})
+    symbol_row = {symbol: row for row, symbol in enumerate(symbols)}
+    date_col = {date: col for col, date in enumerate(dates)}
+
+    columns = {field: np.full((len(symbols), len(dates)), np.nan) for field in COLUMN_FIELDS}
+    names, currencies = {}, {}
+    for quote in quotes:
+        row, col = symbol_row[quote.symbol], date_col[quote.date]
+        for field in COLUMN_FIELDS:
+            columns[field][row, col] = getattr(quote, field)
+        names[quote.symbol] = quote.name
+        currencies[quote.symbol] = quote.currency
+
+    out_dir = out_dir or os.path.join(data_dir, COLUMNS_DIRNAME)
+    os.makedirs(out_dir, exist_ok=True)
+    _save_array(os.path.join(out_dir, "dates.npy"), np.array(dates, dtype='datetime64[D]'))
+    for field, array in columns.items():
+        _save_array(os.path.join(out_dir, f"{field}.npy"), array)
+
+    # 메타 파일을 마지막에 교체하므로 읽는 쪽은 메타 기준으로 배열 크기를 확인
+    dump_file({
+        'symbols': symbols,
+        'names': [names[symbol] for symbol in symbols],
+        'currencies': [currencies[symbol] for symbol in symbols],
+        'fields': list(COLUMN_FIELDS),
+        'rows': len(symbols),
+        'cols': len(dates),
+        'start_date': dates[0],
+        'end_date': dates[-1],
+        'source_signature': source_signature,
+    }, os.path.join(out_dir, "meta.json"), compact=False)
+    return out_dir
+
+
+class HistoryColumns:
+    """메모리 맵으로 여는 열 저장소 읽기 도구"""
+
+    def __init__(self, path: str = os.path.join("data", COLUMNS_DIRNAME)):
+        self.path = path
+        self.meta: Dict = {}
+        self.dates = None
+        self.arrays: Dict[str, "np.ndarray"] = {}
+        self._symbol_row: Dict[str, int] = {}
+        self._meta_mtime_ns = None
+
+    @property
+    def available(self) -> bool:
+        return np is not None and os.path.exists(os.path.join(self.path, "meta.json"))
+
+    def open(self) -> bool:
+        """
+        메타 파일이 바뀌었으면 다시 열기 (배열은 메모리 맵이므로 실제로 읽지 않음)
+
+        Returns:
+            열 저장소를 사용할 수 있는지 여부
+        """
+        if not self.available:
+            return False
+        meta_path = os.path.join(self.path, "meta.json")
+        mtime_ns = os.stat(meta_path).st_mtime_ns
+        if mtime_ns == self._meta_mtime_ns:
+            return True
+
+        meta = load_file(meta_path)
+        shape = (meta['rows'], meta['cols'])
+        dates = np.load(os.path.join(self.path, "dates.npy"), mmap_mode='r')
+        arrays = {
+            field: np.load(os.path.join(self.path, f"{field}.npy"), mmap_mode='r')
+            for field in meta['fields']
+        }
+        if dates.shape != (shape[1],) or any(array.shape != shape for array in arrays.values()):
+            # 내보내기 도중이면 이전 상태 유지
+            logger.warning(f"Column store shape mismatch in {self.path}; keeping previous view")
+            return bool(self.arrays)
+
+        self.meta, self.dates, self.arrays = meta, dates, arrays
+        self._symbol_row = {symbol: row for row, symbol in enumerate(meta['symbols'])}
+        self._meta_mtime_ns = mtime_ns
+        return True
+
+    def symbol_row(self, symbol: str) -> Optional[int]:
+        """심볼의 행 번호 (없으면 None, open() 이후 사용)"""
+        return self._symbol_row.get(symbol)
+
+    def date_range(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> slice:
+        """날짜 범위에 해당하는 열 구간 (이진 탐색)"""
+        start = np.searchsorted(self.dates, np.datetime64(date_from, 'D'), 'left') if date_from else 0
+        stop = np.searchsorted(self.dates, np.datetime64(date_to, 'D'), 'right') if date_to else len(self.dates)
+        return slice(int(start), int(stop))
+
+    def series(self, symbol: str, fields: Optional[Sequence[str]] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, dropna: bool = True) -> Optional[Dict[str, "np.ndarray"]]:
+        """
+        지수 하나의 기간별 필드 배열
+
+        Returns:
+            {'date': datetime64 배열, 필드: float 배열, ...} 또는 None(저장소/심볼 없음)
+        """
+        if not self.open() or symbol not in self._symbol_row:
+            return None
+        row = self._symbol_row[symbol]
+        window = self.date_range(date_from, date_to)
+        result = {'date': np.asarray(self.dates[window])}
+        for field in fields or self.meta['fields']:
+            result[field] = np.asarray(self.arrays[field][row, window])
+        if dropna:
+            mask = ~np.isnan(result[next(iter(fields or self.meta['fields']))])
+            result = {key: values[mask] for key, values in result.items()}
+        return result
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 import logging
 import time
 
+from crawlers.quote import Quote
+
 # 로거 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -55,6 +57,13 @@ class MarketIndexCrawler:
             'dax': 'DAX',
         }
 
+        # 지역별 지수 키
+        self.region_mapping = {
+            'us': ['dow', 'sp500', 'nasdaq'],
+            'asia': ['nikkei', 'hangseng', 'shanghai', 'shenzhen'],
+            'europe': ['stoxx50', 'ftse', 'dax']
+        }
+
     def get_index_data(self, symbol_key: str) -> Optional[Dict]:
         """
         특정 지수 데이터 조회
@@ -65,6 +74,19 @@ class MarketIndexCrawler:
         Returns:
             지수 데이터 딕셔너리 또는 None
         """
+        quote = self.fetch_quote(symbol_key)
+        return quote.to_dict() if quote else None
+
+    def fetch_quote(self, symbol_key: str) -> Optional[Quote]:
+        """
+        특정 지수 실시간 시세 조회
+
+        Args:
+            symbol_key: 지수 키 (예: 'dow', 'sp500', 'nasdaq')
+
+        Returns:
+            Quote 또는 None
+        """
         try:
             symbol = self.index_symbols.get(symbol_key)
             if not symbol:
@@ -92,17 +114,17 @@ class MarketIndexCrawler:
             change = current_price - previous_close
             change_percent = (change / previous_close * 100) if previous_close else 0
 
-            return {
-                'symbol': symbol_key,
-                'name': self.index_names.get(symbol_key, symbol_key),
-                'current_price': round(current_price, 2),
-                'previous_close': round(previous_close, 2),
-                'change': round(change, 2),
-                'change_percent': round(change_percent, 2),
-                'currency': meta.get('currency', 'USD'),
-                'market_state': meta.get('marketState', 'UNKNOWN'),
-                'timestamp': datetime.fromtimestamp(meta.get('regularMarketTime', 0)).isoformat(),
-            }
+            return Quote(
+                symbol_key,
+                self.index_names.get(symbol_key, symbol_key),
+                round(current_price, 2),
+                round(previous_close, 2),
+                round(change, 2),
+                round(change_percent, 2),
+                meta.get('currency', 'USD'),
+                meta.get('marketState', 'UNKNOWN'),
+                datetime.fromtimestamp(meta.get('regularMarketTime', 0)).isoformat(),
+            )
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error for {symbol_key}: {e}")
@@ -121,11 +143,19 @@ class MarketIndexCrawler:
         Returns:
             지수 데이터 리스트
         """
-        region_mapping = {
-            'us': ['dow', 'sp500', 'nasdaq'],
-            'asia': ['nikkei', 'hangseng', 'shanghai', 'shenzhen'],
-            'europe': ['stoxx50', 'ftse', 'dax']
-        }
+        return [quote.to_dict() for quote in self.get_all_quotes(region)]
+
+    def get_all_quotes(self, region: Optional[str] = None) -> List[Quote]:
+        """
+        전체 또는 특정 지역의 지수 시세 조회
+
+        Args:
+            region: 지역 필터 ('us', 'asia', 'europe') 또는 None (전체)
+
+        Returns:
+            Quote 리스트
+        """
+        region_mapping = self.region_mapping
 
         if region and region in region_mapping:
             symbols = region_mapping[region]
@@ -134,9 +164,9 @@ class MarketIndexCrawler:
 
         results = []
         for symbol_key in symbols:
-            data = self.get_index_data(symbol_key)
-            if data:
-                results.append(data)
+            quote = self.fetch_quote(symbol_key)
+            if quote:
+                results.append(quote)
 
         return results
 
@@ -170,6 +200,20 @@ class MarketIndexCrawler:
         Returns:
             지수 데이터 딕셔너리 또는 None
         """
+        quote = self.fetch_historical_quote(symbol_key, target_date)
+        return quote.to_dict() if quote else None
+
+    def fetch_historical_quote(self, symbol_key: str, target_date: datetime) -> Optional[Quote]:
+        """
+        특정 날짜의 지수 시세 조회
+
+        Args:
+            symbol_key: 지수 키 (예: 'dow', 'sp500', 'nasdaq')
+            target_date: 조회할 날짜
+
+        Returns:
+            Quote 또는 None
+        """
         try:
             symbol = self.index_symbols.get(symbol_key)
             if not symbol:
@@ -218,18 +262,18 @@ class MarketIndexCrawler:
             change = close_price - previous_close
             change_percent = (change / previous_close * 100) if previous_close else 0
 
-            return {
-                'symbol': symbol_key,
-                'name': self.index_names.get(symbol_key, symbol_key),
-                'current_price': round(close_price, 2),
-                'previous_close': round(previous_close, 2),
-                'change': round(change, 2),
-                'change_percent': round(change_percent, 2),
-                'currency': quote['meta'].get('currency', 'USD'),
-                'market_state': 'CLOSED',
-                'timestamp': target_date.isoformat(),
-                'date': target_date.strftime('%Y-%m-%d')
-            }
+            return Quote(
+                symbol_key,
+                self.index_names.get(symbol_key, symbol_key),
+                round(close_price, 2),
+                round(previous_close, 2),
+                round(change, 2),
+                round(change_percent, 2),
+                quote['meta'].get('currency', 'USD'),
+                'CLOSED',
+                target_date.isoformat(),
+                target_date.strftime('%Y-%m-%d'),
+            )
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error for {symbol_key} on {target_date.date()}: {e}")
@@ -246,13 +290,9 @@ class MarketIndexCrawler:
             target_date: 조회할 날짜
 
         Returns:
-            시장 요약 데이터
+            시장 요약 데이터 (지수는 Quote 리스트, 파일 저장 시 utils.fast_json이 dict로 변환)
         """
-        region_mapping = {
-            'us': ['dow', 'sp500', 'nasdaq'],
-            'asia': ['nikkei', 'hangseng', 'shanghai', 'shenzhen'],
-            'europe': ['stoxx50', 'ftse', 'dax']
-        }
+        region_mapping = self.region_mapping
 
         us_indices = []
         asia_indices = []
@@ -260,23 +300,23 @@ class MarketIndexCrawler:
 
         # 미국 지수
         for symbol_key in region_mapping['us']:
-            data = self.get_historical_data(symbol_key, target_date)
-            if data:
-                us_indices.append(data)
+            quote = self.fetch_historical_quote(symbol_key, target_date)
+            if quote:
+                us_indices.append(quote)
             time.sleep(0.1)  # API 요청 간격
 
         # 아시아 지수
         for symbol_key in region_mapping['asia']:
-            data = self.get_historical_data(symbol_key, target_date)
-            if data:
-                asia_indices.append(data)
+            quote = self.fetch_historical_quote(symbol_key, target_date)
+            if quote:
+                asia_indices.append(quote)
             time.sleep(0.1)
 
         # 유럽 지수
         for symbol_key in region_mapping['europe']:
-            data = self.get_historical_data(symbol_key, target_date)
-            if data:
-                europe_indices.append(data)
+            quote = self.fetch_historical_quote(symbol_key, target_date)
+            if quote:
+                europe_indices.append(quote)
             time.sleep(0.1)
 
         return {
@@ -0,0 +1,103 @@
+"""
+해외시장 지수 과거 데이터 대량 내보내기
+저장된 과거 데이터를 행 단위 제너레이터로 읽어 NDJSON/CSV 조각으로 변환합니다.
+열 저장소(.npy 메모리 맵)가 최신이면 지수별로 날짜 구간씩 잘라 읽고,
+없거나 수집 파일보다 오래되었으면 JSON 기반 저장소에서 지수 하나씩 읽으므로 기간이 길어도 메모리 사용량이 일정합니다.
+행은 지수 순, 같은 지수 안에서는 날짜 순으로 나옵니다.
+"""
+
+import csv
+import io
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from crawlers.market_columns import HistoryColumns
+from crawlers.market_history import MarketHistoryStore
+from utils.fast_json import dumps
+
+# 내보내기 필드 (CSV 열 순서)
+EXPORT_FIELDS = ('date', 'symbol', 'name', 'current_price', 'previous_close', 'change', 'change_percent', 'currency')
+
+# 열 저장소에서 한 번에 잘라 읽는 날짜 수
+DATE_CHUNK = 1024
+
+# 응답 조각 하나에 담는 행 수
+ROWS_PER_CHUNK = 2000
+
+
+def _column_rows(columns: HistoryColumns, symbol: str, date_from: Optional[str], date_to: Optional[str]) -> Iterator[Dict]:
+    """열 저장소에서 지수 하나의 행을 날짜 구간씩 읽음"""
+    row = columns.symbol_row(symbol)
+    name, currency = columns.meta['names'][row], columns.meta['currencies'][row]
+    window = columns.date_range(date_from, date_to)
+    for start in range(window.start, window.stop, DATE_CHUNK):
+        part = slice(start, min(start + DATE_CHUNK, window.stop))
+        dates = columns.dates[part].astype(str).tolist()
+        values = [columns.arrays[field][row, part].tolist()
+                  for field in ('current_price', 'previous_close', 'change', 'change_percent')]
+        for i, date in enumerate(dates):
+            price = values[0][i]
+            if price != price:  # NaN: 해당 날짜 데이터 없음
+                continue
+            yield {
+                'date': date, 'symbol': symbol, 'name': name,
+                'current_price': price, 'previous_close': values[1][i],
+                'change': values[2][i], 'change_percent': values[3][i],
+                'currency': currency,
+            }
+
+
+def iter_history_rows(symbols: Iterable[str], date_from: Optional[str] = None, date_to: Optional[str] = None,
+                      columns: Optional[HistoryColumns] = None,
+                      store: Optional[MarketHistoryStore] = None) -> Iterator[Dict]:
+    """
+    지수 목록의 과거 데이터를 행 단위로 반환
+
+    열 저장소가 지금 수집 파일들보다 먼저 만들어졌으면(원본 파일 서명이 다르면) 저장소를 사용하고,
+    API로 새로 조회한 데이터가 있는 지수도 저장소에서 읽어 /market/history와 같은 결과를 냅니다.
+
+    Args:
+        symbols: 내보낼 지수 목록
+        date_from / date_to: 날짜 범위 (YYYY-MM-DD, 생략 시 전체)
+        columns: 열 저장소 (사용할 수 있으면 우선 사용)
+        store: 열 저장소가 없거나 오래되었을 때 사용할 JSON 기반 저장소
+    """
+    use_columns = columns is not None and columns.open()
+    if use_columns and store is not None:
+        use_columns = columns.meta.get('source_signature') == store.source_signature()
+    for symbol in symbols:
+        if use_columns and not (store is not None and store.has_fetched(symbol)):
+            if columns.symbol_row(symbol) is not None:
+                yield from _column_rows(columns, symbol, date_from, date_to)
+        elif store is not None:
+            for quote in store.history(symbol, date_from, date_to):
+                yield {field: getattr(quote, field) for field in EXPORT_FIELDS}
+
+
+def ndjson_chunks(rows: Iterable[Dict], rows_per_chunk: int = ROWS_PER_CHUNK) -> Iterator[bytes]:
+    """행을 NDJSON 조각(바이트)으로 묶음"""
+    buffer: List[bytes] = []
+    for row in rows:
+        buffer.append(dumps(row))
+        if len(buffer) >= rows_per_chunk:
+            yield b"\n".join(buffer) + b"\n"
+            buffer = []
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+def csv_chunks(rows: Iterable[Dict], rows_per_chunk: int = ROWS_PER_CHUNK) -> Iterator[bytes]:
+    """행을 헤더가 있는 CSV 조각(UTF-8 바이트)으로 묶음"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count >= rows_per_chunk:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
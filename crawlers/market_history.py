@@ -0,0 +1,143 @@
+"""
+해외시장 지수 과거 데이터 저장소
+수집 스크립트가 만든 JSON 파일(global_point_monthly.json, global_point_YYYY-MM-DD.json)을
+(지수, 날짜) 단위로 색인하고, API에서 새로 조회한 과거 데이터도 메모리에 보관합니다.
+레코드는 Quote로 보관하며, 파일이 바뀌면 다음 조회 때 다시 색인합니다.
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from crawlers.quote import Quote
+from utils.fast_json import load_file
+
+logger = logging.getLogger(__name__)
+
+# 월간 수집 파일 이름
+MONTHLY_FILENAME = "global_point_monthly.json"
+
+# 시장 구분 키
+MARKET_KEYS = ('us_market', 'asia_market', 'europe_market')
+
+
+class MarketHistoryStore:
+    """(지수, 날짜) → 지수 데이터 저장소"""
+
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = data_dir
+        self._records: Dict[Tuple[str, str], Quote] = {}
+        self._fetched: Dict[Tuple[str, str], Quote] = {}
+        self._closed_dates = set()
+        self._signature = None
+        self._sources: Tuple = ()
+        self._lock = threading.Lock()
+
+    def _file_signature(self) -> Tuple:
+        """색인 대상 파일들의 (경로, 수정 시각, 크기) 목록"""
+        paths = glob.glob(os.path.join(self.data_dir, "global_point_*.json"))
+        signature = []
+        for path in sorted(paths):
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                continue
+        return tuple(signature)
+
+    def _load_file(self, path: str, records: Dict[Tuple[str, str], Quote], closed_dates: set) -> bool:
+        """파일 하나의 지수 데이터를 색인에 추가하고 색인했는지 반환 (날짜가 없는 실시간 요약 파일은 제외)"""
+        try:
+            content = load_file(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"History file load error {path}: {e}")
+            return False
+
+        if os.path.basename(path) == MONTHLY_FILENAME:
+            days = content.get('data', [])
+            # 수집 결과 데이터가 없던 날짜(주말/휴일)는 외부 조회 없이 바로 응답
+            closed_dates.update(day['date'] for day in days if not day.get('has_data') and day.get('date'))
+        elif content.get('target_date'):
+            days = [{**content, 'date': content['target_date']}]
+        else:
+            return False
+
+        for day in days:
+            for market_key in MARKET_KEYS:
+                for record in day.get(market_key, []):
+                    date = record.get('date') or day.get('date')
+                    if record.get('symbol') and date:
+                        records[(record['symbol'], date)] = Quote.from_dict({**record, 'date': date})
+        return True
+
+    def refresh(self) -> None:
+        """파일이 바뀌었으면 다시 색인"""
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        with self._lock:
+            if signature == self._signature:
+                return
+            records, closed_dates = {}, set()
+            sources = tuple(entry for entry in signature if self._load_file(entry[0], records, closed_dates))
+            self._records = records
+            self._closed_dates = closed_dates
+            self._sources = sources
+            self._signature = signature
+
+    def source_signature(self) -> str:
+        """
+        실제로 색인한 파일 목록(파일명, 수정 시각, 크기)의 해시
+
+        열 저장소가 지금 색인과 같은 파일들로 만들어졌는지 비교할 때 사용합니다.
+        과거 데이터가 없는 실시간 요약 파일은 제외하므로 실시간 수집만으로는 바뀌지 않습니다.
+        """
+        self.refresh()
+        entries = [(os.path.basename(path), mtime_ns, size) for path, mtime_ns, size in self._sources]
+        return hashlib.sha1(repr(entries).encode('utf-8')).hexdigest()
+
+    def has_fetched(self, symbol: str) -> bool:
+        """API로 새로 조회해 보관한 데이터가 있는 지수인지 (파일에는 없는 날짜)"""
+        return any(s == symbol for s, _ in self._fetched)
+
+    def get(self, symbol: str, date: str) -> Tuple[bool, Optional[Quote]]:
+        """
+        저장된 지수 데이터 조회 (여러 건을 조회할 때는 refresh()를 먼저 한 번 호출)
+
+        Returns:
+            (저장소에 있는지, Quote 또는 None(휴장일로 확인된 날짜))
+        """
+        key = (symbol, date)
+        if key in self._records:
+            return True, self._records[key]
+        if key in self._fetched:
+            return True, self._fetched[key]
+        if date in self._closed_dates:
+            return True, None
+        return False, None
+
+    def remember(self, symbol: str, date: str, quote: Quote) -> None:
+        """API에서 새로 조회한 과거 데이터 보관"""
+        self._fetched[(symbol, date)] = quote
+
+    def quotes(self) -> Iterator[Quote]:
+        """파일에서 색인한 전체 레코드 (API로 새로 조회한 데이터는 제외)"""
+        self.refresh()
+        return iter(self._records.values())
+
+    def history(self, symbol: str, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Quote]:
+        """지수 하나의 저장된 데이터를 날짜순으로 반환"""
+        self.refresh()
+        merged = {date: record for (s, date), record in self._fetched.items() if s == symbol}
+        merged.update({date: record for (s, date), record in self._records.items() if s == symbol})
+        return [
+            merged[date] for date in sorted(merged)
+            if (not date_from or date >= date_from) and (not date_to or date <= date_to)
+        ]
+
+
+# 싱글톤 인스턴스
+history_store = MarketHistoryStore()
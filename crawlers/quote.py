@@ -0,0 +1,66 @@
+"""
+지수 시세 레코드
+지수 하나의 시세를 __slots__ 객체로 보관합니다. 심볼/이름/통화/시장 상태/날짜처럼
+수많은 레코드가 같은 값을 갖는 문자열은 intern하여 한 벌만 남깁니다.
+크롤러와 저장소 내부에서는 Quote를 쓰고, API 응답과 파일 저장 시점에만 dict로 바꿉니다.
+"""
+
+import sys
+from typing import Dict, Optional
+
+# 레코드 필드 (dict 변환 시 출력 순서)
+QUOTE_FIELDS = (
+    'symbol', 'name', 'current_price', 'previous_close', 'change', 'change_percent',
+    'currency', 'market_state', 'timestamp', 'date',
+)
+
+
+def _intern(value):
+    """문자열이면 intern (None 등은 그대로)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Quote:
+    """지수 시세 하나 (실시간 시세는 date가 None)"""
+
+    __slots__ = QUOTE_FIELDS
+
+    def __init__(self, symbol: str, name: str, current_price: float, previous_close: float,
+                 change: float, change_percent: float, currency: str, market_state: str,
+                 timestamp: str, date: Optional[str] = None):
+        self.symbol = _intern(symbol)
+        self.name = _intern(name)
+        self.current_price = current_price
+        self.previous_close = previous_close
+        self.change = change
+        self.change_percent = change_percent
+        self.currency = _intern(currency)
+        self.market_state = _intern(market_state)
+        self.timestamp = _intern(timestamp)
+        self.date = _intern(date)
+
+    @classmethod
+    def from_dict(cls, record: Dict) -> "Quote":
+        """저장된 dict 레코드를 Quote로 변환"""
+        return cls(
+            record['symbol'], record.get('name', record['symbol']),
+            record.get('current_price', 0), record.get('previous_close', 0),
+            record.get('change', 0), record.get('change_percent', 0),
+            record.get('currency', 'USD'), record.get('market_state', 'UNKNOWN'),
+            record.get('timestamp'), record.get('date'),
+        )
+
+    def to_dict(self) -> Dict:
+        """API 응답/파일 저장용 dict (date가 없으면 키도 생략)"""
+        record = {field: getattr(self, field) for field in QUOTE_FIELDS}
+        if record['date'] is None:
+            del record['date']
+        return record
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Quote):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in QUOTE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Quote({self.symbol!r}, {self.current_price!r}, date={self.date!r})"
@@ -3,20 +3,79 @@
 실행 시 자동으로 해외시장 지수를 수집하여 날짜별 JSON 파일로 저장합니다.
 """
 
-from fastapi import FastAPI, HTTPException
-from typing import Optional
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import os
 from crawlers.market_crawler import crawler
+from crawlers.market_aggregates import MarketAggregator
+from crawlers.market_columns import HistoryColumns
+from crawlers.market_export import csv_chunks, iter_history_rows, ndjson_chunks
+from crawlers.market_history import history_store
+from news.search_index import NewsSearchIndex
+from news.trends import TrendCounter
+from utils.data_repository import get_data_repository
+from utils.fast_json import dump_file, dumps
+from utils.projection import FORMATS, parse_fields, project_payload, project_records
+from utils.snapshot_cache import Snapshot, SnapshotCache
+from utils.stream_hub import DeltaStreamHub
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson(없으면 표준 json)으로 본문을 만드는 JSON 응답"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="해외시장 지수 크롤링 API",
     description="해외 주요 시장 지수를 실시간으로 조회하고 수집하는 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
+# 해외시장 응답 스냅샷 (TTL 동안 재사용, ETag와 압축본 포함)
+MARKET_SNAPSHOT_TTL = float(os.getenv("MARKET_SNAPSHOT_TTL", "30"))
+market_snapshots = SnapshotCache(ttl=MARKET_SNAPSHOT_TTL)
+
+# 시장 집계 (새 시세가 들어올 때 바뀐 지수만 반영, /market/overview는 미리 만든 스냅샷만 응답)
+market_aggregator = MarketAggregator()
+
+# 서버 시작 시 이 시간(초) 안에 저장된 오늘 수집 파일이 있으면 다시 수집하지 않고 사용
+MARKET_WARM_START_MAX_AGE = float(os.getenv("MARKET_WARM_START_MAX_AGE", "600"))
+data_repository = get_data_repository("data")
+
+# 실시간 스트림 조회 주기와 연결 유지용 하트비트 간격 (초)
+MARKET_STREAM_INTERVAL = float(os.getenv("MARKET_STREAM_INTERVAL", "5"))
+MARKET_STREAM_HEARTBEAT = 15
+
+# 일괄 조회 시 동시에 보낼 최대 외부 요청 수
+MARKET_BATCH_WORKERS = 8
+MARKET_BATCH_MAX_ITEMS = 500
+batch_executor = ThreadPoolExecutor(max_workers=MARKET_BATCH_WORKERS)
+
+# 과거 데이터 열 저장소 (수집 스크립트가 갱신, 내보내기에서 메모리 맵으로 사용)
+history_columns = HistoryColumns()
+
+# 내보내기 형식별 (조각 생성 함수, 미디어 타입, 확장자)
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_chunks, "application/x-ndjson", "ndjson"),
+    "csv": (csv_chunks, "text/csv; charset=utf-8", "csv"),
+}
+
+# 뉴스 검색 색인 (data/archive에 새 기사가 쌓이면 조회 시 이어서 색인)
+news_search_index = NewsSearchIndex()
+
+# 뉴스 키워드 트렌드 집계표 (조회 시 새 기사만 이어서 집계)
+news_trends = TrendCounter()
+
 
 # ========================================
 # 데이터 저장 함수
@@ -32,13 +91,12 @@ def save_market_data_to_json():
         today = datetime.now().strftime('%Y-%m-%d')
         filename = f'data/global_point_{today}.json'
 
-        # 시장 데이터 수집
+        # 시장 데이터 수집 (집계 포함)
         print("📊 해외시장 지수 데이터 수집 중...")
-        market_data = crawler.get_market_summary()
+        market_data = build_summary_payload()
 
-        # JSON 파일로 저장
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(market_data, f, ensure_ascii=False, indent=2)
+        # JSON 파일로 저장 (JSON_COMPACT=1이면 공백 없이)
+        dump_file(market_data, filename)
 
         print(f"✅ 해외시장 지수 데이터 저장 완료: {filename}")
         return filename
@@ -48,6 +106,176 @@ def save_market_data_to_json():
         return None
 
 
+def warm_start_from_file() -> Optional[str]:
+    """최근에 저장된 오늘 수집 파일이 있으면 요약 스냅샷으로 채우고 파일 경로 반환"""
+    latest = data_repository.latest("market_daily")
+    today = datetime.now().strftime('%Y-%m-%d')
+    if latest is None or latest.date != today or latest.age() > MARKET_WARM_START_MAX_AGE:
+        return None
+    market_data = data_repository.load(latest)
+    if not market_data.get('total_count'):
+        return None
+    market_snapshots.prime("summary", market_data, created_at=latest.mtime_ns / 1e9)
+    market_aggregator.apply_summary(market_data)
+    publish_overview(market_data.get("update_time"), created_at=latest.mtime_ns / 1e9)
+    return latest.path
+
+
+def publish_overview(update_time: Optional[str] = None, created_at: Optional[float] = None) -> Snapshot:
+    """현재 집계 결과로 /market/overview 스냅샷 갱신 (내용이 같으면 유효 시간만 연장)"""
+    payload = {**market_aggregator.overview(), "update_time": update_time or datetime.now().isoformat()}
+    return market_snapshots.prime("overview", payload, created_at=created_at)
+
+
+def build_summary_payload() -> dict:
+    """/market/summary 응답 본문 생성 (시장 집계를 이어서 계산해 함께 담음)"""
+    summary = crawler.get_market_summary()
+    if summary["total_count"] > 0:
+        market_aggregator.apply_summary(summary)
+        summary["aggregates"] = market_aggregator.overview()
+        publish_overview(summary["update_time"])
+    return summary
+
+
+def get_summary_snapshot() -> Snapshot:
+    """시장 요약 스냅샷 (TTL 동안 재사용)"""
+    return market_snapshots.get("summary", build_summary_payload, lambda p: p["total_count"] > 0)
+
+
+def build_indices_payload(region: Optional[str] = None) -> dict:
+    """/market/indices 응답 본문 생성 (전체/지역 조회 결과도 시장 집계에 반영)"""
+    indices = crawler.get_all_indices(region)
+    regions = [region] if region else list(crawler.region_mapping)
+    changed = 0
+    for region_name in regions:
+        symbols = set(crawler.region_mapping[region_name])
+        # 조회가 성공했으면 지역 전체 목록으로 보고, 빠진 지수는 집계에서 뺌
+        changed += market_aggregator.apply(
+            region_name, [record for record in indices if record["symbol"] in symbols], full=bool(indices)
+        )
+    if changed or market_snapshots.peek("overview") is not None:
+        publish_overview()
+    return {
+        "region": region or "all",
+        "count": len(indices),
+        "indices": indices,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+# 시장 집계 백그라운드 갱신 작업 (한 번에 하나만 실행)
+overview_refresh_task: Optional[asyncio.Task] = None
+
+
+async def refresh_overview() -> None:
+    """요약 스냅샷을 갱신해 시장 집계 스냅샷도 함께 갱신"""
+    try:
+        await run_in_threadpool(get_summary_snapshot)
+    except Exception as e:
+        print(f"⚠️ 시장 집계 갱신 실패: {e}")
+
+
+def schedule_overview_refresh() -> None:
+    """시장 집계 갱신을 백그라운드로 시작 (이미 실행 중이면 무시)"""
+    global overview_refresh_task
+    if overview_refresh_task is None or overview_refresh_task.done():
+        overview_refresh_task = asyncio.create_task(refresh_overview())
+
+
+def get_indices_snapshot(region: Optional[str] = None) -> Snapshot:
+    """지역별 지수 스냅샷 (TTL 동안 재사용)"""
+    return market_snapshots.get(f"indices:{region or 'all'}", lambda: build_indices_payload(region), lambda p: p["count"] > 0)
+
+
+def fetch_stream_indices() -> list:
+    """
+    스트림 생산자용 전체 지수 조회
+
+    폴링 스냅샷(TTL 30초)을 읽으면 변경분이 TTL마다만 나가므로 주기마다 새로 가져오고,
+    가져온 결과로 전체 지수 스냅샷도 갱신해 폴링 요청과 같은 데이터를 공유합니다.
+    """
+    payload = build_indices_payload()
+    if payload["count"] > 0:
+        market_snapshots.prime("indices:all", payload)
+    return payload["indices"]
+
+
+# 전체 지수 변경분 스트림 (구독자가 있는 동안 MARKET_STREAM_INTERVAL마다 조회하는 단일 생산자)
+market_stream = DeltaStreamHub(
+    fetch_stream_indices,
+    key="symbol",
+    interval=MARKET_STREAM_INTERVAL,
+)
+
+
+def snapshot_response(request: Request, snapshot: Snapshot) -> Response:
+    """스냅샷을 ETag/Cache-Control과 함께 응답 (변경이 없으면 304, 큰 본문은 압축본 사용)"""
+    encoding = snapshot.choose_encoding(request.headers.get("accept-encoding"))
+    headers = {
+        "ETag": snapshot.etag_for(encoding),
+        "Cache-Control": f"public, max-age={market_snapshots.remaining_ttl(snapshot)}",
+        "Vary": "Accept-Encoding",
+    }
+    if snapshot.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=snapshot.encoded(encoding), media_type="application/json", headers=headers)
+
+
+def parse_projection(fields: Optional[str], format: str) -> Optional[List[str]]:
+    """fields/format 쿼리 검증 (잘못된 값은 400)"""
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail="format은 'full' 또는 'compact'여야 합니다.")
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def project_snapshot(snapshot: Snapshot, list_keys: tuple, fields: Optional[List[str]], format: str) -> Snapshot:
+    """요청한 필드/형식의 스냅샷 변형 (기본 요청이면 원본 그대로)"""
+    if fields is None and format == "full":
+        return snapshot
+    compact = format == "compact"
+    return snapshot.variant(
+        (tuple(fields or ()), format),
+        lambda payload: project_payload(payload, list_keys, fields, compact)
+    )
+
+
+class BatchItem(BaseModel):
+    """일괄 조회 항목 (date를 생략하거나 "live"로 주면 실시간 조회)"""
+    symbol: str
+    date: Optional[str] = None
+
+
+class BatchRequest(BaseModel):
+    """일괄 조회 요청"""
+    requests: List[BatchItem] = Field(..., min_length=1, max_length=MARKET_BATCH_MAX_ITEMS)
+
+
+def fetch_live_index(symbol: str) -> Optional[dict]:
+    """실시간 지수 조회 (유효한 전체 지수 스냅샷이 있으면 외부 요청 없이 사용)"""
+    snapshot = market_snapshots.peek("indices:all")
+    if snapshot is not None and snapshot.age() < market_snapshots.ttl:
+        for record in snapshot.payload["indices"]:
+            if record["symbol"] == symbol:
+                return record
+    return market_snapshots.get(f"index:{symbol}", lambda: crawler.get_index_data(symbol) or {}, bool).payload or None
+
+
+def fetch_historical_index(symbol: str, date: str) -> Optional[dict]:
+    """과거 지수를 외부에서 조회하고 지난 날짜의 결과는 저장소에 보관"""
+    quote = crawler.fetch_historical_quote(symbol, datetime.strptime(date, '%Y-%m-%d'))
+    if quote is None:
+        return None
+    if date < datetime.now().strftime('%Y-%m-%d'):
+        history_store.remember(symbol, date, quote)
+    return quote.to_dict()
+
+
 # ========================================
 # FastAPI 이벤트 핸들러
 # ========================================
@@ -58,7 +286,11 @@ async def startup_event():
     print("\n" + "="*60)
     print("🚀 해외시장 지수 크롤링 API 서버 시작")
     print("="*60)
-    save_market_data_to_json()
+    warm_file = warm_start_from_file()
+    if warm_file:
+        print(f"♻️ 최근 수집 파일 사용 (재수집 생략): {warm_file}")
+    else:
+        save_market_data_to_json()
     print("="*60)
     print("✅ 서버 준비 완료!")
     print("📖 API 문서: http://localhost:8000/docs")
@@ -82,7 +314,15 @@ async def root():
             "지역별 지수 조회": "GET /market/indices?region={us|asia|europe}",
             "특정 지수 조회": "GET /market/index/{symbol}",
             "시장 요약": "GET /market/summary",
-            "데이터 수집 및 저장": "POST /market/collect"
+            "시장 집계": "GET /market/overview",
+            "실시간 스트림": "GET /market/stream (SSE), WS /market/stream/ws",
+            "일괄 조회": "POST /market/batch",
+            "과거 지수 조회": "GET /market/history/{symbol}?from={YYYY-MM-DD}&to={YYYY-MM-DD}",
+            "과거 지수 내보내기": "GET /market/export?from={YYYY-MM-DD}&to={YYYY-MM-DD}&symbols={dow,sp500}&format={ndjson|csv}",
+            "데이터 수집 및 저장": "POST /market/collect",
+            "뉴스 검색": "GET /news/search?q={검색어}&from={YYYY-MM-DD}&to={YYYY-MM-DD}",
+            "최신 뉴스": "GET /news/latest",
+            "뉴스 키워드 트렌드": "GET /news/trends?date={YYYY-MM-DD}&window={일수}"
         },
         "supported_indices": {
             "미국": ["dow", "sp500", "nasdaq"],
@@ -93,11 +333,18 @@ async def root():
 
 
 @app.get("/market/indices", tags=["해외시장 지수"])
-async def get_market_indices(region: Optional[str] = None):
+async def get_market_indices(
+    request: Request,
+    region: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분, 예: symbol,current_price,change_percent)"),
+    format: str = Query("full", description="응답 형식 (full: 레코드 리스트, compact: 필드별 배열)")
+):
     """
     해외시장 지수를 조회합니다.
 
     - **region**: 지역 필터 (us, asia, europe) - 생략 시 전체 조회
+    - **fields**: 반환할 필드만 선택 (생략 시 전체 필드)
+    - **format**: compact이면 indices를 {필드: [값, ...]} 열 배열로 반환
 
     **지원 지수:**
     - 미국: 다우존스, S&P 500, 나스닥
@@ -110,21 +357,17 @@ async def get_market_indices(region: Optional[str] = None):
                 status_code=400,
                 detail="region은 'us', 'asia', 'europe' 중 하나여야 합니다."
             )
+        selected = parse_projection(fields, format)
 
-        indices = crawler.get_all_indices(region)
+        snapshot = await run_in_threadpool(get_indices_snapshot, region)
 
-        if not indices:
+        if not snapshot.payload["indices"]:
             raise HTTPException(
                 status_code=503,
                 detail="지수 데이터를 가져올 수 없습니다. 잠시 후 다시 시도해주세요."
             )
 
-        return {
-            "region": region or "all",
-            "count": len(indices),
-            "indices": indices,
-            "timestamp": datetime.now().isoformat()
-        }
+        return snapshot_response(request, project_snapshot(snapshot, ("indices",), selected, format))
 
     except HTTPException:
         raise
@@ -133,7 +376,7 @@ async def get_market_indices(region: Optional[str] = None):
 
 
 @app.get("/market/index/{symbol}", tags=["해외시장 지수"])
-async def get_market_index(symbol: str):
+async def get_market_index(request: Request, symbol: str):
     """
     특정 해외시장 지수를 조회합니다.
 
@@ -152,15 +395,24 @@ async def get_market_index(symbol: str):
     - dax: DAX
     """
     try:
-        data = crawler.get_index_data(symbol)
+        # 지원하지 않는 심볼은 캐시 키(와 키별 잠금)를 만들기 전에 거절
+        if symbol not in crawler.index_symbols:
+            raise HTTPException(
+                status_code=404,
+                detail=f"지수 '{symbol}'을(를) 찾을 수 없습니다. 지원되는 심볼: {', '.join(crawler.index_symbols)}"
+            )
 
-        if not data:
+        snapshot = await run_in_threadpool(
+            market_snapshots.get, f"index:{symbol}", lambda: crawler.get_index_data(symbol) or {}, bool
+        )
+
+        if not snapshot.payload:
             raise HTTPException(
                 status_code=404,
                 detail=f"지수 '{symbol}'을(를) 찾을 수 없습니다. 지원되는 심볼: dow, sp500, nasdaq, nikkei, hangseng, shanghai, shenzhen, stoxx50, ftse, dax"
             )
 
-        return data
+        return snapshot_response(request, snapshot)
 
     except HTTPException:
         raise
@@ -169,22 +421,34 @@ async def get_market_index(symbol: str):
 
 
 @app.get("/market/summary", tags=["해외시장 지수"])
-async def get_market_summary():
+async def get_market_summary(
+    request: Request,
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분)"),
+    format: str = Query("full", description="응답 형식 (full 또는 compact)")
+):
     """
     전체 시장 요약 정보를 조회합니다.
 
     미국, 아시아, 유럽 주요 지수를 한번에 조회할 수 있습니다.
+    같은 스냅샷을 TTL 동안 재사용하며, If-None-Match가 현재 ETag와 같으면 304를 반환합니다.
+
+    - **fields**: 반환할 필드만 선택 (생략 시 전체 필드)
+    - **format**: compact이면 시장별 지수를 {필드: [값, ...]} 열 배열로 반환
     """
     try:
-        summary = crawler.get_market_summary()
+        selected = parse_projection(fields, format)
+        snapshot = await run_in_threadpool(get_summary_snapshot)
 
-        if summary['total_count'] == 0:
+        if snapshot.payload['total_count'] == 0:
             raise HTTPException(
                 status_code=503,
                 detail="시장 데이터를 가져올 수 없습니다. 잠시 후 다시 시도해주세요."
             )
 
-        return summary
+        return snapshot_response(
+            request,
+            project_snapshot(snapshot, ("us_market", "asia_market", "europe_market"), selected, format)
+        )
 
     except HTTPException:
         raise
@@ -192,6 +456,257 @@ async def get_market_summary():
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 
+@app.get("/market/overview", tags=["해외시장 지수"])
+async def get_market_overview(request: Request):
+    """
+    시장 집계를 조회합니다.
+
+    지역별 평균 등락률, 상승/하락/보합 지수 수, 상위 상승/하락 지수, 전 지역 상승 여부를 반환합니다.
+    집계는 시세를 새로 가져올 때(요약/지수 조회, 실시간 스트림, 수집) 바뀐 지수만 반영해 미리 만들어 두며,
+    요청 시에는 저장된 스냅샷만 응답합니다. 집계가 오래되었으면 마지막 집계를 응답하고 갱신은 백그라운드에서 진행합니다.
+    """
+    try:
+        snapshot = market_snapshots.peek("overview")
+        if snapshot is None or snapshot.age() >= market_snapshots.ttl:
+            # 요청은 외부 조회를 기다리지 않음 (갱신이 끝나면 다음 요청부터 새 집계)
+            schedule_overview_refresh()
+
+        if snapshot is None:
+            raise HTTPException(
+                status_code=503,
+                detail="시장 데이터를 가져올 수 없습니다. 잠시 후 다시 시도해주세요."
+            )
+
+        return snapshot_response(request, snapshot)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@app.post("/market/batch", tags=["해외시장 지수"])
+async def get_market_batch(batch: BatchRequest):
+    """
+    여러 지수·날짜를 한 번에 조회합니다.
+
+    - **requests**: [{"symbol": "dow", "date": "2026-07-09"}, {"symbol": "nasdaq"}, ...]
+      (date를 생략하거나 "live"로 주면 실시간 조회)
+
+    같은 요청은 한 번만 처리하고, 저장된 과거 데이터와 캐시를 먼저 사용하며,
+    나머지만 동시에 외부에서 조회합니다. 결과는 요청 순서대로 반환됩니다.
+    """
+    try:
+        await run_in_threadpool(history_store.refresh)
+        keys = []
+        results = {}
+        stats = {"requested": len(batch.requests), "unique": 0, "stored": 0, "fetched": 0, "failed": 0}
+
+        for item in batch.requests:
+            symbol = item.symbol.strip().lower()
+            date = (item.date or "live").strip()
+            key = (symbol, date)
+            keys.append(key)
+            if key in results:
+                continue
+            if symbol not in crawler.index_symbols:
+                results[key] = {"status": "error", "error": f"지원하지 않는 심볼입니다: {symbol}"}
+                continue
+            if date != "live":
+                try:
+                    datetime.strptime(date, '%Y-%m-%d')
+                except ValueError:
+                    results[key] = {"status": "error", "error": "date는 YYYY-MM-DD 형식 또는 live여야 합니다."}
+                    continue
+                found, quote = history_store.get(symbol, date)
+                if found:
+                    stats["stored"] += 1
+                    results[key] = {"status": "ok", "data": quote.to_dict()} if quote else {"status": "no_data"}
+                    continue
+            results[key] = None
+
+        # 저장소에 없는 항목만 동시에 외부 조회
+        pending = [key for key, result in results.items() if result is None]
+        loop = asyncio.get_running_loop()
+        fetched = await asyncio.gather(*(
+            loop.run_in_executor(
+                batch_executor,
+                fetch_live_index if date == "live" else fetch_historical_index,
+                *((symbol,) if date == "live" else (symbol, date))
+            )
+            for symbol, date in pending
+        ), return_exceptions=True)
+
+        for key, record in zip(pending, fetched):
+            if isinstance(record, Exception):
+                stats["failed"] += 1
+                results[key] = {"status": "error", "error": str(record)}
+            else:
+                stats["fetched"] += 1
+                results[key] = {"status": "ok", "data": record} if record else {"status": "no_data"}
+
+        stats["unique"] = len(results)
+        return {
+            "count": len(keys),
+            "stats": stats,
+            "results": [{"symbol": symbol, "date": date, **results[(symbol, date)]} for symbol, date in keys],
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@app.get("/market/history/{symbol}", tags=["해외시장 지수"])
+async def get_market_history(
+    symbol: str,
+    date_from: Optional[str] = Query(None, alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="종료 날짜 (YYYY-MM-DD)"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분, 예: date,current_price)"),
+    format: str = Query("full", description="응답 형식 (full 또는 compact)")
+):
+    """
+    저장된 과거 지수 데이터를 날짜순으로 조회합니다.
+
+    - **symbol**: 지수 심볼
+    - **from** / **to**: 날짜 범위 (생략 시 저장된 전체 기간)
+    - **fields**: 반환할 필드만 선택 (생략 시 전체 필드)
+    - **format**: compact이면 history를 {필드: [값, ...]} 열 배열로 반환
+    """
+    try:
+        if symbol not in crawler.index_symbols:
+            raise HTTPException(status_code=404, detail=f"지수 '{symbol}'을(를) 찾을 수 없습니다.")
+        date_from = _validate_date(date_from, "from")
+        date_to = _validate_date(date_to, "to")
+        selected = parse_projection(fields, format)
+
+        quotes = await run_in_threadpool(history_store.history, symbol, date_from, date_to)
+        history = [quote.to_dict() for quote in quotes]
+        count = len(history)
+        if selected is not None or format == "compact":
+            history = project_records(history, selected, format == "compact")
+        return {
+            "symbol": symbol,
+            "from": date_from,
+            "to": date_to,
+            "count": count,
+            "format": format,
+            "history": history,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@app.get("/market/export", tags=["해외시장 지수"])
+async def export_market_history(
+    date_from: Optional[str] = Query(None, alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="종료 날짜 (YYYY-MM-DD)"),
+    symbols: Optional[str] = Query(None, description="지수 심볼 (쉼표 구분, 생략 시 전체)"),
+    format: str = Query("ndjson", description="출력 형식 (ndjson 또는 csv)")
+):
+    """
+    저장된 과거 지수 데이터를 NDJSON 또는 CSV로 스트리밍합니다.
+
+    - **from** / **to**: 날짜 범위 (생략 시 저장된 전체 기간)
+    - **symbols**: 내보낼 지수 (예: dow,sp500)
+    - **format**: ndjson(한 줄에 레코드 하나) 또는 csv(헤더 포함)
+
+    행은 지수 순, 같은 지수 안에서는 날짜 순으로 나오며, 응답 전체를 메모리에 만들지 않고 조각씩 보냅니다.
+    """
+    try:
+        if format not in EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail="format은 'ndjson' 또는 'csv'여야 합니다.")
+        date_from = _validate_date(date_from, "from")
+        date_to = _validate_date(date_to, "to")
+
+        selected = [symbol.strip().lower() for symbol in symbols.split(",") if symbol.strip()] if symbols else []
+        unknown = [symbol for symbol in selected if symbol not in crawler.index_symbols]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 심볼입니다: {', '.join(unknown)}")
+        selected = list(dict.fromkeys(selected)) or list(crawler.index_symbols)
+
+        to_chunks, media_type, extension = EXPORT_FORMATS[format]
+        rows = iter_history_rows(selected, date_from, date_to, columns=history_columns, store=history_store)
+        filename = f"market_history_{date_from or 'start'}_{date_to or 'end'}.{extension}"
+        return StreamingResponse(
+            to_chunks(rows),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@app.get("/market/stream", tags=["해외시장 지수"])
+async def stream_market(request: Request):
+    """
+    해외시장 지수 실시간 스트림 (Server-Sent Events)
+
+    연결 직후 전체 스냅샷(event: snapshot)을 보내고, 이후에는 바뀐 지수와 필드만
+    변경분(event: delta)으로 보냅니다. 따라오지 못한 클라이언트는 밀린 변경분 대신
+    새 스냅샷을 받으며, 계속 밀리면 연결이 종료됩니다.
+    """
+    subscriber = await market_stream.subscribe()
+
+    async def event_stream():
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscriber.queue.get(), timeout=MARKET_STREAM_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+                if message is None:
+                    break
+                event, data, seq = message
+                yield f"event: {event}\nid: {seq}\ndata: {data}\n\n"
+        finally:
+            market_stream.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.websocket("/market/stream/ws")
+async def stream_market_ws(websocket: WebSocket):
+    """해외시장 지수 실시간 스트림 (WebSocket, 메시지 형식은 SSE의 data와 동일)"""
+    await websocket.accept()
+    subscriber = await market_stream.subscribe()
+    closed_by_server = False
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(subscriber.queue.get(), timeout=MARKET_STREAM_HEARTBEAT)
+            except asyncio.TimeoutError:
+                # 끊긴 연결을 찾아내기 위한 하트비트
+                await websocket.send_text('{"type": "ping"}')
+                continue
+            if message is None:
+                closed_by_server = True
+                break
+            await websocket.send_text(message[1])
+    except WebSocketDisconnect:
+        pass
+    finally:
+        market_stream.unsubscribe(subscriber)
+    if closed_by_server:
+        await websocket.close()
+
+
 @app.post("/market/collect", tags=["해외시장 지수"])
 async def collect_market_data():
     """
@@ -200,9 +715,12 @@ async def collect_market_data():
     파일은 data/global_point_YYYY-MM-DD.json 형식으로 저장됩니다.
     """
     try:
-        filename = save_market_data_to_json()
+        filename = await run_in_threadpool(save_market_data_to_json)
 
         if filename:
+            # 새로 수집했으므로 다음 조회는 최신 데이터로 스냅샷 갱신 (집계는 수집 시 이미 반영됨)
+            market_snapshots.invalidate()
+            publish_overview()
             return {
                 "status": "success",
                 "message": "해외시장 지수 데이터 수집 및 저장 완료",
@@ -221,6 +739,122 @@ async def collect_market_data():
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 
+# ========================================
+# 뉴스 검색 엔드포인트
+# ========================================
+
+def _validate_date(value: Optional[str], name: str) -> Optional[str]:
+    """YYYY-MM-DD 형식 확인"""
+    if value is None:
+        return None
+    try:
+        datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name}은(는) YYYY-MM-DD 형식이어야 합니다.")
+    return value
+
+
+@app.get("/news/search", tags=["뉴스"])
+async def search_news(
+    q: str = Query(..., min_length=1, description="검색어"),
+    date_from: Optional[str] = Query(None, alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="종료 날짜 (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수")
+):
+    """
+    수집된 뉴스를 제목과 본문으로 검색합니다.
+
+    - **q**: 검색어 (문자 bigram 기준, 모든 bigram을 포함한 기사를 최신순으로 반환)
+    - **from** / **to**: 날짜 범위 (생략 시 전체 기간)
+    - **limit**: 최대 결과 수
+    """
+    try:
+        date_from = _validate_date(date_from, "from")
+        date_to = _validate_date(date_to, "to")
+        await run_in_threadpool(news_search_index.refresh)
+        result = await run_in_threadpool(news_search_index.search, q, date_from, date_to, limit)
+        return {
+            **result,
+            "from": date_from,
+            "to": date_to,
+            "count": len(result["results"]),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@app.get("/news/latest", tags=["뉴스"])
+async def get_latest_news(
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    date: Optional[str] = Query(None, description="특정 날짜만 조회 (YYYY-MM-DD)")
+):
+    """
+    가장 최근에 수집된 뉴스를 조회합니다.
+
+    - **limit**: 최대 결과 수
+    - **date**: 특정 날짜만 조회 (생략 시 전체 기간)
+    """
+    try:
+        date = _validate_date(date, "date")
+        await run_in_threadpool(news_search_index.refresh)
+        news = await run_in_threadpool(news_search_index.latest, limit, date)
+        return {
+            "date": date,
+            "count": len(news),
+            "news": news,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@app.get("/news/trends", tags=["뉴스"])
+async def get_news_trends(
+    date: Optional[str] = Query(None, description="대상 날짜 (YYYY-MM-DD, 생략 시 가장 최근 수집일)"),
+    window: int = Query(7, ge=1, le=90, description="기준 기간 일수"),
+    kind: Optional[str] = Query(None, description="용어 종류 (stock, word)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수")
+):
+    """
+    최근 기간 대비 언급이 급증한 단어와 종목을 조회합니다.
+
+    날짜별 언급 수 집계표로 계산하며, 집계 전에 아카이브에 새로 붙은 기사만 읽어 집계표에 더합니다.
+
+    - **date**: 대상 날짜
+    - **window**: 기준 기간 일수 (대상 날짜 이전)
+    - **kind**: stock(종목) 또는 word(단어)
+    - **limit**: 최대 결과 수
+    """
+    try:
+        date = _validate_date(date, "date")
+        if kind and kind not in ['stock', 'word']:
+            raise HTTPException(
+                status_code=400,
+                detail="kind는 'stock', 'word' 중 하나여야 합니다."
+            )
+
+        # 아카이브 파일을 읽는 갱신은 이벤트 루프 밖에서 실행
+        await run_in_threadpool(news_trends.refresh)
+        result = news_trends.trends(date, window, limit, kind)
+        return {
+            **result,
+            "count": len(result["terms"]),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
 if __name__ == "__main__":
     import uvicorn
     print("\n🌍 해외시장 지수 크롤링 서버를 시작합니다...")
@@ -7,38 +7,68 @@ import re
 from datetime import datetime, timedelta
 import json
 import os
-import hashlib
-import glob
-from openai import OpenAI
-from supabase import create_client, Client
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
+from news.archive import ARCHIVE_RETENTION_DAYS, NewsArchive
+from news.body_fetcher import BodyCache, article_key_from_link, fetch_article_body, fetch_article_bodies
+from news.clustering import cluster_prompt_titles
+from news.llm_cache import LLMResultCache, make_cache_key, title_signature
+from news.near_duplicate import DuplicateIndex, assign_duplicate_groups
+from news.outbox import Outbox, flush_outbox
+from news.page_cache import PageCache
+from news.search_index import NewsSearchIndex
+from news.snapshot import SnapshotState, snapshot_hash
+from news.trends import TrendCounter
+from utils.data_repository import get_data_repository
+from utils.fast_json import dump_file
+from news.stock_extractor import format_stock_hint, format_topstock, get_stock_extractor
+from utils.rate_limit import SharedHostRateLimiter, news_rate_limiter
 
 URL = "https://finance.naver.com/news/mainnews.naver"
 
 # 환경 변수 로드
 load_dotenv()
 
-# OpenAI 클라이언트 초기화
+# OpenAI / Supabase 클라이언트 (처음 사용할 때 생성, 무거운 패키지 import도 그때 수행)
 openai_client = None
-if os.getenv("OPENAI_API_KEY"):
-    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+supabase_client = None
+_openai_client_checked = False
+_supabase_client_checked = False
 
-# Supabase 클라이언트 초기화
-supabase_client: Client = None
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
+# OpenAI 클라이언트 가져오기
+def get_openai_client():
+    """OpenAI 클라이언트를 처음 사용할 때 생성하여 반환 (API 키가 없으면 None)"""
+    global openai_client, _openai_client_checked
+    if openai_client is None and not _openai_client_checked:
+        _openai_client_checked = True
+        if os.getenv("OPENAI_API_KEY"):
+            from openai import OpenAI
+            openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return openai_client
 
-if supabase_url and supabase_key:
-    try:
-        supabase_client = create_client(supabase_url, supabase_key)
-        print(f"✅ Supabase 클라이언트 초기화 완료: {supabase_url[:30]}...")
-    except Exception as e:
-        print(f"⚠️ Supabase 클라이언트 초기화 실패: {e}")
-else:
-    if not supabase_url:
-        print("⚠️ SUPABASE_URL 환경 변수가 설정되지 않았습니다.")
-    if not supabase_key:
-        print("⚠️ SUPABASE_KEY 환경 변수가 설정되지 않았습니다.")
+# Supabase 클라이언트 가져오기
+def get_supabase_client():
+    """Supabase 클라이언트를 처음 사용할 때 생성하여 반환 (연결 정보가 없으면 None)"""
+    global supabase_client, _supabase_client_checked
+    if supabase_client is None and not _supabase_client_checked:
+        _supabase_client_checked = True
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_KEY")
+        
+        if supabase_url and supabase_key:
+            try:
+                from supabase import create_client
+                supabase_client = create_client(supabase_url, supabase_key)
+                print(f"✅ Supabase 클라이언트 초기화 완료: {supabase_url[:30]}...")
+            except Exception as e:
+                print(f"⚠️ Supabase 클라이언트 초기화 실패: {e}")
+        else:
+            if not supabase_url:
+                print("⚠️ SUPABASE_URL 환경 변수가 설정되지 않았습니다.")
+            if not supabase_key:
+                print("⚠️ SUPABASE_KEY 환경 변수가 설정되지 않았습니다.")
+    return supabase_client
 
 user_agents = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
@@ -77,65 +107,43 @@ def build_url_with_params(date=None, page=1):
 
 # 데이터 해시값 계산 (중복 체크용)
 def calculate_data_hash(data):
-    """데이터의 해시값을 계산하여 반환"""
-    data_str = json.dumps(data, sort_keys=True, ensure_ascii=False)
-    return hashlib.md5(data_str.encode('utf-8')).hexdigest()
+    """데이터의 해시값을 계산하여 반환 (항목별 해시를 순서대로 누적)"""
+    return snapshot_hash(data)
+
+# 실행 기록 저장
+def save_run_record(filepath, date, data_hash, total_count, new_keys):
+    """
+    실행별 기록을 공백 없는 JSON으로 저장 (기사 내용은 아카이브에만 보관)
 
-# 데이터 저장
-def save_data_to_json(data, filepath):
-    """데이터를 JSON 파일로 저장"""
+    하루치 전체 목록 대신 스냅샷 해시, 전체 기사 수, 이번 실행에서 아카이브에 새로 추가된
+    기사 키만 남기므로 파일이 수 KB 이하로 유지됩니다.
+    """
     try:
         # data 폴더가 없으면 생성
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        # 데이터에 메타데이터 추가
         output_data = {
-            "date": get_today_date(),
+            "date": date,
             "timestamp": datetime.now().isoformat(),
-            "total_count": len(data),
-            "data_hash": calculate_data_hash(data),
-            "news": data
+            "total_count": total_count,
+            "data_hash": data_hash,
+            "archive": os.path.basename(news_archive.segment_path(date)),
+            "new_count": len(new_keys),
+            "new_keys": new_keys
         }
         
-        # JSON 파일로 저장
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        dump_file(output_data, filepath, compact=True)
         
-        print(f"✅ 데이터 저장 완료: {filepath}")
+        print(f"✅ 실행 기록 저장 완료: {filepath} (새 기사 {len(new_keys)}개)")
         return True
     except Exception as e:
-        print(f"❌ 데이터 저장 실패: {e}")
+        print(f"❌ 실행 기록 저장 실패: {e}")
         return False
 
 # 오늘 날짜의 다음 파일 번호 찾기
 def get_next_file_number(data_dir, date):
-    """오늘 날짜의 기존 파일들을 확인하여 다음 번호 반환"""
-    pattern = os.path.join(data_dir, f"{date}_*.json")
-    existing_files = glob.glob(pattern)
-    
-    if not existing_files:
-        return "01"
-    
-    # 파일명에서 번호 추출
-    numbers = []
-    for filepath in existing_files:
-        filename = os.path.basename(filepath)
-        # YYYY-MM-DD_NN.json 형식에서 NN 추출
-        try:
-            parts = filename.replace('.json', '').split('_')
-            if len(parts) >= 2:
-                num_str = parts[-1]
-                if num_str.isdigit():
-                    numbers.append(int(num_str))
-        except:
-            continue
-    
-    if not numbers:
-        return "01"
-    
-    # 다음 번호 계산
-    next_num = max(numbers) + 1
-    return f"{next_num:02d}"
+    """오늘 날짜의 기존 파일들을 확인하여 다음 번호 반환 (폴더 색인 사용)"""
+    return f"{get_data_repository(data_dir).next_run_number(date):02d}"
 
 # 파일명 생성
 def generate_filename(data_dir, date):
@@ -152,52 +160,23 @@ def delete_old_files(data_dir, days=5):
             return
         
         # 현재 날짜
-        today = datetime.now()
-        today_str = today.strftime('%Y-%m-%d')
-        cutoff_date = today - timedelta(days=days)
-        
-        # 뉴스 파일 패턴만 확인 (YYYY-MM-DD_NN.json 형식)
-        pattern = os.path.join(data_dir, "????-??-??_??.json")
-        files = glob.glob(pattern)
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        cutoff_str = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
+        # 뉴스 실행 파일(YYYY-MM-DD_NN.json)만 색인에서 날짜로 골라냄
+        repository = get_data_repository(data_dir)
         deleted_count = 0
-        for filepath in files:
-            try:
-                filename = os.path.basename(filepath)
-                
-                # 파일명 형식 확인 (YYYY-MM-DD_NN.json)
-                if not filename.count('_') == 1:
-                    continue
-                
-                parts = filename.replace('.json', '').split('_')
-                if len(parts) != 2:
-                    continue
-                
-                date_str = parts[0]
-                num_str = parts[1]
-                
-                # 날짜 형식 확인
-                if not num_str.isdigit():
-                    continue
-                
-                # 오늘 날짜의 파일은 삭제하지 않음
-                if date_str == today_str:
-                    continue
-                
-                # 날짜 파싱
-                file_date = datetime.strptime(date_str, '%Y-%m-%d')
-                
-                # 5일 이상 지난 파일만 삭제
-                if file_date < cutoff_date:
-                    os.remove(filepath)
-                    deleted_count += 1
-                    print(f"🗑️ 오래된 뉴스 파일 삭제: {filename}")
-            except (ValueError, IndexError) as e:
-                # 날짜 파싱 실패 또는 형식 오류 시 스킵 (다른 workflow의 파일일 수 있음)
-                continue
-            except Exception as e:
-                # 기타 오류 시 스킵
+        for date_str in repository.dates('news_run'):
+            # 오늘 날짜의 파일은 삭제하지 않음, 5일 이상 지난 파일만 삭제
+            if date_str > cutoff_str or date_str == today_str:
                 continue
+            for data_file in repository.news_runs(date_str):
+                try:
+                    repository.remove(data_file)
+                    deleted_count += 1
+                    print(f"🗑️ 오래된 뉴스 파일 삭제: {data_file.name}")
+                except OSError:
+                    continue
         
         if deleted_count > 0:
             print(f"✅ 총 {deleted_count}개의 오래된 뉴스 파일을 삭제했습니다.")
@@ -216,6 +195,7 @@ def get_today_page_count(date=None):
         
         # 오늘 날짜의 첫 페이지로 요청
         url_with_date = build_url_with_params(date=date, page=1)
+        news_rate_limiter.wait(url_with_date)
         response = requests.get(url_with_date, headers=headers, timeout=10)
         response.raise_for_status()
         response.encoding = 'euc-kr'
@@ -331,256 +311,243 @@ def get_today_page_count(date=None):
 
 # 뉴스 상세 내용 가져오기 및 요약
 def fetch_news_content(link):
-    """뉴스 상세 페이지에서 본문 내용 가져오기"""
-    try:
-        if not link:
-            return None
-        
-        response = requests.get(link, headers=headers, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'euc-kr'
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 네이버 뉴스 본문 찾기 (일반적인 구조)
-        content_selectors = [
-            '#articleBodyContents',
-            '#articleBody',
-            '.article_body',
-            '.articleBody',
-            '.news_end_body',
-            '.article_view',
-            '#newsEndContents',
-            '#articleBodyContents .go_trans _article_content',
-            '.article_info'
-        ]
-        
-        content = None
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                # 스크립트 태그 제거
-                for script in content_elem(["script", "style", "iframe", "noscript"]):
-                    script.decompose()
-                content = content_elem.get_text(separator=' ', strip=True)
-                if content and len(content) > 50:  # 최소 50자 이상
-                    break
-        
-        # 본문을 찾지 못한 경우, 일반적인 본문 태그 찾기
-        if not content or len(content) < 50:
-            # id에 body가 포함된 div 찾기
-            content_elem = soup.find('div', id=lambda x: x and 'body' in str(x).lower())
-            if not content_elem:
-                # article 태그 찾기
-                content_elem = soup.find('article')
-            if not content_elem:
-                # class에 article이 포함된 요소 찾기
-                content_elem = soup.find('div', class_=lambda x: x and 'article' in str(x).lower())
-            
-            if content_elem:
-                for script in content_elem(["script", "style", "iframe", "noscript"]):
-                    script.decompose()
-                content = content_elem.get_text(separator=' ', strip=True)
-        
-        # 본문 정리 (너무 짧거나 의미없는 텍스트 제거)
-        if content:
-            content = ' '.join(content.split())  # 연속 공백 제거
-            # 광고나 불필요한 텍스트 패턴 제거
-            lines = content.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                line = line.strip()
-                if line and len(line) > 10:
-                    # 광고 관련 키워드가 포함된 줄 제외
-                    if not any(keyword in line for keyword in ['광고', 'AD', 'Advertisement', '무단전재', '저작권']):
-                        cleaned_lines.append(line)
-            content = ' '.join(cleaned_lines)
-        
-        return content if content and len(content) > 50 else None
-        
-    except Exception as e:
+    """뉴스 상세 페이지에서 본문 내용 가져오기 (본문 캐시 우선 사용)"""
+    if not link:
         return None
+    
+    key = article_key_from_link(link)
+    cache = BodyCache()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    
+    content = fetch_article_body(link, headers=headers)
+    if content:
+        cache.put(key, content)
+    return content
+
+# 새 기사들의 본문 일괄 수집
+def fetch_news_bodies(news_list, max_workers=4):
+    """캐시에 없는 기사 본문만 동시에 수집하고 처리량/캐시 적중률 출력"""
+    print(f"\n📖 기사 본문 수집 중... (대상 {len(news_list)}개, 동시 요청 {max_workers}개)")
+    result = fetch_article_bodies(news_list, headers=headers, max_workers=max_workers)
+    stats = result["stats"]
+    print(f"✅ 본문 수집 완료: 캐시 {stats['cache_hits']}개 / 신규 {stats['fetched']}개 / 실패 {stats['failed']}개")
+    print(f"   - 캐시 적중률: {stats['hit_rate']}%")
+    print(f"   - 처리량: {stats['fetch_per_sec']}건/초 ({stats['elapsed']}초)")
+    return result
 
 # 특정 페이지의 뉴스 리스트 가져오기
-def fetch_news_list_from_page(date=None, page=1):
-    """특정 날짜와 페이지의 뉴스 리스트 가져오기"""
+def fetch_news_list_from_page(date=None, page=1, page_cache=None):
+    """특정 날짜와 페이지의 뉴스 리스트 가져오기 (page_cache가 있으면 변경되지 않은 페이지는 파싱 생략)"""
     try:
         if date is None:
             date = get_today_date()
         
         url_with_params = build_url_with_params(date=date, page=page)
-        response = requests.get(url_with_params, headers=headers, timeout=10)
+        request_headers = headers
+        if page_cache is not None:
+            request_headers = {**headers, **page_cache.conditional_headers(url_with_params)}
+        
+        news_rate_limiter.wait(url_with_params)
+        response = requests.get(url_with_params, headers=request_headers, timeout=10)
+        
+        # 서버가 304를 주면 이전 파싱 결과 재사용
+        if response.status_code == 304 and page_cache is not None:
+            cached_items = page_cache.not_modified(url_with_params)
+            if cached_items is not None:
+                return cached_items
+        
         response.raise_for_status()
+        
+        # 응답 바이트가 이전과 같으면 파싱 생략
+        if page_cache is not None:
+            cached_items = page_cache.lookup(url_with_params, response.content)
+            if cached_items is not None:
+                return cached_items
+        
         response.encoding = 'euc-kr'
+        news_items = parse_news_list(response.text)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        if page_cache is not None:
+            page_cache.store(url_with_params, response.content, response.headers, news_items)
         
-        news_items = []
+        return news_items
         
-        # .newsList 클래스를 가진 요소 찾기
-        news_list = soup.select('.newsList')
+    except Exception as e:
+        print(f"⚠️ 뉴스 데이터를 가져오는 중 오류가 발생했습니다: {e}")
+        return []
+
+# 뉴스 목록 페이지 HTML 파싱
+def parse_news_list(html):
+    """뉴스 목록 페이지 HTML에서 뉴스 항목 추출"""
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    news_items = []
+    
+    # .newsList 클래스를 가진 요소 찾기
+    news_list = soup.select('.newsList')
+    
+    if news_list:
+        # 각 뉴스 리스트 컨테이너 처리
+        for news_container in news_list:
+            # 뉴스 항목들 찾기 (일반적으로 li 태그나 article 태그)
+            news_items_in_container = news_container.find_all(['li', 'article', 'div'], class_=lambda x: x and ('news' in x.lower() or 'item' in x.lower()))
+            
+            # 만약 직접적인 뉴스 항목이 없다면, a 태그로 링크가 있는 항목 찾기
+            if not news_items_in_container:
+                news_items_in_container = news_container.find_all('a', href=True)
+            
+            for item in news_items_in_container:
+                # 제목 추출
+                title_elem = item.find(['a', 'strong', 'span', 'h3', 'h4'])
+                if not title_elem:
+                    title_elem = item
+                
+                title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
+                
+                # 링크 추출
+                link_elem = item.find('a', href=True) if item.name != 'a' else item
+                link = urljoin(URL, link_elem['href']) if link_elem and link_elem.get('href') else None
+                
+                # 시간/날짜 추출 - .articleSummary .wdate 우선 사용
+                time_elem = item.select_one('.articleSummary .wdate')
+                if not time_elem:
+                    time_elem = item.find(['span', 'em', 'time'], class_=lambda x: x and ('time' in x.lower() or 'date' in x.lower() or 'wdate' in x.lower()))
+                if not time_elem:
+                    time_elem = item.find('span', string=lambda x: x and any(char in str(x) for char in ['분', '시간', '일', ':', '-']))
+                time_text = time_elem.get_text(strip=True) if time_elem else ""
+                
+                # 요약/내용 추출 - .articleSummary 우선 사용
+                summary_elem = item.select_one('.articleSummary')
+                if summary_elem:
+                    # .wdate는 시간이므로 제외하고 요약만 추출
+                    wdate_elem = summary_elem.select_one('.wdate')
+                    if wdate_elem:
+                        wdate_elem.decompose()  # 시간 부분 제거
+                    summary = summary_elem.get_text(strip=True)
+                else:
+                    summary_elem = item.find(['p', 'span', 'div'], class_=lambda x: x and ('summary' in x.lower() or 'desc' in x.lower() or 'content' in x.lower()))
+                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
+                
+                if title and title != "제목 없음":
+                    news_items.append({
+                        "제목": title,
+                        "링크": link,
+
+                    })
+    else:
+        # .newsList가 없는 경우, 다른 일반적인 뉴스 구조 시도
+        # ul.newsList 또는 div.newsList 등
+        news_list_alt = soup.select('ul.newsList, div.newsList, .newsList ul, .newsList li')
         
-        if news_list:
-            # 각 뉴스 리스트 컨테이너 처리
-            for news_container in news_list:
-                # 뉴스 항목들 찾기 (일반적으로 li 태그나 article 태그)
-                news_items_in_container = news_container.find_all(['li', 'article', 'div'], class_=lambda x: x and ('news' in x.lower() or 'item' in x.lower()))
+        for item in news_list_alt:
+            title_elem = item.find('a')
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                link = urljoin(URL, title_elem.get('href', ''))
                 
-                # 만약 직접적인 뉴스 항목이 없다면, a 태그로 링크가 있는 항목 찾기
-                if not news_items_in_container:
-                    news_items_in_container = news_container.find_all('a', href=True)
+                # 시간/날짜 추출 - .articleSummary .wdate 우선 사용
+                time_elem = item.select_one('.articleSummary .wdate')
+                if not time_elem:
+                    time_elem = item.find(['span', 'em'], class_=lambda x: x and ('time' in str(x).lower() or 'wdate' in str(x).lower()))
+                time_text = time_elem.get_text(strip=True) if time_elem else ""
                 
-                for item in news_items_in_container:
-                    # 제목 추출
-                    title_elem = item.find(['a', 'strong', 'span', 'h3', 'h4'])
-                    if not title_elem:
-                        title_elem = item
-                    
-                    title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
-                    
-                    # 링크 추출
-                    link_elem = item.find('a', href=True) if item.name != 'a' else item
-                    link = urljoin(URL, link_elem['href']) if link_elem and link_elem.get('href') else None
-                    
-                    # 시간/날짜 추출 - .articleSummary .wdate 우선 사용
-                    time_elem = item.select_one('.articleSummary .wdate')
-                    if not time_elem:
-                        time_elem = item.find(['span', 'em', 'time'], class_=lambda x: x and ('time' in x.lower() or 'date' in x.lower() or 'wdate' in x.lower()))
-                    if not time_elem:
-                        time_elem = item.find('span', string=lambda x: x and any(char in str(x) for char in ['분', '시간', '일', ':', '-']))
-                    time_text = time_elem.get_text(strip=True) if time_elem else ""
-                    
-                    # 요약/내용 추출 - .articleSummary 우선 사용
-                    summary_elem = item.select_one('.articleSummary')
-                    if summary_elem:
-                        # .wdate는 시간이므로 제외하고 요약만 추출
-                        wdate_elem = summary_elem.select_one('.wdate')
-                        if wdate_elem:
-                            wdate_elem.decompose()  # 시간 부분 제거
-                        summary = summary_elem.get_text(strip=True)
-                    else:
-                        summary_elem = item.find(['p', 'span', 'div'], class_=lambda x: x and ('summary' in x.lower() or 'desc' in x.lower() or 'content' in x.lower()))
-                        summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    if title and title != "제목 없음":
-                        news_items.append({
-                            "제목": title,
-                            "링크": link,
+                # 요약/내용 추출 - .articleSummary 우선 사용
+                summary_elem = item.select_one('.articleSummary')
+                if summary_elem:
+                    # .wdate는 시간이므로 제외하고 요약만 추출
+                    wdate_elem = summary_elem.select_one('.wdate')
+                    if wdate_elem:
+                        wdate_elem.decompose()  # 시간 부분 제거
+                    summary = summary_elem.get_text(strip=True)
+                else:
+                    summary = ""
+                
+                if title:
+                    news_items.append({
+                        "제목": title,
+                        "링크": link,
 
-                        })
-        else:
-            # .newsList가 없는 경우, 다른 일반적인 뉴스 구조 시도
-            # ul.newsList 또는 div.newsList 등
-            news_list_alt = soup.select('ul.newsList, div.newsList, .newsList ul, .newsList li')
+                    })
+    
+    # .Nnavi 클래스를 가진 요소 찾기 (추가 데이터)
+    nnavi_elements = soup.select('.Nnavi')
+    
+    if nnavi_elements:
+        for nnavi_container in nnavi_elements:
+            # Nnavi 내부의 뉴스 항목들 찾기
+            nnavi_items = nnavi_container.find_all(['li', 'article', 'div', 'a'], recursive=True)
             
-            for item in news_list_alt:
-                title_elem = item.find('a')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    link = urljoin(URL, title_elem.get('href', ''))
-                    
-                    # 시간/날짜 추출 - .articleSummary .wdate 우선 사용
-                    time_elem = item.select_one('.articleSummary .wdate')
-                    if not time_elem:
-                        time_elem = item.find(['span', 'em'], class_=lambda x: x and ('time' in str(x).lower() or 'wdate' in str(x).lower()))
-                    time_text = time_elem.get_text(strip=True) if time_elem else ""
-                    
-                    # 요약/내용 추출 - .articleSummary 우선 사용
-                    summary_elem = item.select_one('.articleSummary')
-                    if summary_elem:
-                        # .wdate는 시간이므로 제외하고 요약만 추출
-                        wdate_elem = summary_elem.select_one('.wdate')
-                        if wdate_elem:
-                            wdate_elem.decompose()  # 시간 부분 제거
-                        summary = summary_elem.get_text(strip=True)
-                    else:
-                        summary = ""
-                    
-                    if title:
+            for item in nnavi_items:
+                # 제목 추출
+                title_elem = item.find(['a', 'strong', 'span', 'h3', 'h4', 'dt', 'dd'])
+                if not title_elem:
+                    # 직접 텍스트가 있는 경우
+                    if item.name == 'a' or item.get_text(strip=True):
+                        title_elem = item
+                
+                title = title_elem.get_text(strip=True) if title_elem else ""
+                
+                # 링크 추출
+                link_elem = item.find('a', href=True) if item.name != 'a' else item
+                if item.name == 'a' and item.get('href'):
+                    link_elem = item
+                
+                link = None
+                if link_elem:
+                    href = link_elem.get('href') if hasattr(link_elem, 'get') else (link_elem['href'] if 'href' in link_elem.attrs else None)
+                    if href:
+                        link = urljoin(URL, href)
+                
+                # 시간/날짜 추출 - .articleSummary .wdate 우선 사용
+                time_elem = item.select_one('.articleSummary .wdate')
+                if not time_elem:
+                    time_elem = item.find(['span', 'em', 'time', 'dd'], class_=lambda x: x and ('time' in x.lower() or 'date' in x.lower() or 'wdate' in x.lower()))
+                if not time_elem:
+                    time_elem = item.find('span', string=lambda x: x and any(char in str(x) for char in ['분', '시간', '일', ':', '-']))
+                time_text = time_elem.get_text(strip=True) if time_elem else ""
+                
+                # 요약/내용 추출 - .articleSummary 우선 사용
+                summary_elem = item.select_one('.articleSummary')
+                if summary_elem:
+                    # .wdate는 시간이므로 제외하고 요약만 추출
+                    wdate_elem = summary_elem.select_one('.wdate')
+                    if wdate_elem:
+                        wdate_elem.decompose()  # 시간 부분 제거
+                    summary = summary_elem.get_text(strip=True)
+                else:
+                    summary_elem = item.find(['p', 'span', 'div', 'dd'], class_=lambda x: x and ('summary' in x.lower() or 'desc' in x.lower() or 'content' in x.lower()))
+                    if not summary_elem:
+                        # Nnavi 내부의 설명 텍스트 찾기
+                        summary_elem = item.find(['p', 'span', 'div'], string=lambda x: x and len(str(x).strip()) > 20)
+                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
+                
+                # 중복 제거: 이미 추가된 뉴스와 제목이 같으면 스킵
+                if title and title != "제목 없음" and len(title) > 5:
+                    # 중복 체크
+                    is_duplicate = any(existing.get("제목") == title for existing in news_items)
+                    if not is_duplicate:
                         news_items.append({
                             "제목": title,
                             "링크": link,
-
+                            "출처": "Nnavi"  # Nnavi에서 가져온 데이터임을 표시
                         })
-        
-        # .Nnavi 클래스를 가진 요소 찾기 (추가 데이터)
-        nnavi_elements = soup.select('.Nnavi')
-        
-        if nnavi_elements:
-            for nnavi_container in nnavi_elements:
-                # Nnavi 내부의 뉴스 항목들 찾기
-                nnavi_items = nnavi_container.find_all(['li', 'article', 'div', 'a'], recursive=True)
-                
-                for item in nnavi_items:
-                    # 제목 추출
-                    title_elem = item.find(['a', 'strong', 'span', 'h3', 'h4', 'dt', 'dd'])
-                    if not title_elem:
-                        # 직접 텍스트가 있는 경우
-                        if item.name == 'a' or item.get_text(strip=True):
-                            title_elem = item
-                    
-                    title = title_elem.get_text(strip=True) if title_elem else ""
-                    
-                    # 링크 추출
-                    link_elem = item.find('a', href=True) if item.name != 'a' else item
-                    if item.name == 'a' and item.get('href'):
-                        link_elem = item
-                    
-                    link = None
-                    if link_elem:
-                        href = link_elem.get('href') if hasattr(link_elem, 'get') else (link_elem['href'] if 'href' in link_elem.attrs else None)
-                        if href:
-                            link = urljoin(URL, href)
-                    
-                    # 시간/날짜 추출 - .articleSummary .wdate 우선 사용
-                    time_elem = item.select_one('.articleSummary .wdate')
-                    if not time_elem:
-                        time_elem = item.find(['span', 'em', 'time', 'dd'], class_=lambda x: x and ('time' in x.lower() or 'date' in x.lower() or 'wdate' in x.lower()))
-                    if not time_elem:
-                        time_elem = item.find('span', string=lambda x: x and any(char in str(x) for char in ['분', '시간', '일', ':', '-']))
-                    time_text = time_elem.get_text(strip=True) if time_elem else ""
-                    
-                    # 요약/내용 추출 - .articleSummary 우선 사용
-                    summary_elem = item.select_one('.articleSummary')
-                    if summary_elem:
-                        # .wdate는 시간이므로 제외하고 요약만 추출
-                        wdate_elem = summary_elem.select_one('.wdate')
-                        if wdate_elem:
-                            wdate_elem.decompose()  # 시간 부분 제거
-                        summary = summary_elem.get_text(strip=True)
-                    else:
-                        summary_elem = item.find(['p', 'span', 'div', 'dd'], class_=lambda x: x and ('summary' in x.lower() or 'desc' in x.lower() or 'content' in x.lower()))
-                        if not summary_elem:
-                            # Nnavi 내부의 설명 텍스트 찾기
-                            summary_elem = item.find(['p', 'span', 'div'], string=lambda x: x and len(str(x).strip()) > 20)
-                        summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    # 중복 제거: 이미 추가된 뉴스와 제목이 같으면 스킵
-                    if title and title != "제목 없음" and len(title) > 5:
-                        # 중복 체크
-                        is_duplicate = any(existing.get("제목") == title for existing in news_items)
-                        if not is_duplicate:
-                            news_items.append({
-                                "제목": title,
-                                "링크": link,
-                                "출처": "Nnavi"  # Nnavi에서 가져온 데이터임을 표시
-                            })
-        
-        return news_items
-        
-    except Exception as e:
-        print(f"⚠️ 뉴스 데이터를 가져오는 중 오류가 발생했습니다: {e}")
-        return []
+    
+    return news_items
 
 # 오늘 날짜의 모든 페이지에서 뉴스 데이터 누적 수집
-def fetch_all_pages_news(date=None):
-    """지정된 날짜의 모든 페이지에서 뉴스 데이터를 누적하여 수집"""
+def fetch_all_pages_news(date=None, use_page_cache=True):
+    """지정된 날짜의 모든 페이지에서 뉴스 데이터를 누적하여 수집 (use_page_cache=False면 페이지 캐시 미사용)"""
     if date is None:
         date = get_today_date()
     
     all_news_items = []
     seen_titles = set()  # 중복 제거를 위한 제목 집합
     
+    # 변경되지 않은 페이지의 파싱 결과를 재사용하기 위한 캐시
+    page_cache = PageCache().load() if use_page_cache else None
+    
     # 먼저 페이지 개수 파악
     page_count = get_today_page_count(date=date)
     
@@ -596,7 +563,7 @@ def fetch_all_pages_news(date=None):
             print(f"📄 페이지 {page}/{page_count} 수집 중...")
             
             # 페이지별 뉴스 데이터 가져오기
-            page_news = fetch_news_list_from_page(date=date, page=page)
+            page_news = fetch_news_list_from_page(date=date, page=page, page_cache=page_cache)
             
             # 중복 제거하면서 추가
             for news in page_news:
@@ -606,111 +573,328 @@ def fetch_all_pages_news(date=None):
                     news["페이지"] = page  # 어느 페이지에서 가져왔는지 표시
                     all_news_items.append(news)
             
-            # API 호출 제한을 고려한 짧은 대기
-            time.sleep(0.5)
-            
         except Exception as e:
             print(f"⚠️ 페이지 {page} 수집 중 오류 발생: {e}")
             continue
     
+    if page_cache is not None:
+        try:
+            page_cache.save()
+        except Exception as e:
+            print(f"⚠️ 페이지 캐시 저장 실패: {e}")
+        
+        stats = page_cache.stats
+        print(f"📊 페이지 통계: 요청 {stats['fetched'] + stats['not_modified']}개 / 파싱 {stats['parsed']}개 / 캐시 사용 {stats['cached']}개 (304 응답 {stats['not_modified']}개)")
     print(f"✅ 총 {len(all_news_items)}개의 뉴스를 수집했습니다.")
     
     return all_news_items
 
-# 캐시를 위한 전역 변수
-_summary_and_stocks_cache = {}
+# OpenAI 요약에 사용하는 모델
+SUMMARY_MODEL = "gpt-4o-mini"
+
+# 요약 + 추천 종목 시스템 프롬프트
+SUMMARY_SYSTEM_PROMPT = "당신은 뉴스 분석 및 주식 투자 전문가입니다. 주어진 뉴스 제목들을 분석하여 다음 두 가지를 수행해주세요:\n1. 뉴스 제목들을 종합하여 500자 이내로 요약\n2. 뉴스 내용을 바탕으로 투자 가치가 높은 한국 주식 종목 10개를 추천\n\n응답 형식:\n[요약]\n(여기에 500자 이내 요약)\n\n[추천종목]\n종목1, 종목2, 종목3, 종목4, 종목5, 종목6, 종목7, 종목8, 종목9, 종목10"
+
+# 요약 결과 영구 캐시 (실행마다 새 프로세스여도 재사용)
+summary_cache = LLMResultCache()
+
+# 요약 요청 메시지 생성
+def build_summary_messages(titles: list, clustered: bool = False, stock_hint: str = "") -> list:
+    """뉴스 제목 목록으로 요약 + 추천 종목 요청 메시지 생성"""
+    titles_text = "\n".join([f"- {title}" for title in titles[:50]])  # 최대 50개까지만
+    if len(titles) > 50:
+        titles_text += f"\n... 외 {len(titles) - 50}개 뉴스"
+    if clustered:
+        titles_text = f"{CLUSTER_NOTE}\n\n{titles_text}"
+    if stock_hint:
+        titles_text += f"\n\n{STOCK_HINT_PREFIX} {stock_hint}"
+    
+    return [
+        {
+            "role": "system",
+            "content": SUMMARY_SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": f"다음 뉴스 제목들을 분석해주세요:\n\n{titles_text}\n\n위 뉴스들을 바탕으로:\n1. 500자 이내로 요약\n2. 투자 가치가 높은 한국 주식 종목 10개 추천 (종목명 또는 종목코드 6자리, 쉼표로 구분)\n\n[요약]과 [추천종목] 형식으로 답변해주세요."
+        }
+    ]
+
+# [요약]/[추천종목] 형식 응답 파싱
+def parse_summary_response(result_text: str) -> tuple[str, str]:
+    """LLM 응답에서 요약과 추천 종목 추출"""
+    summary = ""
+    topstock = ""
+    
+    # [요약] 섹션 추출
+    if "[요약]" in result_text:
+        summary_part = result_text.split("[요약]")[1]
+        if "[추천종목]" in summary_part:
+            summary = summary_part.split("[추천종목]")[0].strip()
+        else:
+            summary = summary_part.strip()
+    else:
+        # [요약] 태그가 없으면 첫 부분을 요약으로 간주
+        if "[추천종목]" in result_text:
+            summary = result_text.split("[추천종목]")[0].strip()
+        else:
+            summary = result_text[:500]
+    
+    # [추천종목] 섹션 추출
+    if "[추천종목]" in result_text:
+        topstock_part = result_text.split("[추천종목]")[1].strip()
+        # 첫 줄만 가져오기 (추가 설명 제거)
+        topstock = topstock_part.split("\n")[0].strip()
+    else:
+        # [추천종목] 태그가 없으면 마지막 부분을 추천 종목으로 간주
+        lines = result_text.split("\n")
+        for line in reversed(lines):
+            if "," in line and len(line.strip()) > 10:
+                topstock = line.strip()
+                break
+    
+    # 500자 제한
+    if len(summary) > 500:
+        summary = summary[:500]
+    
+    # 255자 제한 (VARCHAR(255))
+    if len(topstock) > 255:
+        topstock = topstock[:255]
+    
+    return summary, topstock
 
-# OpenAI를 사용한 뉴스 제목들 요약 및 추천 종목 추출 (하나의 API 요청)
+# 요약 실패 시 기본값
+def fallback_summary(titles: list) -> tuple[str, str]:
+    """제목 일부를 이어 붙인 기본 요약 반환"""
+    combined = " | ".join(titles[:10])  # 최대 10개만
+    if len(titles) > 10:
+        combined += f" ... 외 {len(titles) - 10}개"
+    summary = combined[:500] if len(combined) > 500 else combined
+    return summary, ""
+
+# 맵 단계 시스템 프롬프트 (청크별 부분 요약)
+MAP_SYSTEM_PROMPT = "당신은 뉴스 분석 및 주식 투자 전문가입니다. 주어진 뉴스 제목 묶음을 300자 이내로 요약하고, 제목에 언급되었거나 관련성이 높은 한국 주식 종목을 나열해주세요.\n\n응답 형식:\n[요약]\n(여기에 300자 이내 요약)\n\n[추천종목]\n종목1, 종목2, ..."
+
+# 비슷한 제목을 토픽으로 묶어 프롬프트 축소 여부
+SUMMARY_CLUSTER = os.getenv("NEWS_SUMMARY_CLUSTER", "1") != "0"
+
+# 토픽 압축 시 프롬프트에 덧붙이는 안내
+CLUSTER_NOTE = "(같은 이슈를 다룬 제목은 대표 제목 하나로 묶었으며, 괄호 안 건수는 관련 기사 수입니다. 기사 수가 많을수록 비중 있게 다뤄주세요.)"
+
+# 제목에서 찾은 종목 언급 횟수를 프롬프트에 힌트로 추가할지 여부
+SUMMARY_STOCK_HINT = os.getenv("NEWS_STOCK_HINT", "1") != "0"
+
+# 종목 힌트 앞에 붙는 안내
+STOCK_HINT_PREFIX = "참고 - 제목에서 언급된 종목(언급 기사 수):"
+
+# 제목이 이 개수를 넘으면 맵-리듀스 요약 사용
+SUMMARY_SINGLE_LIMIT = 50
+
+# 맵 단계 청크 크기와 최대 동시 요청 수
+SUMMARY_CHUNK_SIZE = int(os.getenv("NEWS_SUMMARY_CHUNK_SIZE", "40"))
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("NEWS_SUMMARY_MAX_CONCURRENCY", "4"))
+
+# 요약 방식 ("map_reduce": 모든 제목 반영, "single": 앞 50개만 한 번에 요약)
+SUMMARY_MODE = os.getenv("NEWS_SUMMARY_MODE", "map_reduce")
+
+# 맵-리듀스 요약 사용 여부
+def use_map_reduce(titles: list) -> bool:
+    """제목 수와 요약 방식 설정에 따라 맵-리듀스 요약 사용 여부 결정"""
+    return SUMMARY_MODE == "map_reduce" and len(titles) > SUMMARY_SINGLE_LIMIT
+
+# 제목 목록을 청크로 분할
+def chunk_titles(titles: list, chunk_size: int = None, max_chunks: int = None) -> list:
+    """제목 목록을 균등한 크기의 청크로 분할 (청크 수는 동시 요청 수 이하로 맞춰 맵 단계가 한 번에 끝나도록 함)"""
+    chunk_size = chunk_size or SUMMARY_CHUNK_SIZE
+    max_chunks = max_chunks or SUMMARY_MAX_CONCURRENCY
+    chunk_count = max(1, min(-(-len(titles) // chunk_size), max_chunks))
+    size = -(-len(titles) // chunk_count)
+    return [titles[i:i + size] for i in range(0, len(titles), size)]
+
+# 맵 단계: 청크 하나 요약
+def summarize_title_chunk(chunk: list, index: int, total: int, clustered: bool = False) -> dict:
+    """제목 청크 하나를 부분 요약 (실패 시 제목 일부를 그대로 부분 요약으로 사용)"""
+    titles_text = "\n".join([f"- {title}" for title in chunk])
+    if clustered:
+        titles_text = f"{CLUSTER_NOTE}\n\n{titles_text}"
+    try:
+        response = get_openai_client().chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": MAP_SYSTEM_PROMPT},
+                {"role": "user", "content": f"뉴스 제목 묶음 {index}/{total} ({len(chunk)}개):\n\n{titles_text}"}
+            ],
+            max_tokens=300,
+            temperature=0.3
+        )
+        summary, stocks = parse_summary_response(response.choices[0].message.content.strip())
+        return {"summary": summary, "stocks": stocks, "count": len(chunk), "ok": True}
+    except Exception as e:
+        print(f"⚠️ 부분 요약 {index}/{total} 실패: {e}")
+        summary = " | ".join(chunk)[:300]
+        return {"summary": summary, "stocks": "", "count": len(chunk), "ok": False}
+
+# 맵-리듀스 방식 요약
+def summarize_titles_map_reduce(titles: list, clustered: bool = False, stock_hint: str = "") -> str:
+    """
+    제목을 청크로 나누어 동시에 부분 요약한 뒤 하나의 [요약]/[추천종목] 응답으로 통합
+
+    Returns:
+        리듀스 단계 LLM 응답 텍스트
+    """
+    chunks = chunk_titles(titles)
+    total = len(chunks)
+    print(f"🧩 맵-리듀스 요약: {len(titles)}개 제목 → {total}개 청크 (동시 요청 {min(total, SUMMARY_MAX_CONCURRENCY)}개)")
+    
+    map_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(total, SUMMARY_MAX_CONCURRENCY))) as executor:
+        partials = list(executor.map(
+            lambda args: summarize_title_chunk(*args),
+            [(chunk, i + 1, total, clustered) for i, chunk in enumerate(chunks)]
+        ))
+    map_elapsed = time.perf_counter() - map_start
+    
+    failed = sum(1 for partial in partials if not partial["ok"])
+    if failed == total:
+        raise RuntimeError("모든 부분 요약 요청이 실패했습니다.")
+    
+    partial_text = "\n\n".join(
+        f"[부분 요약 {i + 1} - 뉴스 {partial['count']}개]\n{partial['summary']}\n관련 종목: {partial['stocks'] or '없음'}"
+        for i, partial in enumerate(partials)
+    )
+    if stock_hint:
+        partial_text += f"\n\n{STOCK_HINT_PREFIX} {stock_hint}"
+    
+    reduce_start = time.perf_counter()
+    response = get_openai_client().chat.completions.create(
+        model=SUMMARY_MODEL,
+        messages=[
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": f"다음은 오늘 뉴스 {'토픽' if clustered else '제목'} {len(titles)}개를 {total}개 묶음으로 나누어 요약한 결과입니다:\n\n{partial_text}\n\n위 부분 요약들을 종합하여:\n1. 500자 이내로 요약\n2. 투자 가치가 높은 한국 주식 종목 10개 추천 (종목명 또는 종목코드 6자리, 쉼표로 구분)\n\n[요약]과 [추천종목] 형식으로 답변해주세요."
+            }
+        ],
+        max_tokens=500,
+        temperature=0.7
+    )
+    reduce_elapsed = time.perf_counter() - reduce_start
+    print(f"⏱️ 맵 단계 {map_elapsed:.2f}초 (실패 {failed}개) / 리듀스 단계 {reduce_elapsed:.2f}초")
+    
+    return response.choices[0].message.content.strip()
+
+# 맵-리듀스 요약 캐시 키 입력
+def map_reduce_cache_payload(titles: list, clustered: bool = False, stock_hint: str = "") -> dict:
+    """맵/리듀스 단계에 실제로 들어가는 입력 (청크 분할, 프롬프트, 안내 문구, 종목 힌트)"""
+    return {
+        "mode": "map_reduce",
+        "map_prompt": MAP_SYSTEM_PROMPT,
+        "reduce_prompt": SUMMARY_SYSTEM_PROMPT,
+        "cluster_note": CLUSTER_NOTE if clustered else "",
+        "chunks": chunk_titles(titles),
+        "stock_hint": f"{STOCK_HINT_PREFIX} {stock_hint}" if stock_hint else "",
+    }
+
+# 유사 요약 재사용 범위
+def summary_cache_variant(map_reduce: bool, clustered: bool = False, stock_hint: bool = False) -> str:
+    """요청 방식(단일/맵-리듀스)과 프롬프트 버전 식별자 (같은 값끼리만 유사 요약을 재사용)"""
+    return make_cache_key(SUMMARY_MODEL, {
+        "mode": "map_reduce" if map_reduce else "single",
+        "map_prompt": MAP_SYSTEM_PROMPT if map_reduce else "",
+        "summary_prompt": SUMMARY_SYSTEM_PROMPT,
+        "cluster_note": CLUSTER_NOTE if clustered else "",
+        "stock_hint": STOCK_HINT_PREFIX if stock_hint else "",
+    })
+
+# 제목의 종목 언급 순위
+def rank_mentioned_stocks(titles: list) -> list:
+    """종목 사전(Aho-Corasick)으로 제목의 종목 언급 횟수를 세고 상위 종목 출력"""
+    try:
+        start = time.perf_counter()
+        ranked = get_stock_extractor().rank(titles)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if ranked:
+            print(f"🏷️ 종목 언급 {len(ranked)}개 ({elapsed_ms:.1f}ms): {format_stock_hint(ranked, limit=10)}")
+        return ranked
+    except Exception as e:
+        print(f"⚠️ 종목 언급 추출 실패: {e}")
+        return []
+
+# OpenAI를 사용한 뉴스 제목들 요약 및 추천 종목 추출
 def get_summary_and_stocks_with_openai(titles: list) -> tuple[str, str]:
-    """OpenAI를 사용하여 뉴스 제목들을 요약하고 추천 종목 10개를 추출 (하나의 API 요청, 캐싱 적용)"""
-    if not openai_client:
+    """OpenAI를 사용하여 뉴스 제목들을 요약하고 추천 종목 10개를 추출 (제목이 많으면 맵-리듀스, 영구 캐시 적용)"""
+    # 제목에서 직접 찾은 종목 언급 순위 (LLM 없이도 topstock 생성 가능)
+    ranked_stocks = rank_mentioned_stocks(titles)
+    local_topstock = format_topstock(ranked_stocks)
+    stock_hint = format_stock_hint(ranked_stocks) if SUMMARY_STOCK_HINT else ""
+    
+    if not get_openai_client():
         print("⚠️ OpenAI API 키가 설정되지 않았습니다.")
         # 제목들을 간단히 결합 (500자 제한)
         combined = " | ".join(titles)
         summary = combined[:500] if len(combined) > 500 else combined
-        return summary, ""
+        return summary, local_topstock
     
     if not titles:
         return "", ""
     
-    # 캐시 키 생성 (제목들의 해시값)
-    cache_key = hashlib.md5("|".join(titles[:10]).encode('utf-8')).hexdigest()
+    # 비슷한 제목을 토픽별 대표 제목 + 기사 수로 압축
+    prompt_titles = titles
+    if SUMMARY_CLUSTER:
+        cluster_start = time.perf_counter()
+        prompt_titles = cluster_prompt_titles(titles)
+        before_chars = sum(len(title) for title in titles)
+        after_chars = sum(len(title) for title in prompt_titles)
+        print(f"🗂️ 제목 클러스터링: {len(titles)}개 → 토픽 {len(prompt_titles)}개 (제목 {before_chars}자 → {after_chars}자, {(time.perf_counter() - cluster_start) * 1000:.1f}ms)")
     
-    # 캐시에 있으면 반환
-    if cache_key in _summary_and_stocks_cache:
-        print("📋 캐시에서 요약 및 추천 종목 데이터를 가져옵니다.")
-        cached_result = _summary_and_stocks_cache[cache_key]
-        return cached_result["summary"], cached_result["topstock"]
+    map_reduce = use_map_reduce(prompt_titles)
+    messages = None if map_reduce else build_summary_messages(prompt_titles, clustered=SUMMARY_CLUSTER, stock_hint=stock_hint)
+    signature = title_signature(titles)
+    variant = summary_cache_variant(map_reduce, clustered=SUMMARY_CLUSTER, stock_hint=bool(stock_hint))
+    
+    # 캐시 키 생성 (모델 + 프롬프트 입력 전체의 해시값)
+    if map_reduce:
+        cache_key = make_cache_key(SUMMARY_MODEL, map_reduce_cache_payload(prompt_titles, clustered=SUMMARY_CLUSTER, stock_hint=stock_hint))
+    else:
+        cache_key = make_cache_key(SUMMARY_MODEL, messages)
     
+    # 캐시 조회 (실패하더라도 요약은 계속 진행)
     try:
-        # 모든 제목을 하나의 문자열로 결합
-        titles_text = "\n".join([f"- {title}" for title in titles[:50]])  # 최대 50개까지만
-        if len(titles) > 50:
-            titles_text += f"\n... 외 {len(titles) - 50}개 뉴스"
-        
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 뉴스 분석 및 주식 투자 전문가입니다. 주어진 뉴스 제목들을 분석하여 다음 두 가지를 수행해주세요:\n1. 뉴스 제목들을 종합하여 500자 이내로 요약\n2. 뉴스 내용을 바탕으로 투자 가치가 높은 한국 주식 종목 10개를 추천\n\n응답 형식:\n[요약]\n(여기에 500자 이내 요약)\n\n[추천종목]\n종목1, 종목2, 종목3, 종목4, 종목5, 종목6, 종목7, 종목8, 종목9, 종목10"
-                },
-                {
-                    "role": "user",
-                    "content": f"다음 뉴스 제목들을 분석해주세요:\n\n{titles_text}\n\n위 뉴스들을 바탕으로:\n1. 500자 이내로 요약\n2. 투자 가치가 높은 한국 주식 종목 10개 추천 (종목명 또는 종목코드 6자리, 쉼표로 구분)\n\n[요약]과 [추천종목] 형식으로 답변해주세요."
-                }
-            ],
-            max_tokens=500,
-            temperature=0.7
-        )
-        
-        result_text = response.choices[0].message.content.strip()
-        
-        # 결과 파싱
-        summary = ""
-        topstock = ""
-        
-        # [요약] 섹션 추출
-        if "[요약]" in result_text:
-            summary_part = result_text.split("[요약]")[1]
-            if "[추천종목]" in summary_part:
-                summary = summary_part.split("[추천종목]")[0].strip()
-            else:
-                summary = summary_part.strip()
+        cached = summary_cache.get(cache_key)
+        if cached is None:
+            cached = summary_cache.find_similar(SUMMARY_MODEL, signature, variant=variant)
+            if cached:
+                print(f"📋 제목 구성이 거의 같은 이전 요약을 재사용합니다. (유사도 {cached['similarity']})")
+        elif cached["failed"]:
+            print("📋 최근 요약 요청이 실패하여 기본 요약을 사용합니다.")
+            return fallback_summary(titles)[0], local_topstock
         else:
-            # [요약] 태그가 없으면 첫 부분을 요약으로 간주
-            if "[추천종목]" in result_text:
-                summary = result_text.split("[추천종목]")[0].strip()
-            else:
-                summary = result_text[:500]
-        
-        # [추천종목] 섹션 추출
-        if "[추천종목]" in result_text:
-            topstock_part = result_text.split("[추천종목]")[1].strip()
-            # 첫 줄만 가져오기 (추가 설명 제거)
-            topstock = topstock_part.split("\n")[0].strip()
+            print("📋 캐시에서 요약 및 추천 종목 데이터를 가져옵니다.")
+        if cached:
+            return cached["result"]["summary"], cached["result"]["topstock"]
+    except Exception as e:
+        print(f"⚠️ 요약 캐시 조회 실패: {e}")
+    
+    try:
+        if map_reduce:
+            result_text = summarize_titles_map_reduce(prompt_titles, clustered=SUMMARY_CLUSTER, stock_hint=stock_hint)
         else:
-            # [추천종목] 태그가 없으면 마지막 부분을 추천 종목으로 간주
-            lines = result_text.split("\n")
-            for line in reversed(lines):
-                if "," in line and len(line.strip()) > 10:
-                    topstock = line.strip()
-                    break
+            response = get_openai_client().chat.completions.create(
+                model=SUMMARY_MODEL,
+                messages=messages,
+                max_tokens=500,
+                temperature=0.7
+            )
+            result_text = response.choices[0].message.content.strip()
         
-        # 500자 제한
-        if len(summary) > 500:
-            summary = summary[:500]
-        
-        # 255자 제한 (VARCHAR(255))
-        if len(topstock) > 255:
-            topstock = topstock[:255]
+        summary, topstock = parse_summary_response(result_text)
         
         # 캐시에 저장
-        _summary_and_stocks_cache[cache_key] = {
-            "summary": summary,
-            "topstock": topstock
-        }
-        print("💾 요약 및 추천 종목 데이터를 캐시에 저장했습니다.")
+        try:
+            summary_cache.put(cache_key, SUMMARY_MODEL, {"summary": summary, "topstock": topstock}, signature=signature, variant=variant)
+            print("💾 요약 및 추천 종목 데이터를 캐시에 저장했습니다.")
+        except Exception as e:
+            print(f"⚠️ 요약 캐시 저장 실패: {e}")
         
         return summary, topstock
         
@@ -719,25 +903,49 @@ def get_summary_and_stocks_with_openai(titles: list) -> tuple[str, str]:
         import traceback
         traceback.print_exc()
         
-        # 실패 시 기본값 반환
-        combined = " | ".join(titles[:10])  # 최대 10개만
-        if len(titles) > 10:
-            combined += f" ... 외 {len(titles) - 10}개"
-        summary = combined[:500] if len(combined) > 500 else combined
-        topstock = ""
+        # 실패 시 기본값 반환 (추천 종목은 제목 언급 순위로 대체)
+        summary, _ = fallback_summary(titles)
+        topstock = local_topstock
         
-        # 실패한 결과도 캐시에 저장 (재시도 방지)
-        _summary_and_stocks_cache[cache_key] = {
-            "summary": summary,
-            "topstock": topstock
-        }
+        # 실패 결과는 짧은 기간만 캐시 (같은 실행 직후의 반복 호출 방지, 다음 실행에서는 재시도)
+        try:
+            summary_cache.put(cache_key, SUMMARY_MODEL, {"summary": summary, "topstock": topstock}, failed=True)
+        except Exception:
+            pass
         
         return summary, topstock
 
+# 전송 대기 중인 Supabase 레코드 아웃박스
+news_outbox = Outbox()
+
+# 아웃박스 레코드 묶음을 Supabase에 upsert
+def send_news_batch(rows: list) -> None:
+    """cont_date 기준 멱등 upsert로 여러 레코드를 한 번에 전송 (실패 시 예외 발생)"""
+    get_supabase_client().table("daily_new").upsert(rows, on_conflict="cont_date").execute()
+
+# 아웃박스 일괄 전송
+def flush_news_outbox() -> dict:
+    """아웃박스의 대기 레코드를 배치 upsert로 전송하고 결과 출력"""
+    if not get_supabase_client():
+        print("⚠️ Supabase 연결 정보가 설정되지 않아 아웃박스 전송을 건너뜁니다.")
+        pending = news_outbox.pending_count()
+        return {"sent": 0, "failed": 0, "dead": 0, "batches": 0, "pending": pending}
+    
+    stats = flush_outbox(news_outbox, send_news_batch)
+    if stats["sent"]:
+        print(f"✅ Supabase 전송 완료: {stats['sent']}개 레코드 ({stats['batches']}개 배치)")
+    if stats["failed"]:
+        print(f"⚠️ Supabase 전송 실패: {stats['failed']}개 레코드는 아웃박스에 보관 후 다음 실행에서 재전송합니다.")
+    if stats["dead"]:
+        print(f"🪦 Supabase가 반복해서 거부한 {stats['dead']}개 레코드는 재전송을 멈춥니다. (아웃박스에 dead 상태로 보관)")
+    if stats["pending"]:
+        print(f"📮 아웃박스 대기: {stats['pending']}개")
+    return stats
+
 # Supabase에 뉴스 데이터 저장
-def save_news_to_supabase(news_list: list, filename_without_ext: str) -> bool:
-    """뉴스 데이터를 Supabase daily_new 테이블에 저장 (1개의 레코드로 저장)"""
-    if not supabase_client:
+def save_news_to_supabase(news_list: list, filename_without_ext: str, summary_result: tuple = None) -> bool:
+    """뉴스 데이터를 아웃박스에 기록하고 Supabase daily_new 테이블로 전송 (1개의 레코드로 저장, summary_result가 있으면 요약 생략)"""
+    if not get_supabase_client():
         print("⚠️ Supabase 연결 정보가 설정되지 않았습니다.")
         return False
     
@@ -755,10 +963,14 @@ def save_news_to_supabase(news_list: list, filename_without_ext: str) -> bool:
             print("⚠️ 제목이 있는 뉴스가 없습니다.")
             return False
         
-        print(f"📝 총 {len(titles)}개의 뉴스 제목을 분석 중... (요약 + 추천 종목)")
-        
-        # OpenAI로 모든 제목들을 종합하여 요약 및 추천 종목 추출 (하나의 API 요청)
-        summary, topstock = get_summary_and_stocks_with_openai(titles)
+        if summary_result is not None:
+            # 파이프라인에서 미리 계산한 요약 사용
+            summary, topstock = summary_result
+        else:
+            print(f"📝 총 {len(titles)}개의 뉴스 제목을 분석 중... (요약 + 추천 종목)")
+            
+            # OpenAI로 모든 제목들을 종합하여 요약 및 추천 종목 추출
+            summary, topstock = get_summary_and_stocks_with_openai(titles)
         
         print(f"✅ 요약 완료: {len(summary)}자")
         if topstock:
@@ -780,17 +992,12 @@ def save_news_to_supabase(news_list: list, filename_without_ext: str) -> bool:
         print(f"   - cont_date: {filename_without_ext}")
         print(f"   - topstock: {topstock}")
         
-        # Supabase에 데이터 삽입 (1개의 레코드)
-        result = supabase_client.table("daily_new").insert(insert_data).execute()
+        # 아웃박스에 먼저 기록한 뒤 일괄 전송 (실패해도 다음 실행에서 재전송)
+        news_outbox.enqueue(filename_without_ext, insert_data)
+        print(f"📮 아웃박스에 기록 완료 (cont_date: {filename_without_ext})")
         
-        # 결과 확인
-        if result.data:
-            print(f"✅ Supabase 저장 완료: 1개 레코드 저장 성공")
-            print(f"   저장된 ID: {result.data[0].get('id', 'N/A')}")
-            return True
-        else:
-            print(f"⚠️ Supabase 저장 결과가 비어있습니다.")
-            return False
+        stats = flush_news_outbox()
+        return stats["failed"] == 0 and stats["pending"] == 0
         
     except Exception as e:
         print(f"❌ Supabase 저장 중 오류 발생: {e}")
@@ -800,6 +1007,232 @@ def save_news_to_supabase(news_list: list, filename_without_ext: str) -> bool:
         traceback.print_exc()
         return False
 
+# 일자별 압축 아카이브 (처음 보는 기사만 추가, 수개월 보관)
+news_archive = NewsArchive()
+
+# 수집 결과를 아카이브에 추가
+def archive_news(news_list, date):
+    """새 기사만 일자별 gzip NDJSON 세그먼트에 추가하고 결과 출력 (새 기사 키 목록 반환, 실패 시 None)"""
+    try:
+        new_keys = news_archive.append_new(date, news_list)
+        print(f"🗄️ 아카이브 추가: 새 기사 {len(new_keys)}개 (중복 {len(news_list) - len(new_keys)}개 제외) → {news_archive.segment_path(date)}")
+        return new_keys
+    except Exception as e:
+        print(f"⚠️ 아카이브 추가 실패: {e}")
+        return None
+
+# 뉴스 검색 색인 갱신
+def update_search_index():
+    """아카이브에 새로 추가된 기사를 검색 색인에 반영 (본문 캐시가 있으면 본문도 색인)"""
+    try:
+        added = NewsSearchIndex(archive=news_archive).refresh(force=True)
+        print(f"🔎 검색 색인 갱신: 새 기사 {added}개")
+        return added
+    except Exception as e:
+        print(f"⚠️ 검색 색인 갱신 실패: {e}")
+        return 0
+
+# 키워드 트렌드 집계 갱신
+def update_trends():
+    """아카이브에 새로 추가된 기사의 단어·종목 언급 수를 날짜별 집계표에 더함"""
+    try:
+        added = TrendCounter(archive=news_archive).refresh(force=True)
+        print(f"📈 트렌드 집계 갱신: 새 기사 {added}개")
+        return added
+    except Exception as e:
+        print(f"⚠️ 트렌드 집계 갱신 실패: {e}")
+        return 0
+
+# 유사 중복 제목 서명 색인 (다른 실행·다른 날의 반복 기사 탐지)
+duplicate_index = DuplicateIndex()
+
+# 유사 중복 제목에 중복그룹 ID 부여
+def tag_near_duplicates(news_list, date):
+    """각 뉴스에 "중복그룹" 필드를 붙이고 결과 출력 (실패해도 수집은 계속)"""
+    try:
+        stats = assign_duplicate_groups(news_list, date, duplicate_index)
+        print(f"🔁 유사 중복 탐지: {stats['items']}개 → {stats['groups']}개 그룹 (중복 {stats['duplicates']}개, 이전 수집과 이어진 그룹 {stats['cross_run']}개)")
+        return stats
+    except Exception as e:
+        print(f"⚠️ 유사 중복 탐지 실패: {e}")
+        return None
+
+# 파이프라인 단계 실행 및 소요 시간 기록
+def run_stage(stage_timings, name, func, *args, **kwargs):
+    """함수를 실행하고 단계 이름별 소요 시간을 stage_timings에 기록"""
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        stage_timings[name] = time.perf_counter() - start
+
+# 단계별 소요 시간 출력
+def print_stage_timings(stage_timings, total_elapsed):
+    """단계별 소요 시간과 전체 실행 시간 출력"""
+    if not stage_timings:
+        return
+    print("\n⏱️ 단계별 소요 시간:")
+    for name, elapsed in stage_timings.items():
+        print(f"   - {name}: {elapsed:.2f}초")
+    longest = max(stage_timings.values())
+    print(f"   - 전체: {total_elapsed:.2f}초 (단계 합계 {sum(stage_timings.values()):.2f}초, 최장 단계 {longest:.2f}초)")
+
+# 실행 기록 파일 보관 일수 (기사는 아카이브에 보관)
+NEWS_RETENTION_DAYS = int(os.getenv("NEWS_RETENTION_DAYS", "5"))
+
+# 백필 진행 상황 파일 (완료한 날짜 기록, 중단 후 재실행 시 이어서 진행)
+BACKFILL_PROGRESS_PATH = os.path.join("data", "cache", "backfill_progress.json")
+
+# 백필 날짜 목록 생성
+def backfill_dates(start_date, end_date):
+    """시작일부터 종료일까지 (양 끝 포함) YYYY-MM-DD 문자열 목록 반환"""
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    if start > end:
+        start, end = end, start
+    return [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end - start).days + 1)]
+
+# 백필 진행 상황 읽기
+def load_backfill_progress(path=BACKFILL_PROGRESS_PATH):
+    """완료한 날짜별 결과 {날짜: {'count', 'added', 'finished_at'}} 반환"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("dates", {})
+    except (OSError, ValueError):
+        return {}
+
+# 백필 진행 상황 저장
+def save_backfill_progress(progress, path=BACKFILL_PROGRESS_PATH):
+    """진행 상황을 임시 파일에 쓴 뒤 교체 (중단되어도 파일이 깨지지 않도록)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"dates": progress}, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+# 백필 작업 프로세스 초기화
+def init_backfill_worker(shared_rate_limiter):
+    """작업 프로세스의 요청 속도 제한기를 프로세스 간 공유 제한기로 교체"""
+    global news_rate_limiter
+    news_rate_limiter = shared_rate_limiter
+
+# 하루치 뉴스 백필
+def backfill_one_date(date):
+    """
+    작업 프로세스에서 한 날짜의 모든 페이지를 수집해 아카이브에만 추가
+    (실행 기록 파일은 만들지 않으므로 실행 기록 보관 기간과 관계없이 아카이브 보관 기간 동안 남음)
+
+    Returns:
+        (날짜, 뉴스 개수, 아카이브에 새로 추가한 기사 수)
+    """
+    # 여러 프로세스가 같은 페이지 캐시 파일을 덮어쓰지 않도록 캐시는 사용하지 않음
+    news_list = fetch_all_pages_news(date=date, use_page_cache=False)
+    if not news_list:
+        # 요청 실패와 구분할 수 없으므로 완료로 기록하지 않고 다음 실행에서 다시 시도
+        raise RuntimeError(f"{date} 뉴스를 가져오지 못했습니다")
+    
+    new_keys = archive_news(news_list, date)
+    if new_keys is None:
+        raise RuntimeError(f"{date} 아카이브 추가 실패")
+    return date, len(news_list), len(new_keys)
+
+# 백필이 끝난 날짜인지 확인
+def is_backfilled(date, progress):
+    """진행 상황 파일에 완료로 기록되어 있고 아카이브에 그 날짜 기사가 실제로 남아 있으면 완료"""
+    return date in progress and news_archive.count(date) > 0
+
+# 날짜 범위 뉴스 백필
+def backfill_news(start_date, end_date, workers=4, force=False, progress_path=BACKFILL_PROGRESS_PATH):
+    """
+    날짜 범위의 뉴스를 여러 프로세스로 나눠 아카이브에 수집
+
+    모든 프로세스가 같은 호스트 속도 제한을 공유하므로 전체 요청 간격은
+    단일 프로세스 실행과 같고, 응답 대기와 HTML 파싱만 병렬로 겹쳐집니다.
+    완료한 날짜는 진행 상황 파일에 기록되지만, 아카이브에서 사라진 날짜는 다시 수집합니다.
+    아카이브 보관 기간보다 오래된 날짜는 다음 정기 수집에서 삭제되므로 건너뜁니다.
+    새로 수집한 날짜가 있으면 끝난 뒤 검색 색인과 트렌드 집계에 반영합니다.
+
+    Args:
+        start_date: 시작 날짜 (YYYY-MM-DD)
+        end_date: 종료 날짜 (YYYY-MM-DD)
+        workers: 작업 프로세스 수
+        force: True면 이미 완료한 날짜도 다시 수집 (아카이브에 이미 있는 기사는 추가되지 않음)
+        progress_path: 진행 상황 파일 경로
+
+    Returns:
+        {'done', 'skipped', 'expired', 'failed', 'news', 'added'} 백필 통계
+    """
+    print("\n" + "="*60)
+    print(f"📚 뉴스 백필 시작: {start_date} ~ {end_date} (작업 프로세스 {workers}개)")
+    print("="*60)
+    
+    dates = backfill_dates(start_date, end_date)
+    cutoff = (datetime.now() - timedelta(days=ARCHIVE_RETENTION_DAYS)).strftime('%Y-%m-%d')
+    expired = [date for date in dates if date < cutoff]
+    dates = [date for date in dates if date >= cutoff]
+    progress = load_backfill_progress(progress_path)
+    pending = [date for date in dates if force or not is_backfilled(date, progress)]
+    stats = {"done": 0, "skipped": len(dates) - len(pending), "expired": len(expired), "failed": 0, "news": 0, "added": 0}
+    if expired:
+        print(f"⚠️ 아카이브 보관 기간({ARCHIVE_RETENTION_DAYS}일)이 지난 {len(expired)}일({expired[0]} ~ {expired[-1]})은 다음 정기 수집에서 삭제되므로 건너뜁니다.")
+    if stats["skipped"]:
+        print(f"⏭️ 이미 아카이브에 완료된 {stats['skipped']}일은 건너뜁니다. (다시 수집하려면 --force)")
+    
+    run_start = time.perf_counter()
+    if pending:
+        shared_rate_limiter = SharedHostRateLimiter(
+            min_interval=news_rate_limiter.min_interval,
+            per_host=news_rate_limiter.per_host,
+        )
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_backfill_worker,
+                                 initargs=(shared_rate_limiter,)) as executor:
+            futures = {executor.submit(backfill_one_date, date): date for date in pending}
+            for future in as_completed(futures):
+                date = futures[future]
+                try:
+                    _, count, added = future.result()
+                except Exception as e:
+                    stats["failed"] += 1
+                    print(f"❌ {date} 백필 실패: {e}")
+                    continue
+                
+                # 날짜 하나가 끝날 때마다 기록 (중단되어도 완료한 날짜는 유지)
+                progress[date] = {
+                    "count": count,
+                    "added": added,
+                    "finished_at": datetime.now().isoformat(),
+                }
+                save_backfill_progress(progress, progress_path)
+                stats["done"] += 1
+                stats["news"] += count
+                stats["added"] += added
+                print(f"✅ {date}: {count}개 (새 기사 {added}개) ({stats['done']}/{len(pending)})")
+    
+    elapsed = time.perf_counter() - run_start
+    print(f"\n📊 백필 통계: 완료 {stats['done']}일 / 건너뜀 {stats['skipped']}일 / 보관 기간 초과 {stats['expired']}일 / 실패 {stats['failed']}일 / 뉴스 {stats['news']}개 (새 기사 {stats['added']}개)")
+    print(f"⏱️ 소요 시간: {elapsed:.2f}초")
+    
+    # 아카이브에 새로 들어간 기사를 검색 색인과 트렌드 집계에 반영
+    if stats["added"]:
+        update_search_index()
+        update_trends()
+    print("="*60 + "\n")
+    return stats
+
+# 명령행 인자 파싱
+def parse_args(argv=None):
+    """명령행 인자 파싱 (인자가 없으면 오늘 뉴스 수집)"""
+    parser = argparse.ArgumentParser(description="네이버 금융 뉴스 데이터 수집")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    backfill_parser = subparsers.add_parser("backfill", help="날짜 범위 뉴스 백필")
+    backfill_parser.add_argument("--from", dest="start_date", required=True, help="시작 날짜 (YYYY-MM-DD)")
+    backfill_parser.add_argument("--to", dest="end_date", default=None, help="종료 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    backfill_parser.add_argument("--workers", type=int, default=4, help="작업 프로세스 수")
+    backfill_parser.add_argument("--force", action="store_true", help="이미 완료한 날짜도 다시 수집")
+    
+    return parser.parse_args(argv)
+
 # 메인 실행 함수
 def main():
     """메인 실행 함수"""
@@ -812,34 +1245,91 @@ def main():
     today_date = get_today_date()
     print(f"📅 날짜: {today_date}")
     
-    # 오래된 파일 삭제 (5일 이상)
+    # 단계별 소요 시간 기록
+    run_start = time.perf_counter()
+    stage_timings = {}
+    
+    # 오래된 실행 기록 삭제 (기본 5일, 기사는 아카이브에 남음)
     print("\n🗑️ 오래된 파일 정리 중...")
-    delete_old_files(data_dir, days=5)
+    delete_old_files(data_dir, days=NEWS_RETENTION_DAYS)
+    duplicate_index.prune()
+    pruned = news_archive.prune(ARCHIVE_RETENTION_DAYS)
+    if pruned:
+        print(f"🗑️ 보관 기간({ARCHIVE_RETENTION_DAYS}일)이 지난 아카이브 {pruned}일치를 삭제했습니다.")
     
     # 오늘 날짜의 모든 페이지에서 뉴스 데이터 가져오기
-    news_list = fetch_all_pages_news(date=today_date)
+    news_list = run_stage(stage_timings, "수집", fetch_all_pages_news, date=today_date)
     
-    if news_list:
+    # 오늘 마지막 스냅샷과 내용이 같으면 파일 저장/업로드 없이 종료
+    data_hash = calculate_data_hash(news_list) if news_list else None
+    snapshot_state = SnapshotState().load()
+    
+    if news_list and snapshot_state.is_unchanged(today_date, data_hash):
+        latest = snapshot_state.latest(today_date)
+        print(f"\nℹ️ 마지막 스냅샷({latest['file']})과 내용이 같아 저장과 업로드를 건너뜁니다. (해시 {data_hash[:12]})")
+        
+        # 이전 실행에서 전송하지 못한 레코드만 재전송
+        if os.path.exists(news_outbox.path) and news_outbox.pending_count():
+            flush_news_outbox()
+    elif news_list:
         # 새 파일명 생성 (날짜_번호 형식)
         filepath = generate_filename(data_dir, today_date)
         filename_without_ext = os.path.basename(filepath).replace('.json', '')  # 확장자 제거
         print(f"📝 파일명: {os.path.basename(filepath)}")
         
-        # JSON 파일로 데이터 저장
-        if save_data_to_json(news_list, filepath):
-            print(f"✅ {len(news_list)}개의 뉴스 데이터를 JSON 파일로 저장했습니다.")
-        else:
-            print(f"❌ JSON 파일 저장에 실패했습니다.")
+        # 아카이브는 중복그룹 필드가 필요 없으므로 표시 전 항목을 복사해 넘김
+        archive_list = [dict(news) for news in news_list]
         
-        # Supabase에 데이터 저장 (파일명 형식으로 저장: 예: "2026-01-28_01")
-        if save_news_to_supabase(news_list, filename_without_ext):
-            print(f"✅ {len(news_list)}개의 뉴스 데이터를 Supabase에 저장했습니다.")
-        else:
-            print(f"⚠️ Supabase 저장을 건너뜁니다.")
+        def archive_and_record():
+            """새 기사를 아카이브에 추가한 뒤 실행 기록 저장 (아카이브 실패 시 기록하지 않음)"""
+            new_keys = run_stage(stage_timings, "아카이브", archive_news, archive_list, today_date)
+            if new_keys is None:
+                return False
+            return run_stage(stage_timings, "실행 기록", save_run_record, filepath, today_date, data_hash, len(news_list), new_keys)
+        
+        # 수집 이후 단계는 서로 독립적이므로 동시에 시작
+        # (아카이브 후 실행 기록 / 중복 탐지 / 본문 수집 / 요약은 병렬, 업로드는 요약과 중복 탐지를 기다림)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            record_future = executor.submit(archive_and_record)
+            tag_future = executor.submit(run_stage, stage_timings, "중복 탐지", tag_near_duplicates, news_list, today_date)
+            
+            if os.getenv("NEWS_FETCH_BODIES", "1") != "0":
+                # 기사 본문 일괄 수집 (이미 캐시된 기사는 건너뜀)
+                executor.submit(run_stage, stage_timings, "본문 수집", fetch_news_bodies, news_list)
+            
+            summary_future = None
+            if get_supabase_client():
+                titles = [news.get("제목", "") for news in news_list if news.get("제목")]
+                print(f"📝 총 {len(titles)}개의 뉴스 제목을 분석 중... (요약 + 추천 종목)")
+                summary_future = executor.submit(run_stage, stage_timings, "요약", get_summary_and_stocks_with_openai, titles)
+            
+            # Supabase에 데이터 저장 (파일명 형식으로 저장: 예: "2026-01-28_01")
+            summary_result = summary_future.result() if summary_future else None
+            tag_future.result()
+            if run_stage(stage_timings, "업로드", save_news_to_supabase, news_list, filename_without_ext, summary_result):
+                print(f"✅ {len(news_list)}개의 뉴스 데이터를 Supabase에 저장했습니다.")
+            else:
+                print(f"⚠️ Supabase 저장을 건너뜁니다.")
+            
+            if record_future.result():
+                print(f"✅ {len(news_list)}개의 뉴스를 아카이브에 반영하고 실행 기록을 저장했습니다.")
+                snapshot_state.record(today_date, data_hash, filepath, len(news_list))
+            else:
+                print(f"❌ 아카이브 반영 또는 실행 기록 저장에 실패했습니다.")
+        
+        # 아카이브와 본문 수집이 끝난 뒤 검색 색인에 반영
+        run_stage(stage_timings, "검색 색인", update_search_index)
+        run_stage(stage_timings, "트렌드 집계", update_trends)
     else:
         print("⚠️ 뉴스 데이터를 가져올 수 없습니다.")
     
+    print_stage_timings(stage_timings, time.perf_counter() - run_start)
     print("="*60 + "\n")
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.command == "backfill":
+        backfill_news(args.start_date, args.end_date or get_today_date(),
+                      workers=args.workers, force=args.force)
+    else:
+        main()
@@ -0,0 +1 @@
+"""네이버 금융 뉴스 수집 보조 패키지"""
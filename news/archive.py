@@ -0,0 +1,182 @@
+"""
+일자별 뉴스 아카이브
+하루에 하나씩 gzip 압축 NDJSON 세그먼트를 두고, 실행마다 처음 보는 기사만
+새 gzip 멤버로 이어 붙입니다. 작은 인덱스 파일이 기사 키를
+(멤버 오프셋, 멤버 길이, 줄 번호)로 매핑하므로 기사 하나를 읽을 때
+해당 멤버만 풀면 됩니다.
+세그먼트와 인덱스는 저장소에 커밋되어 수개월 보관되며, API는 이를 원본으로
+검색 색인과 트렌드 집계표를 만듭니다.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from news.body_fetcher import article_key_from_link
+
+# 아카이브 기본 위치
+ARCHIVE_DIR = os.path.join("data", "archive")
+
+# 세그먼트 보관 일수
+ARCHIVE_RETENTION_DAYS = 180
+
+
+def news_item_key(item: Dict) -> Optional[str]:
+    """뉴스 항목의 아카이브 키 (기사 ID, 링크가 없으면 제목)"""
+    return article_key_from_link(item.get("링크")) or item.get("제목") or None
+
+
+class NewsArchive:
+    """일자별 gzip NDJSON 세그먼트 + 키 인덱스"""
+
+    def __init__(self, archive_dir: str = ARCHIVE_DIR):
+        self.archive_dir = archive_dir
+
+    def segment_path(self, date: str) -> str:
+        """날짜별 세그먼트 경로 (YYYY-MM-DD.ndjson.gz)"""
+        return os.path.join(self.archive_dir, f"{date}.ndjson.gz")
+
+    def index_path(self, date: str) -> str:
+        """날짜별 인덱스 경로 (YYYY-MM-DD.idx.json)"""
+        return os.path.join(self.archive_dir, f"{date}.idx.json")
+
+    def load_index(self, date: str) -> Dict:
+        """
+        인덱스 읽기
+
+        Returns:
+            {'size': 인덱스에 반영된 세그먼트 크기, 'keys': {키: [오프셋, 길이, 줄 번호]}}
+        """
+        try:
+            with open(self.index_path(date), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            size = index.get('size', 0)
+            # 세그먼트가 지워졌거나 인덱스보다 짧으면 인덱스를 믿을 수 없으므로 빈 인덱스로 취급
+            if size and os.path.getsize(self.segment_path(date)) < size:
+                return {'size': 0, 'keys': {}}
+            return {'size': size, 'keys': index.get('keys', {})}
+        except (OSError, ValueError):
+            return {'size': 0, 'keys': {}}
+
+    def _save_index(self, date: str, index: Dict) -> None:
+        """인덱스를 임시 파일에 쓴 뒤 교체"""
+        path = self.index_path(date)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def append(self, date: str, news_list: List[Dict]) -> int:
+        """처음 보는 기사만 세그먼트에 추가하고 새로 추가한 기사 수 반환"""
+        return len(self.append_new(date, news_list))
+
+    def append_new(self, date: str, news_list: List[Dict]) -> List[str]:
+        """
+        처음 보는 기사만 새 gzip 멤버로 세그먼트에 추가
+
+        Args:
+            date: 기사 날짜 (YYYY-MM-DD)
+            news_list: 이번 실행에서 수집한 뉴스 목록
+
+        Returns:
+            새로 추가한 기사 키 목록 (추가된 순서)
+        """
+        index = self.load_index(date)
+        keys = index['keys']
+
+        new_records = []
+        for item in news_list:
+            key = news_item_key(item)
+            if not key or key in keys:
+                continue
+            keys[key] = None  # 같은 실행 안의 중복 방지용 자리표시
+            new_records.append({**item, 'key': key})
+
+        if not new_records:
+            return []
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in new_records)
+        member = gzip.compress(lines.encode('utf-8'), mtime=0)
+
+        segment = self.segment_path(date)
+        with open(segment, 'ab') as f:
+            # 인덱스에 반영되지 않은 꼬리(이전 실행 중단 흔적)는 잘라냄
+            if f.tell() != index['size']:
+                f.truncate(index['size'])
+                f.seek(index['size'])
+            offset = f.tell()
+            f.write(member)
+
+        for line_no, record in enumerate(new_records):
+            keys[record['key']] = [offset, len(member), line_no]
+        index['size'] = offset + len(member)
+        self._save_index(date, index)
+        return [record['key'] for record in new_records]
+
+    def get(self, date: str, key: str) -> Optional[Dict]:
+        """기사 하나 읽기 (해당 gzip 멤버만 압축 해제)"""
+        location = self.load_index(date)['keys'].get(key)
+        if not location:
+            return None
+        offset, length, line_no = location
+        with open(self.segment_path(date), 'rb') as f:
+            f.seek(offset)
+            member = f.read(length)
+        lines = gzip.decompress(member).decode('utf-8').splitlines()
+        return json.loads(lines[line_no]) if line_no < len(lines) else None
+
+    def iter_day(self, date: str) -> Iterator[Dict]:
+        """하루치 기사를 추가된 순서대로 반환"""
+        size = self.load_index(date)['size']
+        if not size:
+            return
+        with open(self.segment_path(date), 'rb') as f:
+            data = f.read(size)
+        for line in gzip.decompress(data).decode('utf-8').splitlines():
+            if line:
+                yield json.loads(line)
+
+    def read_from(self, date: str, offset: int) -> Tuple[List[Dict], int]:
+        """
+        오프셋 이후에 추가된 기사 읽기 (색인을 이어서 갱신할 때 사용)
+
+        Returns:
+            (기사 리스트, 현재 인덱스에 반영된 세그먼트 크기)
+        """
+        size = self.load_index(date)['size']
+        if size <= offset:
+            return [], size
+        with open(self.segment_path(date), 'rb') as f:
+            f.seek(offset)
+            tail = f.read(size - offset)
+        records = [json.loads(line) for line in gzip.decompress(tail).decode('utf-8').splitlines() if line]
+        return records, size
+
+    def count(self, date: str) -> int:
+        """해당 날짜에 보관된 기사 수 (세그먼트가 없으면 0)"""
+        return len(self.load_index(date)['keys'])
+
+    def dates(self) -> List[str]:
+        """아카이브에 있는 날짜 목록 (오름차순)"""
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(
+            name[:-len(".ndjson.gz")] for name in os.listdir(self.archive_dir)
+            if name.endswith(".ndjson.gz")
+        )
+
+    def prune(self, days: int = ARCHIVE_RETENTION_DAYS) -> int:
+        """보관 기간이 지난 세그먼트와 인덱스 삭제, 삭제한 날짜 수 반환"""
+        cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        removed = 0
+        for date in self.dates():
+            if date >= cutoff:
+                continue
+            for path in (self.segment_path(date), self.index_path(date)):
+                if os.path.exists(path):
+                    os.remove(path)
+            removed += 1
+        return removed
@@ -0,0 +1,309 @@
+"""
+뉴스 기사 본문 일괄 수집
+새 기사들의 본문을 호스트 속도 제한 안에서 동시에 가져오고,
+기사 ID 기준의 디스크 캐시에 저장하여 같은 기사를 다시 내려받지 않습니다.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from bs4 import BeautifulSoup
+
+from utils.rate_limit import HostRateLimiter, news_rate_limiter
+
+# 본문 캐시 기본 위치
+BODY_CACHE_DIR = os.path.join("data", "cache", "bodies")
+
+# 본문 후보 선택자 (앞쪽일수록 우선)
+BODY_SELECTORS = [
+    '#dic_area',
+    '#newsct_article',
+    '#articleBodyContents',
+    '#articleBody',
+    '.article_body',
+    '.articleBody',
+    '.news_end_body',
+    '.article_view',
+    '#newsEndContents',
+    '.article_info',
+]
+_BODY_QUERY = ", ".join(BODY_SELECTORS)
+
+# 본문에서 제거할 태그
+_STRIP_TAGS = ["script", "style", "iframe", "noscript"]
+
+# 광고/저작권 문구 키워드 (포함된 문장만 본문에서 제외, AD는 단독 단어일 때만)
+AD_KEYWORDS = ['광고', 'AD', 'Advertisement', '무단전재', '저작권']
+_AD_PATTERN = re.compile('|'.join(
+    rf'(?<![A-Za-z]){keyword}(?![A-Za-z])' if keyword.isascii() else keyword for keyword in AD_KEYWORDS
+))
+
+# 본문 안의 광고/저작권 영역 (통째로 제거)
+AD_SELECTORS = ['.ad', '.ads', '.advertisement', '[class^="ad_"]', '[id^="ad_"]', '.copyright', '.c_text']
+_AD_QUERY = ", ".join(AD_SELECTORS)
+
+# 줄바꿈으로 취급할 태그
+_BLOCK_TAGS = ['p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'blockquote', 'figure', 'table']
+
+# 문장 경계 (마침표·물음표·느낌표 뒤 공백)
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# lxml이 설치되어 있으면 더 빠른 파서 사용
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def article_key_from_link(link: Optional[str]) -> Optional[str]:
+    """
+    뉴스 링크에서 기사 ID 추출
+
+    Args:
+        link: news_read.naver 또는 n.news.naver.com 기사 링크
+
+    Returns:
+        "언론사ID_기사ID" 형식의 키 (추출 실패 시 링크 자체)
+    """
+    if not link:
+        return None
+
+    parsed = urlparse(link)
+    query = parse_qs(parsed.query)
+    office_id = (query.get('office_id') or query.get('oid') or [None])[0]
+    article_id = (query.get('article_id') or query.get('aid') or [None])[0]
+
+    if not (office_id and article_id):
+        # n.news.naver.com/mnews/article/{office_id}/{article_id} 형식
+        parts = [p for p in parsed.path.split('/') if p]
+        if len(parts) >= 2 and parts[-1].isdigit() and parts[-2].isdigit():
+            office_id, article_id = parts[-2], parts[-1]
+
+    if office_id and article_id:
+        return f"{office_id}_{article_id}"
+    return link
+
+
+def article_body_url(link: str) -> str:
+    """본문을 직접 내려받을 수 있는 기사 원문 URL 반환 (리다이렉트 페이지 건너뛰기)"""
+    key = article_key_from_link(link)
+    if key and key != link:
+        office_id, article_id = key.split('_', 1)
+        return f"https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
+    return link
+
+
+def _selector_rank(elem) -> int:
+    """본문 후보 요소가 어느 선택자에 해당하는지 우선순위 반환"""
+    elem_id = elem.get('id')
+    classes = elem.get('class') or []
+    for rank, selector in enumerate(BODY_SELECTORS):
+        name = selector[1:]
+        if selector[0] == '#' and elem_id == name:
+            return rank
+        if selector[0] == '.' and name in classes:
+            return rank
+    return len(BODY_SELECTORS)
+
+
+def _clean_text(elem) -> str:
+    """요소에서 스크립트와 광고 영역을 제거하고 광고/저작권 문장을 뺀 본문 텍스트 반환"""
+    for tag in elem(_STRIP_TAGS):
+        tag.decompose()
+    for tag in elem.select(_AD_QUERY):
+        tag.decompose()
+    for br in elem.find_all('br'):
+        br.replace_with('\n')
+    for block in elem.find_all(_BLOCK_TAGS):
+        block.insert_before('\n')
+        block.insert_after('\n')
+    return _filter_ad_lines(elem.get_text(separator=' '))
+
+
+def _filter_ad_lines(content: str) -> str:
+    """줄마다 광고/저작권 문구가 들어간 문장을 빼고, 남은 내용이 10자 이하인 줄은 제거한 뒤 한 줄로 합침"""
+    cleaned_lines = []
+    for line in content.split('\n'):
+        sentences = (' '.join(sentence.split()) for sentence in _SENTENCE_SPLIT.split(line))
+        line = ' '.join(sentence for sentence in sentences if sentence and not _AD_PATTERN.search(sentence))
+        if len(line) > 10:
+            cleaned_lines.append(line)
+    return ' '.join(cleaned_lines)
+
+
+def extract_article_body(html: str) -> Optional[str]:
+    """
+    기사 HTML에서 본문 텍스트 추출
+
+    모든 후보 선택자를 한 번의 CSS 질의로 찾은 뒤 우선순위대로 확인합니다.
+
+    Args:
+        html: 기사 페이지 HTML
+
+    Returns:
+        본문 텍스트 (광고/저작권 문구 제외 후 50자 이하이면 None)
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    content = None
+    for elem in sorted(soup.select(_BODY_QUERY), key=_selector_rank):
+        content = _clean_text(elem)
+        if content and len(content) > 50:  # 최소 50자 이상
+            break
+
+    # 본문을 찾지 못한 경우, 일반적인 본문 태그 찾기
+    if not content or len(content) < 50:
+        content_elem = soup.find('div', id=lambda x: x and 'body' in str(x).lower())
+        if not content_elem:
+            content_elem = soup.find('article')
+        if not content_elem:
+            content_elem = soup.find('div', class_=lambda x: x and 'article' in str(x).lower())
+        if content_elem:
+            content = _clean_text(content_elem)
+
+    return content if content and len(content) > 50 else None
+
+
+class BodyCache:
+    """기사 ID를 해시한 경로에 본문을 저장하는 디스크 캐시"""
+
+    def __init__(self, cache_dir: str = BODY_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def path_for(self, article_key: str) -> str:
+        """기사 키에 해당하는 캐시 파일 경로 (sha1 앞 2자리로 디렉토리 분산)"""
+        digest = hashlib.sha1(article_key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.txt")
+
+    def get(self, article_key: str) -> Optional[str]:
+        """캐시된 본문 반환 (없으면 None)"""
+        try:
+            with open(self.path_for(article_key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def contains(self, article_key: str) -> bool:
+        """캐시 존재 여부"""
+        return os.path.exists(self.path_for(article_key))
+
+    def put(self, article_key: str, body: str) -> None:
+        """본문을 캐시에 원자적으로 저장"""
+        path = self.path_for(article_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+
+# 스레드별 HTTP 세션 (연결 재사용)
+_thread_local = threading.local()
+
+
+def _get_session(headers: Optional[Dict] = None) -> requests.Session:
+    """현재 스레드 전용 requests 세션 반환"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        if headers:
+            session.headers.update(headers)
+        _thread_local.session = session
+    return session
+
+
+def fetch_article_body(link: str, headers: Optional[Dict] = None,
+                       rate_limiter: Optional[HostRateLimiter] = None) -> Optional[str]:
+    """
+    기사 하나의 본문을 내려받아 추출
+
+    Args:
+        link: 기사 링크
+        headers: 요청 헤더
+        rate_limiter: 호스트 속도 제한기
+
+    Returns:
+        본문 텍스트 또는 None
+    """
+    url = article_body_url(link)
+    limiter = rate_limiter or news_rate_limiter
+    try:
+        limiter.wait(url)
+        response = _get_session(headers).get(url, timeout=10)
+        response.raise_for_status()
+        if urlparse(url).netloc == 'finance.naver.com':
+            response.encoding = 'euc-kr'
+        return extract_article_body(response.text)
+    except Exception:
+        return None
+
+
+def fetch_article_bodies(news_list: List[Dict], headers: Optional[Dict] = None,
+                         cache: Optional[BodyCache] = None, max_workers: int = 4,
+                         rate_limiter: Optional[HostRateLimiter] = None) -> Dict:
+    """
+    뉴스 목록의 기사 본문을 일괄 수집 (캐시에 없는 기사만 동시 요청)
+
+    Args:
+        news_list: "링크" 키를 가진 뉴스 딕셔너리 리스트
+        headers: 요청 헤더
+        cache: 본문 캐시 (기본: data/cache/bodies)
+        max_workers: 동시 요청 수
+        rate_limiter: 호스트 속도 제한기
+
+    Returns:
+        {'bodies': {기사키: 본문}, 'stats': 수집 통계}
+    """
+    cache = cache or BodyCache()
+    start = time.perf_counter()
+
+    bodies = {}
+    pending = {}
+    for news in news_list:
+        key = article_key_from_link(news.get("링크"))
+        if not key or key in bodies or key in pending:
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            bodies[key] = cached
+        else:
+            pending[key] = news["링크"]
+
+    cache_hits = len(bodies)
+    fetched = 0
+    failed = 0
+
+    if pending:
+        def _fetch(item):
+            key, link = item
+            return key, fetch_article_body(link, headers=headers, rate_limiter=rate_limiter)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for key, body in executor.map(_fetch, pending.items()):
+                if body:
+                    cache.put(key, body)
+                    bodies[key] = body
+                    fetched += 1
+                else:
+                    failed += 1
+
+    elapsed = time.perf_counter() - start
+    total = cache_hits + len(pending)
+    stats = {
+        'total': total,
+        'cache_hits': cache_hits,
+        'fetched': fetched,
+        'failed': failed,
+        'elapsed': round(elapsed, 3),
+        'hit_rate': round(cache_hits / total * 100, 1) if total else 0.0,
+        'fetch_per_sec': round(fetched / elapsed, 2) if elapsed > 0 and fetched else 0.0,
+    }
+    return {'bodies': bodies, 'stats': stats}
@@ -0,0 +1,161 @@
+"""
+뉴스 제목 로컬 클러스터링
+문자 n-gram TF-IDF 희소 벡터와 역색인 기반 코사인 유사도로
+같은 이슈를 다루는 제목들을 하나의 토픽으로 묶습니다.
+토픽 중심(centroid)과 비교하므로 표현이 다른 제목도 같은 이슈면 모이며,
+하루 약 200개 제목이 대표 제목 기준 3배 이상 줄어드는 것을 기준으로 임계값을 정했습니다.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+# 같은 토픽으로 묶을 토픽 중심과의 최소 코사인 유사도
+DEFAULT_THRESHOLD = 0.09
+
+# 대표 제목 후보 (중심과의 유사도가 최고값의 이 비율 이상인 제목 중 가장 짧은 제목)
+REPRESENTATIVE_RATIO = 0.7
+
+# 문자 n-gram 길이
+NGRAM_SIZES = (2, 3)
+
+# 제목 앞뒤의 [속보], (종합) 같은 태그
+_TAG_PATTERN = re.compile(r'\[[^\]]*\]|\([^)]*\)|【[^】]*】|<[^>]*>')
+
+# 한글/영문/숫자 외 문자
+_NON_WORD_PATTERN = re.compile(r'[^0-9a-zA-Z가-힣]+')
+
+
+def normalize_title(title: str) -> str:
+    """태그와 문장부호를 제거한 비교용 제목"""
+    text = _TAG_PATTERN.sub(' ', title or '')
+    text = _NON_WORD_PATTERN.sub(' ', text).lower()
+    return ' '.join(text.split())
+
+
+def char_ngrams(text: str, sizes=NGRAM_SIZES) -> Counter:
+    """단어 경계를 넘지 않는 문자 n-gram 빈도"""
+    grams = Counter()
+    for word in text.split():
+        for n in sizes:
+            if len(word) < n:
+                continue
+            for i in range(len(word) - n + 1):
+                grams[word[i:i + n]] += 1
+    return grams
+
+
+def tfidf_vectors(titles: List[str]) -> List[Dict[str, float]]:
+    """
+    제목 목록을 L2 정규화된 TF-IDF 희소 벡터로 변환
+
+    Returns:
+        {n-gram: 가중치} 딕셔너리 리스트
+    """
+    counts = [char_ngrams(normalize_title(title)) for title in titles]
+    doc_freq = Counter()
+    for grams in counts:
+        doc_freq.update(grams.keys())
+
+    total = len(titles)
+    idf = {gram: math.log((1 + total) / (1 + df)) + 1.0 for gram, df in doc_freq.items()}
+
+    vectors = []
+    for grams in counts:
+        vector = {gram: (1.0 + math.log(tf)) * idf[gram] for gram, tf in grams.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        vectors.append({gram: w / norm for gram, w in vector.items()})
+    return vectors
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    """L2 정규화"""
+    norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+    return {gram: w / norm for gram, w in vector.items()}
+
+
+def cluster_titles(titles: List[str], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    제목들을 토픽 단위로 묶기 (중심 기반 단일 패스 클러스터링)
+
+    제목을 순서대로 보면서, 기존 토픽 중심과의 코사인 유사도가 threshold 이상이면
+    가장 가까운 토픽에 넣고 중심을 갱신하며, 아니면 새 토픽을 만듭니다.
+    유사도는 토픽 중심들의 n-gram 역색인으로 겹치는 항목만 계산합니다.
+    대표 제목은 중심에 가까운 제목 중 가장 짧은 제목입니다.
+
+    Args:
+        titles: 뉴스 제목 리스트
+        threshold: 같은 토픽으로 판단할 최소 유사도
+
+    Returns:
+        [{'representative': 대표 제목, 'size': 기사 수, 'members': [제목 인덱스]}] (기사 수 내림차순)
+    """
+    vectors = tfidf_vectors(titles)
+    postings = defaultdict(dict)  # n-gram -> {클러스터 번호: 중심 벡터 가중치}
+    clusters = []
+
+    for index, vector in enumerate(vectors):
+        scores = defaultdict(float)
+        for gram, weight in vector.items():
+            for cluster_id, centroid_weight in postings.get(gram, {}).items():
+                scores[cluster_id] += weight * centroid_weight
+
+        best_id, best_score = None, 0.0
+        for cluster_id, score in scores.items():
+            if score > best_score:
+                best_id, best_score = cluster_id, score
+
+        if best_id is not None and best_score >= threshold:
+            cluster = clusters[best_id]
+            cluster['members'].append(index)
+            for gram, weight in vector.items():
+                cluster['sum'][gram] = cluster['sum'].get(gram, 0.0) + weight
+        else:
+            best_id = len(clusters)
+            cluster = {'members': [index], 'sum': dict(vector)}
+            clusters.append(cluster)
+
+        # 중심이 바뀌었으므로 이 토픽의 역색인 가중치 갱신
+        cluster['centroid'] = _normalize(cluster['sum'])
+        for gram, weight in cluster['centroid'].items():
+            postings[gram][best_id] = weight
+
+    for cluster in clusters:
+        centroid = cluster.pop('centroid')
+        del cluster['sum']
+        similarity = {
+            index: sum(weight * centroid.get(gram, 0.0) for gram, weight in vectors[index].items())
+            for index in cluster['members']
+        }
+        cutoff = max(similarity.values()) * REPRESENTATIVE_RATIO
+        representative = min(
+            (index for index in cluster['members'] if similarity[index] >= cutoff),
+            key=lambda index: (len(compact_title(titles[index])), -similarity[index]),
+        )
+        cluster['representative'] = titles[representative]
+        cluster['size'] = len(cluster['members'])
+
+    # 기사 수가 많은 토픽부터 (같으면 원래 순서 유지)
+    return sorted(clusters, key=lambda c: (-c['size'], c['members'][0]))
+
+
+def compact_title(title: str) -> str:
+    """프롬프트용으로 [마켓뷰] 같은 태그만 제거한 제목"""
+    return ' '.join(_TAG_PATTERN.sub(' ', title or '').split()) or (title or '')
+
+
+def cluster_prompt_titles(titles: List[str], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    토픽별 대표 제목과 기사 수로 구성한 프롬프트용 제목 리스트
+
+    Returns:
+        ["대표 제목 (N건)", ...] (단독 기사는 제목만)
+    """
+    lines = []
+    for cluster in cluster_titles(titles, threshold):
+        line = compact_title(cluster['representative'])
+        if cluster['size'] > 1:
+            line += f" ({cluster['size']}건)"
+        lines.append(line)
+    return lines
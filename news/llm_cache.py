@@ -0,0 +1,194 @@
+"""
+LLM 요약 결과 영구 캐시
+프롬프트 입력 전체와 모델명의 해시를 키로 SQLite 파일에 결과를 저장합니다.
+제목 집합 유사도로 재사용할 때는 요청 방식과 프롬프트 버전(variant)이 같은 결과만 씁니다.
+TTL과 최대 개수(LRU) 제한이 있으며, 실패 결과는 짧은 기간만 보관합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+# LLM 캐시 기본 위치
+LLM_CACHE_PATH = os.path.join("data", "cache", "llm_cache.sqlite")
+
+# 성공 결과 유효 기간 (초)
+DEFAULT_TTL = 24 * 3600
+
+# 실패 결과 유효 기간 (초) - 같은 실행 직후의 반복 호출만 막음
+FAILURE_TTL = 10 * 60
+
+# 최대 보관 개수 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+DEFAULT_MAX_ENTRIES = 500
+
+# 제목 집합이 이 비율 이상 겹치면 이전 요약 재사용
+DEFAULT_REUSE_SIMILARITY = 0.95
+
+
+def normalize_text(text: str) -> str:
+    """공백을 정리한 비교용 문자열"""
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def make_cache_key(model: str, payload) -> str:
+    """모델명과 프롬프트 입력 전체의 해시로 캐시 키 생성"""
+    if isinstance(payload, str):
+        normalized = normalize_text(payload)
+    else:
+        normalized = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        normalized = normalize_text(normalized)
+    return hashlib.sha256(f"{model}\n{normalized}".encode('utf-8')).hexdigest()
+
+
+def title_signature(titles: Iterable[str]) -> List[str]:
+    """제목 집합 비교용 시그니처 (정규화된 제목 해시 앞 12자리 목록)"""
+    return sorted({
+        hashlib.md5(normalize_text(title).encode('utf-8')).hexdigest()[:12]
+        for title in titles if title
+    })
+
+
+def jaccard(a: Iterable[str], b: Iterable[str]) -> float:
+    """두 집합의 자카드 유사도"""
+    a, b = set(a), set(b)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class LLMResultCache:
+    """TTL + LRU 제한이 있는 SQLite 기반 LLM 결과 캐시"""
+
+    def __init__(self, path: str = LLM_CACHE_PATH, ttl: int = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, failure_ttl: int = FAILURE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.failure_ttl = failure_ttl
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (처음 사용할 때 테이블 생성)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    signature TEXT,
+                    variant TEXT,
+                    failed INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            # variant 열이 없던 이전 캐시 파일 (기존 항목은 유사도 재사용 대상에서 빠짐)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(llm_cache)")}
+            if 'variant' not in columns:
+                self._conn.execute("ALTER TABLE llm_cache ADD COLUMN variant TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시된 결과 조회
+
+        Returns:
+            {'result': 결과 딕셔너리, 'failed': 실패 결과 여부} 또는 None
+        """
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT result, failed, expires_at FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[2] < now:
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            conn.commit()
+            return None
+        conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        conn.commit()
+        return {'result': json.loads(row[0]), 'failed': bool(row[1])}
+
+    def find_similar(self, model: str, signature: List[str], variant: Optional[str] = None,
+                     min_similarity: float = DEFAULT_REUSE_SIMILARITY) -> Optional[Dict]:
+        """
+        제목 집합이 거의 같은 이전 성공 결과 조회 (variant가 같은 결과만)
+
+        Args:
+            model: 모델명
+            signature: title_signature() 결과
+            variant: 요청 방식과 프롬프트 버전 식별자 (저장할 때와 같은 값)
+            min_similarity: 최소 자카드 유사도
+
+        Returns:
+            {'result': 결과, 'similarity': 유사도} 또는 None
+        """
+        conn = self._connect()
+        now = time.time()
+        best = None
+        rows = conn.execute(
+            "SELECT key, result, signature FROM llm_cache "
+            "WHERE model = ? AND variant IS ? AND failed = 0 AND expires_at >= ? AND signature IS NOT NULL "
+            "ORDER BY accessed_at DESC",
+            (model, variant, now),
+        )
+        for key, result, stored_signature in rows:
+            similarity = jaccard(signature, json.loads(stored_signature))
+            if similarity >= min_similarity and (best is None or similarity > best[0]):
+                best = (similarity, key, result)
+        if best is None:
+            return None
+        conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, best[1]))
+        conn.commit()
+        return {'result': json.loads(best[2]), 'similarity': round(best[0], 4)}
+
+    def put(self, key: str, model: str, result: Dict, signature: Optional[List[str]] = None,
+            failed: bool = False, variant: Optional[str] = None) -> None:
+        """결과 저장 (실패 결과는 failure_ttl 동안만 유지, variant는 find_similar에 넘길 값)"""
+        conn = self._connect()
+        now = time.time()
+        ttl = self.failure_ttl if failed else self.ttl
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache "
+            "(key, model, result, signature, variant, failed, created_at, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key, model, json.dumps(result, ensure_ascii=False),
+                json.dumps(signature) if signature is not None else None,
+                variant, int(failed), now, now + ttl, now,
+            ),
+        )
+        self._evict(now)
+        conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """만료 항목 삭제 후 최대 개수를 넘는 항목을 LRU 순서로 삭제"""
+        conn = self._connect()
+        conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+        count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
@@ -0,0 +1,250 @@
+"""
+뉴스 제목 유사 중복 탐지
+정규화한 제목의 문자 3-gram으로 MinHash 서명을 만들고, LSH 밴드 버킷으로
+후보 쌍만 골라 실제 자카드 유사도로 확인합니다. 같은 그룹의 제목에는 같은
+중복그룹 ID를 붙이며, 서명 색인을 SQLite에 보관해 다른 날의 반복 기사도 잡습니다.
+"""
+
+import hashlib
+import os
+import random
+import sqlite3
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from news.archive import news_item_key
+from news.clustering import normalize_title
+
+# 서명 색인 기본 위치
+DUPLICATE_INDEX_PATH = os.path.join("data", "cache", "duplicates.sqlite")
+
+# 같은 그룹으로 볼 최소 자카드 유사도
+DUPLICATE_THRESHOLD = 0.6
+
+# 문자 shingle 길이
+SHINGLE_SIZE = 3
+
+# MinHash 밴드 수 x 밴드당 행 수 (후보가 되는 유사도 기준 약 (1/8)^(1/4) ≈ 0.59)
+LSH_BANDS = 8
+LSH_ROWS = 4
+
+# 색인 보관 일수
+DUPLICATE_RETENTION_DAYS = 30
+
+# 해시 함수 역할을 하는 64비트 XOR 마스크 (순열마다 하나, 실행마다 같은 값)
+_rng = random.Random(20260128)
+_HASH_MASKS = [_rng.getrandbits(64) for _ in range(LSH_BANDS * LSH_ROWS)]
+
+
+def shingles(title: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """공백까지 제거한 정규화 제목의 문자 shingle 집합 (띄어쓰기 차이 무시)"""
+    text = normalize_title(title).replace(' ', '')
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(shingle_set: Set[str]) -> List[int]:
+    """shingle 집합의 MinHash 서명"""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+        for s in shingle_set
+    ]
+    if not hashes:
+        return [0] * len(_HASH_MASKS)
+    # 곱셈 순열 대신 XOR 마스크로 순서를 바꿔 최솟값을 구함 (map으로 C 수준 반복)
+    return [min(map(mask.__xor__, hashes)) for mask in _HASH_MASKS]
+
+
+def band_keys(signature: List[int]) -> List[str]:
+    """LSH 밴드 버킷 키 목록"""
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(repr(rows).encode('ascii'), digest_size=8).hexdigest()
+        keys.append(f"{band}:{digest}")
+    return keys
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """두 shingle 집합의 자카드 유사도"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # 먼저 나온 항목을 대표로 유지
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+class DuplicateIndex:
+    """기사 키별 그룹 ID·정규화 제목과 LSH 밴드 버킷을 보관하는 SQLite 색인"""
+
+    def __init__(self, path: str = DUPLICATE_INDEX_PATH):
+        self.path = path
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (처음 사용할 때 테이블 생성)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS signatures (
+                    key TEXT PRIMARY KEY,
+                    group_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS bands (
+                    band_key TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (band_key, key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_bands_key ON bands (key);
+                """
+            )
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def lookup_keys(self, keys: List[str]) -> Dict[str, str]:
+        """이미 색인된 기사 키 → 그룹 ID"""
+        conn = self._connect()
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT key, group_id FROM signatures WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            found.update(rows)
+        return found
+
+    def candidates(self, bucket_keys: List[str]) -> List[Dict]:
+        """버킷을 공유하는 기존 기사 {'key', 'group_id', 'title'} 목록"""
+        if not bucket_keys:
+            return []
+        rows = self._connect().execute(
+            "SELECT DISTINCT s.key, s.group_id, s.title FROM bands b JOIN signatures s ON s.key = b.key "
+            f"WHERE b.band_key IN ({','.join('?' * len(bucket_keys))})",
+            bucket_keys,
+        ).fetchall()
+        return [{'key': key, 'group_id': group_id, 'title': title} for key, group_id, title in rows]
+
+    def add(self, entries: List[Dict], date: str) -> None:
+        """새 기사 {'key', 'group_id', 'title', 'bands'} 기록"""
+        conn = self._connect()
+        now = time.time()
+        conn.executemany(
+            "INSERT OR IGNORE INTO signatures (key, group_id, title, date, created_at) VALUES (?, ?, ?, ?, ?)",
+            [(e['key'], e['group_id'], e['title'], date, now) for e in entries],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO bands (band_key, key) VALUES (?, ?)",
+            [(band_key, e['key']) for e in entries for band_key in e['bands']],
+        )
+        conn.commit()
+
+    def prune(self, days: int = DUPLICATE_RETENTION_DAYS) -> None:
+        """보관 기간이 지난 서명 삭제"""
+        conn = self._connect()
+        cutoff = time.time() - days * 86400
+        conn.execute("DELETE FROM bands WHERE key IN (SELECT key FROM signatures WHERE created_at < ?)", (cutoff,))
+        conn.execute("DELETE FROM signatures WHERE created_at < ?", (cutoff,))
+        conn.commit()
+
+
+def assign_duplicate_groups(items: List[Dict], date: str, index: Optional[DuplicateIndex] = None,
+                            threshold: float = DUPLICATE_THRESHOLD, field: str = "중복그룹") -> Dict:
+    """
+    뉴스 항목에 중복그룹 ID 부여 (items를 직접 수정)
+
+    같은 실행 안의 유사 제목은 LSH 버킷으로 묶고, 색인이 있으면 이전 실행·다른 날의
+    그룹 ID를 이어받습니다. 새 그룹의 ID는 그룹에서 처음 나온 기사의 키입니다.
+
+    Args:
+        items: 뉴스 항목 리스트 ('제목', '링크')
+        date: 수집 날짜 (YYYY-MM-DD)
+        index: 서명 색인 (None이면 이번 실행 안에서만 비교)
+        threshold: 같은 그룹으로 볼 최소 자카드 유사도
+        field: 그룹 ID를 기록할 필드 이름
+
+    Returns:
+        {'items', 'groups', 'duplicates', 'cross_run'} 통계
+    """
+    keys = [news_item_key(item) or f"{date}_{i}" for i, item in enumerate(items)]
+    shingle_sets = [shingles(item.get("제목", "")) for item in items]
+    buckets = [band_keys(minhash_signature(s)) for s in shingle_sets]
+
+    # 1) 이번 실행 안의 후보 쌍 확인
+    uf = _UnionFind(len(items))
+    bucket_members = defaultdict(list)
+    for i, item_buckets in enumerate(buckets):
+        for bucket in item_buckets:
+            bucket_members[bucket].append(i)
+    for members in bucket_members.values():
+        # 버킷 안의 모든 쌍 대신 버킷별 대표 항목과만 비교 (중복이 많은 버킷에서도 선형)
+        representatives = []
+        for i in members:
+            for rep in representatives:
+                if uf.find(rep) == uf.find(i) or jaccard(shingle_sets[rep], shingle_sets[i]) >= threshold:
+                    uf.union(rep, i)
+                    break
+            else:
+                representatives.append(i)
+
+    # 2) 색인에서 기존 그룹 ID 이어받기 (같은 기사 키 우선, 없으면 유사 제목)
+    inherited = {}
+    known = index.lookup_keys(keys) if index is not None else {}
+    for i in range(len(items)):
+        root = uf.find(i)
+        if keys[i] in known:
+            inherited.setdefault(root, known[keys[i]])
+            continue
+        if index is None or root in inherited:
+            continue
+        for candidate in index.candidates(buckets[i]):
+            if jaccard(shingle_sets[i], shingles(candidate['title'])) >= threshold:
+                inherited[root] = candidate['group_id']
+                break
+
+    # 3) 그룹 ID 부여
+    group_sizes = defaultdict(int)
+    new_entries = []
+    for i, item in enumerate(items):
+        root = uf.find(i)
+        group_id = inherited.get(root, keys[root])
+        item[field] = group_id
+        group_sizes[group_id] += 1
+        if keys[i] not in known:
+            new_entries.append({'key': keys[i], 'group_id': group_id, 'title': item.get("제목", ""), 'bands': buckets[i]})
+
+    if index is not None and new_entries:
+        index.add(new_entries, date)
+
+    return {
+        'items': len(items),
+        'groups': len(group_sizes),
+        'duplicates': len(items) - len(group_sizes),
+        'cross_run': len(set(inherited.values())),
+    }
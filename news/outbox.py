@@ -0,0 +1,235 @@
+"""
+로컬 아웃박스 기반 일괄 전송
+수집 결과를 먼저 로컬 SQLite 아웃박스에 기록하고,
+플러셔가 키(cont_date) 기준 멱등 upsert로 묶어서 전송합니다.
+전송에 실패한 항목은 지수 백오프 후 다음 플러시(또는 다음 실행)에서 다시 보냅니다.
+배치가 실패하면 반씩 나눠 다시 보내 거부된 항목만 남기고, 같은 플러시에서 다른 항목은
+전송되는데 혼자 거부되기를 여러 번 반복한 항목은 dead 상태로 옮겨 더 이상 보내지 않습니다.
+
+GitHub Actions에서는 data/cache 폴더가 actions/cache로만 이어지므로,
+워크플로는 수집 단계가 실패해도 캐시를 저장합니다(if: always()).
+다만 7일 넘게 쓰이지 않았거나 용량 제한으로 캐시가 지워지면 남은 항목도 함께 사라지며,
+이때는 다음 실행이 해당 날짜를 다시 수집해 upsert하므로 최신 실행 결과만 반영됩니다.
+"""
+
+import json
+import os
+import random
+import sqlite3
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 아웃박스 기본 위치
+OUTBOX_PATH = os.path.join("data", "cache", "outbox.sqlite")
+
+# 혼자 거부된 횟수가 이 값에 이르면 dead 상태로 옮김
+DEFAULT_MAX_REJECTIONS = 3
+
+
+class Outbox:
+    """키별 최신 페이로드 하나만 유지하는 SQLite 아웃박스"""
+
+    def __init__(self, path: str = OUTBOX_PATH):
+        self.path = path
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (처음 사용할 때 테이블 생성)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    rejections INTEGER NOT NULL DEFAULT 0,
+                    dead INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_error TEXT
+                )
+                """
+            )
+            # rejections/dead 열이 없던 이전 아웃박스 파일
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+            if 'rejections' not in columns:
+                self._conn.execute("ALTER TABLE outbox ADD COLUMN rejections INTEGER NOT NULL DEFAULT 0")
+            if 'dead' not in columns:
+                self._conn.execute("ALTER TABLE outbox ADD COLUMN dead INTEGER NOT NULL DEFAULT 0")
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def enqueue(self, key: str, payload: Dict) -> None:
+        """페이로드 기록 (같은 키가 이미 있으면 최신 내용으로 교체하고 dead 상태여도 즉시 전송 대상으로 설정)"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT INTO outbox (key, payload, attempts, next_attempt_at, created_at) "
+            "VALUES (?, ?, 0, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET payload = excluded.payload, attempts = 0, rejections = 0, dead = 0, "
+            "next_attempt_at = excluded.next_attempt_at, last_error = NULL",
+            (key, json.dumps(payload, ensure_ascii=False), now, now),
+        )
+        conn.commit()
+
+    def pending_count(self) -> int:
+        """전송 대기 중인 항목 수 (dead 제외)"""
+        return self._connect().execute("SELECT COUNT(*) FROM outbox WHERE dead = 0").fetchone()[0]
+
+    def dead_count(self) -> int:
+        """반복해서 거부되어 더 이상 보내지 않는 항목 수"""
+        return self._connect().execute("SELECT COUNT(*) FROM outbox WHERE dead = 1").fetchone()[0]
+
+    def due(self, limit: int, now: Optional[float] = None) -> List[Dict]:
+        """재시도 시각이 지난 항목을 오래된 순으로 최대 limit개 반환"""
+        now = time.time() if now is None else now
+        rows = self._connect().execute(
+            "SELECT key, payload, attempts, rejections FROM outbox WHERE dead = 0 AND next_attempt_at <= ? "
+            "ORDER BY created_at ASC LIMIT ?",
+            (now, limit),
+        ).fetchall()
+        return [
+            {'key': key, 'payload': json.loads(payload), 'attempts': attempts, 'rejections': rejections}
+            for key, payload, attempts, rejections in rows
+        ]
+
+    def mark_sent(self, keys: List[str]) -> None:
+        """전송 완료 항목 삭제"""
+        conn = self._connect()
+        conn.executemany("DELETE FROM outbox WHERE key = ?", [(key,) for key in keys])
+        conn.commit()
+
+    def mark_failed(self, keys: List[str], error: str, delay: float, rejected: bool = False) -> None:
+        """전송 실패 항목의 시도 횟수(rejected면 거부 횟수도)를 늘리고 delay초 뒤로 재시도 예약"""
+        conn = self._connect()
+        next_attempt_at = time.time() + delay
+        conn.executemany(
+            "UPDATE outbox SET attempts = attempts + 1, rejections = rejections + ?, next_attempt_at = ?, "
+            "last_error = ? WHERE key = ?",
+            [(int(rejected), next_attempt_at, error[:500], key) for key in keys],
+        )
+        conn.commit()
+
+    def mark_dead(self, keys: List[str], error: str) -> None:
+        """반복해서 거부된 항목을 dead 상태로 옮김 (같은 키를 다시 enqueue하면 되살아남)"""
+        conn = self._connect()
+        conn.executemany(
+            "UPDATE outbox SET attempts = attempts + 1, rejections = rejections + 1, dead = 1, last_error = ? "
+            "WHERE key = ?",
+            [(error[:500], key) for key in keys],
+        )
+        conn.commit()
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+    """지수 백오프 + 지터 (attempt는 0부터)"""
+    delay = min(max_delay, base_delay * (2 ** attempt))
+    return delay * (0.5 + random.random() / 2)
+
+
+def _send(send_batch: Callable[[List[Dict]], None], items: List[Dict], retries: int,
+          base_delay: float, max_delay: float) -> Optional[str]:
+    """항목 묶음 전송 (실패하면 retries번까지 백오프 후 재시도), 마지막 오류 문자열 또는 None 반환"""
+    error = None
+    for attempt in range(retries + 1):
+        try:
+            send_batch([item['payload'] for item in items])
+            return None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if attempt < retries:
+                time.sleep(backoff_delay(attempt, base_delay, max_delay))
+    return error
+
+
+def _bisect(send_batch: Callable[[List[Dict]], None], items: List[Dict],
+            error: str) -> Tuple[List[Dict], List[Tuple[Dict, str]]]:
+    """
+    실패한 묶음을 반씩 나눠 다시 전송 (재시도 없이 한 번씩)
+
+    Returns:
+        (전송된 항목, [(혼자 보내도 실패한 항목, 오류)])
+    """
+    if len(items) == 1:
+        return [], [(items[0], error)]
+    sent, failed = [], []
+    middle = len(items) // 2
+    for half in (items[:middle], items[middle:]):
+        half_error = _send(send_batch, half, 0, 0, 0)
+        if half_error is None:
+            sent.extend(half)
+        else:
+            half_sent, half_failed = _bisect(send_batch, half, half_error)
+            sent.extend(half_sent)
+            failed.extend(half_failed)
+    return sent, failed
+
+
+def flush_outbox(outbox: Outbox, send_batch: Callable[[List[Dict]], None], batch_size: int = 50,
+                 max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0,
+                 max_rejections: int = DEFAULT_MAX_REJECTIONS) -> Dict:
+    """
+    아웃박스의 대기 항목을 묶어서 전송
+
+    배치가 재시도 후에도 실패하면 반씩 나눠 보내 나머지 항목은 전송하고, 혼자 보내도 실패한 항목만
+    재시도 예약합니다. 같은 플러시에서 다른 항목이 전송되었다면 그 항목은 거부된 것으로 보고
+    거부 횟수를 세며, max_rejections번 거부되면 dead 상태로 옮깁니다. 아무것도 전송되지 않으면
+    (서버 장애 등) 거부 횟수는 늘리지 않고 이번 플러시를 멈춥니다.
+
+    Args:
+        outbox: 아웃박스
+        send_batch: 페이로드 리스트를 한 번에 upsert하는 함수 (실패 시 예외 발생)
+        batch_size: 한 번에 보낼 최대 항목 수
+        max_retries: 배치 하나당 이번 플러시 안에서의 최대 재시도 횟수
+        base_delay: 백오프 기본 대기 시간 (초)
+        max_delay: 백오프 최대 대기 시간 (초)
+        max_rejections: dead 상태로 옮기기 전까지 허용하는 거부 횟수
+
+    Returns:
+        {'sent', 'failed', 'dead', 'batches', 'pending'} 전송 통계
+    """
+    stats = {'sent': 0, 'failed': 0, 'dead': 0, 'batches': 0, 'pending': 0}
+    attempted = set()
+
+    while True:
+        batch = [item for item in outbox.due(batch_size) if item['key'] not in attempted]
+        if not batch:
+            break
+        attempted.update(item['key'] for item in batch)
+        stats['batches'] += 1
+
+        error = _send(send_batch, batch, max_retries, base_delay, max_delay)
+        if error is None:
+            sent, failed = batch, []
+        else:
+            sent, failed = _bisect(send_batch, batch, error)
+
+        if sent:
+            outbox.mark_sent([item['key'] for item in sent])
+            stats['sent'] += len(sent)
+        # 이번 플러시에서 다른 항목은 전송되었으면 혼자 실패한 항목은 거부된 것
+        rejected = stats['sent'] > 0
+        for item, item_error in failed:
+            if rejected and item['rejections'] + 1 >= max_rejections:
+                outbox.mark_dead([item['key']], item_error)
+                stats['dead'] += 1
+                continue
+            # 다음 플러시에서 다시 시도하도록 재시도 시각 예약
+            attempts = item['attempts'] + max_retries + 1
+            outbox.mark_failed([item['key']], item_error, backoff_delay(attempts, base_delay, max_delay),
+                               rejected=rejected)
+            stats['failed'] += 1
+        if not sent:
+            break
+
+    stats['pending'] = outbox.pending_count()
+    return stats
@@ -0,0 +1,99 @@
+"""
+뉴스 목록 페이지 조건부 요청 및 파싱 결과 캐시
+URL별로 마지막 응답 해시와 검증자(ETag, Last-Modified)를 기록하고,
+내용이 바뀌지 않은 페이지는 파싱을 건너뛰고 이전 파싱 결과를 재사용합니다.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+# 페이지 캐시 기본 위치
+PAGE_CACHE_PATH = os.path.join("data", "cache", "pages.json")
+
+# 이 기간보다 오래 갱신되지 않은 항목은 정리
+PAGE_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+class PageCache:
+    """URL별 응답 해시/검증자와 파싱된 뉴스 목록을 보관하는 캐시"""
+
+    def __init__(self, path: str = PAGE_CACHE_PATH):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self.stats = {'fetched': 0, 'parsed': 0, 'cached': 0, 'not_modified': 0}
+        self._dirty = False
+
+    def load(self) -> "PageCache":
+        """디스크에서 캐시 로드 (파일이 없거나 손상되면 빈 캐시)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+        return self
+
+    def save(self) -> None:
+        """변경된 캐시를 디스크에 저장 (오래된 항목 정리 포함)"""
+        if not self._dirty:
+            return
+        cutoff = time.time() - PAGE_CACHE_MAX_AGE
+        self.entries = {
+            url: entry for url, entry in self.entries.items()
+            if entry.get('updated_at', 0) >= cutoff
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """이전 응답의 검증자로 조건부 요청 헤더 생성"""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+        result = {}
+        if entry.get('etag'):
+            result['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            result['If-Modified-Since'] = entry['last_modified']
+        return result
+
+    def not_modified(self, url: str) -> Optional[List[Dict]]:
+        """304 응답을 받은 경우 캐시된 목록 반환"""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        self.stats['not_modified'] += 1
+        self.stats['cached'] += 1
+        entry['updated_at'] = time.time()
+        self._dirty = True
+        return copy.deepcopy(entry['items'])
+
+    def lookup(self, url: str, content: bytes) -> Optional[List[Dict]]:
+        """응답 본문 해시가 이전과 같으면 캐시된 목록 반환"""
+        self.stats['fetched'] += 1
+        entry = self.entries.get(url)
+        if entry is None or entry.get('sha1') != hashlib.sha1(content).hexdigest():
+            return None
+        self.stats['cached'] += 1
+        entry['updated_at'] = time.time()
+        self._dirty = True
+        return copy.deepcopy(entry['items'])
+
+    def store(self, url: str, content: bytes, response_headers, items: List[Dict]) -> None:
+        """새로 파싱한 결과와 응답 해시/검증자 저장"""
+        self.stats['parsed'] += 1
+        self.entries[url] = {
+            'sha1': hashlib.sha1(content).hexdigest(),
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'items': copy.deepcopy(items),
+            'updated_at': time.time(),
+        }
+        self._dirty = True
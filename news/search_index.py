@@ -0,0 +1,394 @@
+"""
+뉴스 전문 검색 색인
+제목과 (캐시된) 본문을 문자 bigram으로 나눈 역색인을 SQLite에 보관합니다.
+포스팅은 문서 번호 차이를 varint로 인코딩한 BLOB 조각이며, 아카이브 세그먼트에
+새로 붙은 부분만 읽어 새 조각으로 추가하므로 색인을 다시 만들 필요가 없습니다.
+조각이 많이 쌓이면 용어별로 하나로 합칩니다.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from news.archive import NewsArchive
+from news.body_fetcher import BodyCache
+
+# 검색 색인 기본 위치
+SEARCH_INDEX_PATH = os.path.join("data", "cache", "search_index.sqlite")
+
+# 아카이브 변경 확인 최소 간격 (초)
+REFRESH_INTERVAL = 60
+
+# 포스팅 조각을 합치는 주기 (추가 배치 수)
+COMPACT_EVERY = 50
+
+# 본문 없이 색인된 기사의 본문을 다시 확인하는 기간 (일)
+BODY_RECHECK_DAYS = 3
+
+# 한글/영문/숫자 외 문자 ([속보] 같은 태그 안의 단어도 검색되도록 괄호 내용은 유지)
+_NON_WORD_PATTERN = re.compile(r'[^0-9a-zA-Z가-힣]+')
+
+
+def bigrams(text: str) -> Set[str]:
+    """정규화한 텍스트의 단어별 문자 bigram 집합 (한 글자 단어는 그대로)"""
+    terms = set()
+    for word in _NON_WORD_PATTERN.sub(' ', text or '').lower().split():
+        if len(word) == 1:
+            terms.add(word)
+            continue
+        for i in range(len(word) - 1):
+            terms.add(word[i:i + 2])
+    return terms
+
+
+def encode_postings(doc_ids: Iterable[int], previous: int = 0) -> bytes:
+    """오름차순 문서 번호를 직전 번호와의 차이 varint로 인코딩"""
+    out = bytearray()
+    for doc_id in doc_ids:
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_postings(data: bytes) -> List[int]:
+    """encode_postings의 역변환"""
+    doc_ids = []
+    current = value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += value
+        doc_ids.append(current)
+        value = shift = 0
+    return doc_ids
+
+
+class NewsSearchIndex:
+    """아카이브 기사에 대한 문자 bigram 역색인"""
+
+    def __init__(self, path: str = SEARCH_INDEX_PATH, archive: Optional[NewsArchive] = None,
+                 body_cache: Optional[BodyCache] = None):
+        self.path = path
+        self.archive = archive or NewsArchive()
+        self.body_cache = body_cache or BodyCache()
+        self._conn = None
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (처음 사용할 때 테이블 생성)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS docs (
+                    doc_id INTEGER PRIMARY KEY,
+                    key TEXT UNIQUE NOT NULL,
+                    date TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    link TEXT,
+                    has_body INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_docs_date ON docs (date, doc_id);
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL,
+                    batch INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    PRIMARY KEY (term, batch)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS sources (
+                    date TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL
+                );
+                """
+            )
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        아카이브에 새로 붙은 기사만 색인에 추가
+
+        보관 기간이 지나 아카이브에서 사라진 날짜는 색인에서도 지우고,
+        최근 기사 중 본문 없이 색인된 기사는 본문이 생겼으면 본문 용어를 더합니다.
+
+        Args:
+            force: True면 최소 간격과 관계없이 확인
+
+        Returns:
+            새로 색인한 기사 수
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < REFRESH_INTERVAL:
+            return 0
+        with self._lock:
+            self._last_refresh = now
+            dates = self.archive.dates()
+            indexed = dict(self._connect().execute("SELECT date, size FROM sources").fetchall())
+            archive_dates = set(dates)
+            self._remove_dates([date for date in indexed if date not in archive_dates])
+            added = 0
+            batches = []
+            for date in dates:
+                if indexed.get(date) == self._segment_size(date):
+                    continue
+                count, batch = self._index_date(date)
+                added += count
+                batches.append(batch)
+            batches.append(self._reindex_bodies())
+            if any(batch and batch % COMPACT_EVERY == 0 for batch in batches):
+                self.compact()
+            return added
+
+    def _write(self):
+        """쓰기 트랜잭션 시작 (다른 프로세스의 색인 갱신과 겹치지 않도록 바로 쓰기 잠금)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        return conn
+
+    def _read_segment(self, date: str, offset: int):
+        """세그먼트에서 offset 이후 기사 읽기 (세그먼트가 줄었거나 다시 쓰였으면 처음부터)"""
+        if offset:
+            try:
+                records, size = self.archive.read_from(date, offset)
+                if size >= offset:
+                    return records, size
+            except (OSError, EOFError, zlib.error):
+                pass
+        return self.archive.read_from(date, 0)
+
+    def _index_date(self, date: str):
+        """
+        날짜 하나의 새 기사 색인
+
+        Returns:
+            (새로 색인한 기사 수, 추가한 포스팅 조각 번호 또는 0)
+        """
+        conn = self._write()
+        try:
+            row = conn.execute("SELECT size FROM sources WHERE date = ?", (date,)).fetchone()
+            offset = row[0] if row else 0
+            records, size = self._read_segment(date, offset)
+            added, batch = self._add_documents(date, records)
+            if size != offset:
+                conn.execute(
+                    "INSERT INTO sources (date, size) VALUES (?, ?) ON CONFLICT(date) DO UPDATE SET size = excluded.size",
+                    (date, size),
+                )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return added, batch
+
+    def _segment_size(self, date: str) -> Optional[int]:
+        """세그먼트 파일 크기 (색인한 크기와 같으면 새로 붙은 기사가 없음)"""
+        try:
+            return os.path.getsize(self.archive.segment_path(date))
+        except OSError:
+            return None
+
+    def _remove_dates(self, stale: List[str]) -> int:
+        """아카이브에서 사라진 날짜의 문서와 포스팅 삭제, 삭제한 날짜 수 반환"""
+        if not stale:
+            return 0
+        conn = self._write()
+        try:
+            placeholders = ','.join('?' * len(stale))
+            removed = {doc_id for (doc_id,) in conn.execute(f"SELECT doc_id FROM docs WHERE date IN ({placeholders})", stale)}
+            conn.execute(f"DELETE FROM docs WHERE date IN ({placeholders})", stale)
+            conn.execute(f"DELETE FROM sources WHERE date IN ({placeholders})", stale)
+            # 삭제한 문서 번호가 다시 쓰이기 전에 포스팅에서도 빼야 하므로 같은 트랜잭션에서 다시 씀
+            self._rewrite_postings(conn, removed)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return len(stale)
+
+    def _reindex_bodies(self) -> int:
+        """
+        최근 BODY_RECHECK_DAYS일 안에 본문 없이 색인된 기사 중 본문이 생긴 기사의 본문 용어 추가
+
+        Returns:
+            추가한 포스팅 조각 번호 (없으면 0)
+        """
+        cutoff = (datetime.now() - timedelta(days=BODY_RECHECK_DAYS)).strftime('%Y-%m-%d')
+        conn = self._connect()
+        candidates = conn.execute("SELECT doc_id, key FROM docs WHERE has_body = 0 AND date >= ?", (cutoff,)).fetchall()
+        new_postings = defaultdict(list)
+        updated = []
+        for doc_id, key in candidates:
+            body = self.body_cache.get(key)
+            if not body:
+                continue
+            for term in bigrams(body):
+                new_postings[term].append(doc_id)
+            updated.append((doc_id,))
+        if not updated:
+            return 0
+
+        conn = self._write()
+        try:
+            conn.executemany("UPDATE docs SET has_body = 1 WHERE doc_id = ?", updated)
+            batch = self._append_postings(conn, new_postings)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return batch
+
+    def compact(self) -> None:
+        """용어별 포스팅 조각을 하나로 합침"""
+        conn = self._write()
+        try:
+            self._rewrite_postings(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def _rewrite_postings(self, conn: sqlite3.Connection, exclude: Set[int] = frozenset()) -> None:
+        """모든 포스팅 조각을 용어별 하나로 다시 씀 (exclude의 문서 번호는 제외)"""
+        merged = defaultdict(set)
+        for term, data in conn.execute("SELECT term, data FROM postings"):
+            merged[term].update(decode_postings(data))
+        conn.execute("DELETE FROM postings")
+        rows = []
+        for term, doc_ids in merged.items():
+            doc_ids -= exclude
+            if doc_ids:
+                rows.append((term, encode_postings(sorted(doc_ids))))
+        conn.executemany("INSERT INTO postings (term, batch, data) VALUES (?, 0, ?)", rows)
+
+    def _append_postings(self, conn: sqlite3.Connection, new_postings: Dict[str, List[int]]) -> int:
+        """용어별 문서 번호를 새 포스팅 조각으로 추가, 조각 번호 반환 (추가할 것이 없으면 0)"""
+        if not new_postings:
+            return 0
+        batch = (conn.execute("SELECT MAX(batch) FROM postings").fetchone()[0] or 0) + 1
+        conn.executemany(
+            "INSERT INTO postings (term, batch, data) VALUES (?, ?, ?)",
+            [(term, batch, encode_postings(sorted(doc_ids))) for term, doc_ids in new_postings.items()],
+        )
+        return batch
+
+    def _add_documents(self, date: str, records: List[Dict]):
+        """
+        기사 묶음을 문서로 등록하고 용어별 포스팅 뒤에 이어 붙임 (쓰기 트랜잭션 안에서 호출)
+
+        문서 번호는 SQLite가 정하며, 이미 있는 키는 INSERT OR IGNORE로 건너뜁니다.
+
+        Returns:
+            (새로 등록한 문서 수, 추가한 포스팅 조각 번호 또는 0)
+        """
+        conn = self._connect()
+        new_postings = defaultdict(list)
+        added = 0
+        for record in records:
+            key = record.get('key')
+            if not key:
+                continue
+            title = record.get("제목", "")
+            body = self.body_cache.get(key) or ""
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO docs (key, date, title, link, has_body) VALUES (?, ?, ?, ?, ?)",
+                (key, date, title, record.get("링크"), 1 if body else 0),
+            )
+            if not cursor.rowcount:
+                continue
+            for term in bigrams(f"{title} {body}"):
+                new_postings[term].append(cursor.lastrowid)
+            added += 1
+        return added, self._append_postings(conn, new_postings)
+
+    def search(self, query: str, date_from: Optional[str] = None, date_to: Optional[str] = None,
+               limit: int = 20) -> Dict:
+        """
+        모든 bigram을 포함한 기사를 최신순으로 검색
+
+        Args:
+            query: 검색어
+            date_from: 시작 날짜 (YYYY-MM-DD, 포함)
+            date_to: 종료 날짜 (YYYY-MM-DD, 포함)
+            limit: 최대 결과 수
+
+        Returns:
+            {'query', 'total', 'results': [{'key', 'date', 'title', 'link'}]}
+        """
+        terms = bigrams(query)
+        if not terms:
+            return {'query': query, 'total': 0, 'results': []}
+
+        with self._lock:
+            return self._search(query, terms, date_from, date_to, limit)
+
+    def _search(self, query: str, terms: Set[str], date_from: Optional[str], date_to: Optional[str],
+                limit: int) -> Dict:
+        """search 본문 (색인 갱신과 같은 연결을 쓰므로 잠금 안에서 호출)"""
+        conn = self._connect()
+        placeholders = ','.join('?' * len(terms))
+        by_term = defaultdict(list)
+        for term, data in conn.execute(f"SELECT term, data FROM postings WHERE term IN ({placeholders})", list(terms)):
+            by_term[term].extend(decode_postings(data))
+        if len(by_term) < len(terms):
+            return {'query': query, 'total': 0, 'results': []}
+
+        # 문서 빈도가 작은 용어부터 교집합
+        postings = sorted(by_term.values(), key=len)
+        matched = set(postings[0])
+        for doc_ids in postings[1:]:
+            matched.intersection_update(doc_ids)
+            if not matched:
+                break
+
+        conditions, params = [], []
+        if date_from:
+            conditions.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("date <= ?")
+            params.append(date_to)
+
+        rows = []
+        ordered = sorted(matched)
+        for start in range(0, len(ordered), 500):
+            chunk = ordered[start:start + 500]
+            where = " AND ".join([f"doc_id IN ({','.join('?' * len(chunk))})"] + conditions)
+            rows.extend(conn.execute(f"SELECT doc_id, key, date, title, link FROM docs WHERE {where}", chunk + params))
+        rows.sort(key=lambda row: (row[2], row[0]), reverse=True)
+
+        results = [{'key': key, 'date': date, 'title': title, 'link': link} for _, key, date, title, link in rows[:limit]]
+        return {'query': query, 'total': len(rows), 'results': results}
+
+    def latest(self, limit: int = 20, date: Optional[str] = None) -> List[Dict]:
+        """가장 최근에 색인된 기사 목록 (date를 주면 해당 날짜만)"""
+        with self._lock:
+            conn = self._connect()
+            if date:
+                rows = conn.execute(
+                    "SELECT key, date, title, link FROM docs WHERE date = ? ORDER BY doc_id DESC LIMIT ?", (date, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT key, date, title, link FROM docs ORDER BY date DESC, doc_id DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [{'key': key, 'date': d, 'title': title, 'link': link} for key, d, title, link in rows]
@@ -0,0 +1,83 @@
+"""
+뉴스 스냅샷 해시
+항목별 해시를 순서대로 이어 붙여 스냅샷 해시를 만들고,
+날짜별 마지막 스냅샷 해시를 기록해 내용이 바뀌지 않은 실행의 저장/업로드를 건너뜁니다.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+# 스냅샷 상태 파일 기본 위치
+SNAPSHOT_STATE_PATH = os.path.join("data", "cache", "snapshots.json")
+
+# 상태를 보관하는 일수
+SNAPSHOT_RETENTION_DAYS = 14
+
+# 항목 해시에 사용하는 필드 (순서 고정)
+ITEM_HASH_FIELDS = ("제목", "링크", "페이지")
+
+
+def item_digest(item: Dict) -> bytes:
+    """뉴스 항목 하나의 해시 (전체 목록을 직렬화하지 않고 필드 값만 사용)"""
+    h = hashlib.md5()
+    for field in ITEM_HASH_FIELDS:
+        h.update(str(item.get(field, "")).encode('utf-8'))
+        h.update(b'\x1f')
+    return h.digest()
+
+
+def snapshot_hash(items: Iterable[Dict]) -> str:
+    """항목 해시를 순서대로 누적한 스냅샷 해시"""
+    h = hashlib.md5()
+    for item in items:
+        h.update(item_digest(item))
+    return h.hexdigest()
+
+
+class SnapshotState:
+    """날짜별 마지막 스냅샷 {'hash', 'file', 'count', 'timestamp'} 기록"""
+
+    def __init__(self, path: str = SNAPSHOT_STATE_PATH):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+
+    def load(self) -> "SnapshotState":
+        """상태 파일 읽기 (없거나 손상되면 빈 상태)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        return self
+
+    def latest(self, date: str) -> Optional[Dict]:
+        """해당 날짜의 마지막 스냅샷"""
+        return self.entries.get(date)
+
+    def is_unchanged(self, date: str, digest: str) -> bool:
+        """해당 날짜의 마지막 스냅샷과 해시가 같은지"""
+        latest = self.latest(date)
+        return bool(latest) and latest.get('hash') == digest
+
+    def record(self, date: str, digest: str, filepath: str, count: int) -> None:
+        """스냅샷 기록 후 저장 (보관 기간이 지난 날짜는 정리)"""
+        self.entries[date] = {
+            'hash': digest,
+            'file': os.path.basename(filepath),
+            'count': count,
+            'timestamp': datetime.now().isoformat(),
+        }
+        cutoff = (datetime.now() - timedelta(days=SNAPSHOT_RETENTION_DAYS)).strftime('%Y-%m-%d')
+        self.entries = {d: entry for d, entry in self.entries.items() if d >= cutoff}
+        self.save()
+
+    def save(self) -> None:
+        """임시 파일에 쓴 뒤 교체"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,194 @@
+"""
+뉴스 제목 종목 추출
+KOSPI/KOSDAQ 종목명·별칭·6자리 종목코드로 만든 Aho-Corasick 오토마톤으로
+제목 전체를 한 번씩만 훑어 종목 언급 횟수를 셉니다.
+"""
+
+import csv
+import os
+from collections import Counter, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 함께 배포되는 종목 목록 (code,name,market,aliases, 전체 상장 종목은 tools/update_krx_listing.py로 갱신)
+LISTING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "krx_listing.csv")
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+def _is_ascii_word(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+# 짧은 영문 종목명(SK, LG, KT 등) 뒤에 올 수 있는 조사
+_PARTICLES = set('은는이가을를의도와과에로만')
+
+
+class AhoCorasick:
+    """여러 패턴을 한 번의 선형 탐색으로 찾는 Aho-Corasick 오토마톤"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]  # (패턴 길이, 값 인덱스)
+        self._built = False
+
+    def add(self, pattern: str, value_index: int) -> None:
+        """패턴 추가 (build 이전에만 가능)"""
+        if not pattern:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append((len(pattern), value_index))
+        self._built = False
+
+    def build(self) -> None:
+        """BFS로 실패 링크 계산"""
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """
+        텍스트의 모든 패턴 매치 반환
+
+        Returns:
+            (시작 위치, 끝 위치, 값 인덱스) 이터레이터
+        """
+        if not self._built:
+            self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value_index in output[node]:
+                yield pos - length + 1, pos + 1, value_index
+
+
+class StockExtractor:
+    """종목 목록 기반 제목 종목 추출기"""
+
+    def __init__(self, listing_path: str = LISTING_PATH):
+        self.stocks: List[Dict] = []
+        self.automaton = AhoCorasick()
+        self._load(listing_path)
+        self.automaton.build()
+
+    def _load(self, listing_path: str) -> None:
+        """종목 목록 CSV로 오토마톤 구성 (종목명, 별칭, 종목코드를 모두 패턴으로 등록)"""
+        with open(listing_path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                index = len(self.stocks)
+                stock = {'code': row['code'].strip(), 'name': row['name'].strip(), 'market': row.get('market', '').strip()}
+                self.stocks.append(stock)
+                patterns = {stock['name'], stock['code']}
+                patterns.update(alias.strip() for alias in (row.get('aliases') or '').split('|') if alias.strip())
+                for pattern in patterns:
+                    self.automaton.add(pattern, index)
+
+    def _valid_boundary(self, text: str, start: int, end: int) -> bool:
+        """부분 문자열 오탐을 줄이기 위한 경계 검사"""
+        matched = text[start:end]
+        before = text[start - 1] if start > 0 else ''
+        after = text[end] if end < len(text) else ''
+        if matched.isdigit():
+            # 종목코드는 앞뒤가 숫자가 아니어야 함
+            return not before.isdigit() and not after.isdigit()
+        if _is_ascii_word(matched[0]) and before and _is_ascii_word(before):
+            return False
+        if _is_ascii_word(matched[-1]) and after and _is_ascii_word(after):
+            return False
+        if len(matched) <= 3 and matched.isascii() and _is_hangul(after) and after not in _PARTICLES:
+            # "SK증권", "LG그룹"처럼 짧은 영문 종목명으로 시작하는 다른 이름 제외
+            return False
+        if len(matched) <= 2 and _is_hangul(matched[0]) and before and _is_hangul(before):
+            # 두 글자 한글 별칭은 단어 중간 매치 제외
+            return False
+        return True
+
+    def find(self, text: str) -> List[Dict]:
+        """
+        텍스트에서 종목 언급 찾기 (왼쪽 우선 최장 일치, 겹치는 매치 제외)
+
+        Returns:
+            [{'code', 'name', 'start', 'end'}]
+        """
+        candidates = [
+            (start, end, index) for start, end, index in self.automaton.iter_matches(text)
+            if self._valid_boundary(text, start, end)
+        ]
+        candidates.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+
+        results = []
+        last_end = 0
+        for start, end, index in candidates:
+            if start < last_end:
+                continue
+            stock = self.stocks[index]
+            results.append({'code': stock['code'], 'name': stock['name'], 'start': start, 'end': end})
+            last_end = end
+        return results
+
+    def count_mentions(self, titles: Iterable[str]) -> Counter:
+        """종목코드별 언급된 제목 수 (한 제목에서 여러 번 나와도 1회)"""
+        counts = Counter()
+        for title in titles:
+            counts.update({match['code'] for match in self.find(title or '')})
+        return counts
+
+    def rank(self, titles: Iterable[str], limit: Optional[int] = None) -> List[Dict]:
+        """
+        언급 횟수 순 종목 목록
+
+        Returns:
+            [{'code', 'name', 'market', 'count'}] (언급 횟수 내림차순)
+        """
+        by_code = {stock['code']: stock for stock in self.stocks}
+        ranked = [
+            {**by_code[code], 'count': count}
+            for code, count in self.count_mentions(titles).most_common()
+        ]
+        return ranked[:limit] if limit else ranked
+
+
+def format_topstock(ranked: List[Dict], limit: int = 10, max_length: int = 255) -> str:
+    """topstock 컬럼 형식("종목1, 종목2, ...")으로 변환 (VARCHAR(255) 제한)"""
+    topstock = ", ".join(stock['name'] for stock in ranked[:limit])
+    return topstock[:max_length]
+
+
+def format_stock_hint(ranked: List[Dict], limit: int = 15) -> str:
+    """LLM 프롬프트용 종목 언급 요약 ("삼성전자(12), SK하이닉스(9), ...")"""
+    return ", ".join(f"{stock['name']}({stock['count']})" for stock in ranked[:limit])
+
+
+_default_extractor = None
+
+
+def get_stock_extractor() -> StockExtractor:
+    """기본 종목 목록으로 만든 추출기 (최초 호출 시 한 번만 구성)"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = StockExtractor()
+    return _default_extractor
@@ -0,0 +1,240 @@
+"""
+뉴스 키워드 트렌드 집계
+아카이브에 새로 붙은 기사만 읽어 날짜별 단어·종목 언급 수를 SQLite 집계표에
+더해 두고, 최근 기간 평균 대비 급등 점수를 집계표만으로 계산합니다.
+"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from news.archive import NewsArchive
+from news.stock_extractor import get_stock_extractor
+
+# 트렌드 집계표 기본 위치
+TRENDS_PATH = os.path.join("data", "cache", "trends.sqlite")
+
+# 아카이브 변경 확인 최소 간격 (초)
+REFRESH_INTERVAL = 60
+
+# 기준 기간 기본 일수
+DEFAULT_WINDOW = 7
+
+# 집계에서 제외할 단어 (태그, 형식어)
+STOPWORDS = {
+    '속보', '종합', '단독', '특징주', '오늘', '이번', '관련', '지금', '마감', '개장',
+    '오전', '오후', '전망', '분석', '포토', '영상', '인터뷰', '사설', '칼럼',
+}
+
+# 한글/영문/숫자 외 문자
+_NON_WORD_PATTERN = re.compile(r'[^0-9a-zA-Z가-힣]+')
+
+
+def title_terms(title: str) -> Dict[str, str]:
+    """
+    제목 하나에서 집계할 용어 추출 (한 제목에서 여러 번 나와도 1회)
+
+    Returns:
+        {용어: 종류('stock' 또는 'word')}
+    """
+    terms = {}
+    for word in _NON_WORD_PATTERN.sub(' ', title or '').split():
+        if len(word) < 2 or word.isdigit() or word in STOPWORDS:
+            continue
+        terms[word.lower() if word.isascii() else word] = 'word'
+    # 종목명은 조사가 붙어도 같은 종목으로 집계
+    for match in get_stock_extractor().find(title or ''):
+        terms[match['name']] = 'stock'
+    return terms
+
+
+class TrendCounter:
+    """날짜별 용어 언급 수 집계표"""
+
+    def __init__(self, path: str = TRENDS_PATH, archive: Optional[NewsArchive] = None):
+        self.path = path
+        self.archive = archive or NewsArchive()
+        self._conn = None
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (처음 사용할 때 테이블 생성)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS term_counts (
+                    date TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (date, term)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_term_counts_term ON term_counts (term, date);
+                CREATE TABLE IF NOT EXISTS day_totals (
+                    date TEXT PRIMARY KEY,
+                    articles INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS sources (
+                    date TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL
+                );
+                """
+            )
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        아카이브에 새로 붙은 기사만 집계표에 더함
+
+        Args:
+            force: True면 최소 간격과 관계없이 확인
+
+        Returns:
+            새로 집계한 기사 수
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < REFRESH_INTERVAL:
+            return 0
+        with self._lock:
+            self._last_refresh = now
+            counted = dict(self._connect().execute("SELECT date, size FROM sources").fetchall())
+            added = 0
+            for date in self.archive.dates():
+                if counted.get(date) == self._segment_size(date):
+                    continue
+                added += self._count_date(date)
+            return added
+
+    def _count_date(self, date: str) -> int:
+        """
+        날짜 하나의 새 기사 집계
+
+        다른 프로세스(수집 스크립트와 API)가 같은 집계표를 갱신하므로 쓰기 잠금을 먼저 잡고
+        트랜잭션 안에서 읽은 위치부터 더해 같은 기사를 두 번 세지 않습니다.
+
+        Returns:
+            새로 집계한 기사 수
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT size FROM sources WHERE date = ?", (date,)).fetchone()
+            records, size = self.archive.read_from(date, row[0] if row else 0)
+            if records:
+                self._add_counts(date, records)
+                conn.execute(
+                    "INSERT INTO sources (date, size) VALUES (?, ?) ON CONFLICT(date) DO UPDATE SET size = excluded.size",
+                    (date, size),
+                )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return len(records)
+
+    def _segment_size(self, date: str) -> Optional[int]:
+        """세그먼트 파일 크기 (집계한 크기와 같으면 새로 붙은 기사가 없음)"""
+        try:
+            return os.path.getsize(self.archive.segment_path(date))
+        except OSError:
+            return None
+
+    def _add_counts(self, date: str, records: List[Dict]) -> None:
+        """기사 묶음의 용어 수를 해당 날짜 집계에 더함"""
+        counts = Counter()
+        kinds = {}
+        for record in records:
+            for term, kind in title_terms(record.get("제목", "")).items():
+                counts[term] += 1
+                kinds[term] = kind
+
+        conn = self._connect()
+        conn.executemany(
+            "INSERT INTO term_counts (date, term, kind, count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(date, term) DO UPDATE SET count = count + excluded.count",
+            [(date, term, kinds[term], count) for term, count in counts.items()],
+        )
+        conn.execute(
+            "INSERT INTO day_totals (date, articles) VALUES (?, ?) "
+            "ON CONFLICT(date) DO UPDATE SET articles = articles + excluded.articles",
+            (date, len(records)),
+        )
+
+    def latest_date(self) -> Optional[str]:
+        """집계된 가장 최근 날짜"""
+        return self._connect().execute("SELECT MAX(date) FROM day_totals").fetchone()[0]
+
+    def trends(self, date: Optional[str] = None, window: int = DEFAULT_WINDOW, limit: int = 20,
+               kind: Optional[str] = None, min_count: int = 2) -> Dict:
+        """
+        기준 기간 대비 급등 용어
+
+        점수는 (당일 수 - 기준 평균) / sqrt(기준 평균 + 1)이며, 기준 기간에 기사가
+        없던 날은 계산에서 제외합니다.
+
+        Args:
+            date: 대상 날짜 (YYYY-MM-DD, 기본: 집계된 가장 최근 날짜)
+            window: 기준 기간 일수 (대상 날짜 이전)
+            limit: 최대 결과 수
+            kind: 'stock' 또는 'word'만 조회 (생략 시 전체)
+            min_count: 당일 최소 언급 수
+
+        Returns:
+            {'date', 'window', 'baseline_days', 'articles', 'terms': [{'term', 'kind', 'count', 'baseline', 'score'}]}
+        """
+        conn = self._connect()
+        date = date or self.latest_date()
+        if not date:
+            return {'date': None, 'window': window, 'baseline_days': 0, 'articles': 0, 'terms': []}
+
+        start = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=window)).strftime('%Y-%m-%d')
+        articles = (conn.execute("SELECT articles FROM day_totals WHERE date = ?", (date,)).fetchone() or [0])[0]
+        baseline_days = conn.execute(
+            "SELECT COUNT(*) FROM day_totals WHERE date >= ? AND date < ?", (start, date)
+        ).fetchone()[0]
+
+        query = (
+            "SELECT t.term, t.kind, t.count, "
+            "COALESCE((SELECT SUM(b.count) FROM term_counts b WHERE b.term = t.term AND b.date >= ? AND b.date < ?), 0) "
+            "FROM term_counts t WHERE t.date = ? AND t.count >= ?"
+        )
+        params = [start, date, date, min_count]
+        if kind:
+            query += " AND t.kind = ?"
+            params.append(kind)
+
+        terms = []
+        for term, term_kind, count, baseline_total in conn.execute(query, params):
+            baseline = baseline_total / baseline_days if baseline_days else 0.0
+            score = (count - baseline) / math.sqrt(baseline + 1)
+            terms.append({
+                'term': term,
+                'kind': term_kind,
+                'count': count,
+                'baseline': round(baseline, 2),
+                'score': round(score, 2),
+            })
+        terms.sort(key=lambda t: (t['score'], t['count']), reverse=True)
+        return {
+            'date': date,
+            'window': window,
+            'baseline_days': baseline_days,
+            'articles': articles,
+            'terms': terms[:limit],
+        }
@@ -0,0 +1,88 @@
+"""news.archive: gzip 멤버 추가, 인덱스 조회, 중단된 꼬리 잘라내기"""
+
+import gzip
+import os
+
+import pytest
+
+from news.archive import NewsArchive, news_item_key
+
+DATE = "2026-01-28"
+
+
+def article(number: int, title: str) -> dict:
+    return {'제목': title, '링크': f"https://n.news.naver.com/mnews/article/001/{number:010d}"}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return NewsArchive(str(tmp_path / "archive"))
+
+
+def test_news_item_key():
+    assert news_item_key(article(7, "제목")) == "001_0000000007"
+    assert news_item_key({'제목': "링크 없는 기사"}) == "링크 없는 기사"
+    assert news_item_key({}) is None
+
+
+def test_append_skips_known_articles(archive):
+    assert archive.append(DATE, [article(1, "첫 기사"), article(2, "둘째 기사"), article(1, "첫 기사")]) == 2
+    assert archive.append(DATE, [article(2, "둘째 기사"), article(3, "셋째 기사")]) == 1
+    assert [record['제목'] for record in archive.iter_day(DATE)] == ["첫 기사", "둘째 기사", "셋째 기사"]
+
+
+def test_append_new_returns_added_keys(archive):
+    assert archive.append_new(DATE, [article(1, "첫 기사"), article(2, "둘째 기사")]) == ["001_0000000001", "001_0000000002"]
+    assert archive.append_new(DATE, [article(2, "둘째 기사"), article(3, "셋째 기사")]) == ["001_0000000003"]
+    assert archive.append_new(DATE, [article(3, "셋째 기사")]) == []
+
+
+def test_get_reads_single_member(archive):
+    archive.append(DATE, [article(1, "첫 기사")])
+    archive.append(DATE, [article(2, "둘째 기사"), article(3, "셋째 기사")])
+    assert archive.get(DATE, "001_0000000003")['제목'] == "셋째 기사"
+    assert archive.get(DATE, "001_0000000009") is None
+
+
+def test_append_truncates_unindexed_tail(archive):
+    archive.append(DATE, [article(1, "첫 기사")])
+    indexed_size = archive.load_index(DATE)['size']
+
+    # 인덱스를 저장하기 전에 중단된 실행이 남긴 멤버
+    with open(archive.segment_path(DATE), 'ab') as f:
+        f.write(gzip.compress('{"제목": "중단된 기사"}\n'.encode('utf-8'))[:-4])
+
+    assert archive.append(DATE, [article(2, "둘째 기사")]) == 1
+    index = archive.load_index(DATE)
+    assert index['keys']["001_0000000002"][0] == indexed_size
+    assert [record['제목'] for record in archive.iter_day(DATE)] == ["첫 기사", "둘째 기사"]
+    with open(archive.segment_path(DATE), 'rb') as f:
+        assert len(f.read()) == index['size']
+
+
+def test_read_from_returns_only_new_members(archive):
+    archive.append(DATE, [article(1, "첫 기사")])
+    records, size = archive.read_from(DATE, 0)
+    assert [record['key'] for record in records] == ["001_0000000001"]
+
+    archive.append(DATE, [article(2, "둘째 기사")])
+    records, new_size = archive.read_from(DATE, size)
+    assert [record['key'] for record in records] == ["001_0000000002"]
+    assert archive.read_from(DATE, new_size) == ([], new_size)
+
+
+def test_prune_removes_old_days(archive):
+    archive.append("2000-01-01", [article(1, "오래된 기사")])
+    archive.append("2999-01-01", [article(2, "미래 기사")])
+    assert archive.prune(30) == 1
+    assert archive.dates() == ["2999-01-01"]
+
+
+def test_missing_segment_invalidates_index(archive):
+    archive.append(DATE, [article(1, "첫 기사"), article(2, "둘째 기사")])
+    assert archive.count(DATE) == 2
+    os.remove(archive.segment_path(DATE))
+
+    assert archive.count(DATE) == 0
+    assert archive.append(DATE, [article(1, "첫 기사")]) == 1
+    assert [record['제목'] for record in archive.iter_day(DATE)] == ["첫 기사"]
@@ -0,0 +1,27 @@
+"""news.body_fetcher: 광고/저작권 문구는 문장 단위로만 제거하고 본문은 유지"""
+
+from news.body_fetcher import extract_article_body
+
+PARAGRAPH = "삼성전자가 3분기 반도체 부문에서 시장 예상을 웃도는 영업이익을 기록했다고 밝혔다."
+
+
+def test_copyright_footer_is_removed_not_rejected():
+    html = (
+        f'<div id="dic_area">{PARAGRAPH}<br><br>메모리 가격 반등이 실적 개선을 이끌었다. '
+        '홍길동 기자 ⓒ 연합뉴스, 무단전재 및 재배포 금지'
+        '<div class="ad_area">광고 영역 배너 텍스트 입니다</div></div>'
+    )
+    body = extract_article_body(html)
+    assert body == f"{PARAGRAPH} 메모리 가격 반등이 실적 개선을 이끌었다."
+
+
+def test_ad_matches_only_as_whole_word():
+    html = f'<div id="dic_area">{PARAGRAPH} 쿠팡 ADR 상장과 LEADER 지수 편입 소식도 전해졌다.<p>AD 스폰서 링크 모음</p></div>'
+    body = extract_article_body(html)
+    assert "ADR" in body and "LEADER" in body
+    assert "스폰서" not in body
+
+
+def test_body_of_only_footer_is_rejected():
+    html = '<div id="dic_area">저작권자 ⓒ 한국경제 무단전재 및 재배포 금지, 자세한 내용은 홈페이지 참조</div>'
+    assert extract_article_body(html) is None
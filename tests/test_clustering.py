@@ -0,0 +1,48 @@
+"""news.clustering: 하루치 제목을 토픽으로 묶어 프롬프트를 여러 배 줄이면서 모든 제목을 포함"""
+
+import json
+import os
+import time
+
+from news.clustering import cluster_prompt_titles, cluster_titles
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "headlines.json")
+
+
+def load_headlines():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_prompt_shrinks_several_fold():
+    titles = load_headlines()
+    start = time.perf_counter()
+    lines = cluster_prompt_titles(titles)
+    elapsed = time.perf_counter() - start
+
+    before = sum(len(title) for title in titles)
+    after = sum(len(line) for line in lines)
+    assert before / after >= 3.0
+    assert elapsed < 1.0
+
+
+def test_every_title_belongs_to_one_topic():
+    titles = load_headlines()
+    clusters = cluster_titles(titles)
+    members = sorted(index for cluster in clusters for index in cluster['members'])
+    assert members == list(range(len(titles)))
+    assert sum(cluster['size'] for cluster in clusters) == len(titles)
+    for cluster in clusters:
+        assert cluster['representative'] in [titles[index] for index in cluster['members']]
+
+
+def test_restatements_share_a_topic():
+    titles = [
+        "SK텔레콤, 25년 8개월 만에 최고가 경신",
+        "美 연방정부 셧다운 우려에 뉴욕증시 혼조",
+        "\"AI 대표주자\" 평가에…SK텔레콤, 25년 8개월 만에 '최고가' [핫종목]",
+    ]
+    clusters = cluster_titles(titles)
+    assert len(clusters) == 2
+    assert clusters[0]['members'] == [0, 2]
+    assert cluster_prompt_titles(titles)[0] == "SK텔레콤, 25년 8개월 만에 최고가 경신 (2건)"
@@ -0,0 +1,40 @@
+"""news.llm_cache: 제목 집합 유사도 재사용은 같은 요청 방식·프롬프트 버전끼리만"""
+
+import sqlite3
+
+from news.llm_cache import LLMResultCache, title_signature
+
+TITLES = [f"뉴스 제목 {i}" for i in range(40)]
+
+
+def test_find_similar_matches_only_same_variant(tmp_path):
+    cache = LLMResultCache(str(tmp_path / "llm.sqlite"))
+    signature = title_signature(TITLES)
+    cache.put("single-key", "model", {"summary": "단일"}, signature=signature, variant="single")
+
+    assert cache.find_similar("model", signature, variant="single")['result'] == {"summary": "단일"}
+    assert cache.find_similar("model", signature, variant="map_reduce") is None
+    assert cache.find_similar("other-model", signature, variant="single") is None
+    cache.close()
+
+
+def test_legacy_cache_without_variant_column(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE llm_cache (key TEXT PRIMARY KEY, model TEXT NOT NULL, result TEXT NOT NULL, "
+        "signature TEXT, failed INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL, "
+        "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO llm_cache VALUES ('old', 'model', '{}', ?, 0, 0, 9e12, 0)",
+        ('["x"]',),
+    )
+    conn.commit()
+    conn.close()
+
+    cache = LLMResultCache(path)
+    assert cache.find_similar("model", ["x"], variant="single") is None
+    cache.put("new", "model", {"summary": "새 결과"}, signature=["x"], variant="single")
+    assert cache.find_similar("model", ["x"], variant="single")['result'] == {"summary": "새 결과"}
+    cache.close()
@@ -0,0 +1,81 @@
+"""crawlers.market_aggregates: 증분 합계와 등락률 순위"""
+
+import pytest
+
+from crawlers.market_aggregates import MarketAggregator, compute_aggregates
+
+
+def quote(symbol: str, change_percent: float, price: float = 100.0) -> dict:
+    return {'symbol': symbol, 'name': symbol.upper(), 'current_price': price, 'change_percent': change_percent}
+
+
+SUMMARY = {
+    'us_market': [quote('dow', 1.0), quote('nasdaq', 2.0), quote('sp500', -0.5)],
+    'asia_market': [quote('nikkei', -1.5), quote('hangseng', 0.0)],
+    'europe_market': [quote('dax', 0.5)],
+}
+
+
+def test_overview_totals():
+    overview = compute_aggregates(SUMMARY)
+    us = overview['regions']['us']
+    assert (us['count'], us['advancers'], us['decliners'], us['unchanged']) == (3, 2, 1, 0)
+    assert us['avg_change_percent'] == pytest.approx(0.83)
+    assert overview['regions']['asia']['up'] is False
+    assert overview['all_regions_up'] is False
+    assert overview['total']['count'] == 6
+    assert [m['symbol'] for m in overview['top_gainers']] == ['nasdaq', 'dow', 'dax']
+    assert [m['symbol'] for m in overview['top_losers']] == ['nikkei', 'sp500', 'hangseng']
+
+
+def test_update_subtracts_previous_value():
+    aggregator = MarketAggregator()
+    aggregator.apply_summary(SUMMARY)
+    assert aggregator.apply('asia', [quote('nikkei', 3.0), quote('hangseng', 0.0)]) == 1
+
+    overview = aggregator.overview()
+    asia = overview['regions']['asia']
+    assert (asia['count'], asia['advancers'], asia['decliners'], asia['unchanged']) == (2, 1, 0, 1)
+    assert overview['top_gainers'][0]['symbol'] == 'nikkei'
+    assert 'nikkei' not in [m['symbol'] for m in overview['top_losers']]
+    assert overview['all_regions_up'] is True
+
+    # 같은 값을 다시 반영해도 합계는 그대로
+    assert aggregator.apply('asia', [quote('nikkei', 3.0)]) == 0
+    assert aggregator.overview() is overview
+
+
+def test_incremental_matches_full_recompute():
+    aggregator = MarketAggregator()
+    aggregator.apply_summary(SUMMARY)
+    updated = {
+        **SUMMARY,
+        'us_market': [quote('dow', -2.0), quote('nasdaq', 2.0), quote('sp500', 1.5)],
+        'europe_market': [quote('dax', -0.25)],
+    }
+    aggregator.apply_summary(updated)
+    assert aggregator.overview() == compute_aggregates(updated)
+
+
+def test_records_without_change_are_ignored():
+    aggregator = MarketAggregator()
+    assert aggregator.apply('us', [{'symbol': 'dow', 'change_percent': None}, {'change_percent': 1.0}]) == 0
+    assert aggregator.overview()['total']['count'] == 0
+
+
+def test_full_snapshot_drops_missing_symbols():
+    aggregator = MarketAggregator()
+    aggregator.apply_summary(SUMMARY)
+    reduced = {**SUMMARY, 'us_market': [quote('dow', 1.0), quote('sp500', -0.5)]}
+    assert aggregator.apply_summary(reduced) == 1
+
+    overview = aggregator.overview()
+    assert overview == compute_aggregates(reduced)
+    assert 'nasdaq' not in [m['symbol'] for m in overview['top_gainers'] + overview['top_losers']]
+
+
+def test_partial_update_keeps_other_symbols():
+    aggregator = MarketAggregator()
+    aggregator.apply_summary(SUMMARY)
+    aggregator.apply('us', [quote('dow', 1.5)])
+    assert aggregator.overview()['regions']['us']['count'] == 3
@@ -0,0 +1,64 @@
+"""crawlers.market_export: 열 저장소와 JSON 저장소 선택"""
+
+import pytest
+
+from crawlers.market_columns import HistoryColumns, export_history_columns, np
+from crawlers.market_export import iter_history_rows
+from crawlers.market_history import MarketHistoryStore
+from crawlers.quote import Quote
+from utils.fast_json import dump_file
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy is not installed")
+
+
+def write_day(data_dir, date: str, price: float) -> None:
+    record = {'symbol': 'dow', 'name': '다우존스', 'current_price': price, 'previous_close': price - 1,
+              'change': 1.0, 'change_percent': 0.5, 'currency': 'USD'}
+    dump_file({'target_date': date, 'us_market': [record]}, str(data_dir / f"global_point_{date}.json"))
+
+
+def export_dates(data_dir, columns):
+    store = MarketHistoryStore(str(data_dir))
+    return [row['date'] for row in iter_history_rows(['dow'], columns=columns, store=store)], store
+
+
+def test_columns_used_when_current(tmp_path):
+    write_day(tmp_path, "2026-01-02", 100.0)
+    write_day(tmp_path, "2026-01-05", 101.0)
+    columns = HistoryColumns(export_history_columns(str(tmp_path)))
+
+    dates, store = export_dates(tmp_path, columns)
+    assert dates == ["2026-01-02", "2026-01-05"]
+    assert columns.meta['source_signature'] == store.source_signature()
+
+
+def test_stale_columns_fall_back_to_store(tmp_path):
+    write_day(tmp_path, "2026-01-02", 100.0)
+    columns = HistoryColumns(export_history_columns(str(tmp_path)))
+
+    # 열 저장소를 다시 만들기 전에 새 과거 데이터 파일이 생김
+    write_day(tmp_path, "2026-01-05", 101.0)
+    dates, _ = export_dates(tmp_path, columns)
+    assert dates == ["2026-01-02", "2026-01-05"]
+
+
+def test_realtime_summary_files_do_not_invalidate_columns(tmp_path):
+    write_day(tmp_path, "2026-01-02", 100.0)
+    columns = HistoryColumns(export_history_columns(str(tmp_path)))
+
+    # target_date가 없는 실시간 요약 파일은 과거 데이터 색인에 들어가지 않음
+    dump_file({'us_market': []}, str(tmp_path / "global_point_2026-01-06.json"))
+    store = MarketHistoryStore(str(tmp_path))
+    assert columns.open() and columns.meta['source_signature'] == store.source_signature()
+
+
+def test_fetched_quotes_are_exported(tmp_path):
+    write_day(tmp_path, "2026-01-02", 100.0)
+    columns = HistoryColumns(export_history_columns(str(tmp_path)))
+    store = MarketHistoryStore(str(tmp_path))
+    store.remember('dow', "2025-12-31", Quote.from_dict({'symbol': 'dow', 'name': '다우존스', 'date': "2025-12-31",
+                                                         'current_price': 99.0, 'currency': 'USD'}))
+
+    rows = list(iter_history_rows(['dow'], columns=columns, store=store))
+    assert [row['date'] for row in rows] == ["2025-12-31", "2026-01-02"]
+    assert rows == [{field: getattr(quote, field) for field in rows[0]} for quote in store.history('dow')]
@@ -0,0 +1,68 @@
+"""news.near_duplicate: MinHash 서명, LSH 밴드, 중복그룹 부여"""
+
+import pytest
+
+from news.near_duplicate import (
+    LSH_BANDS, LSH_ROWS, DuplicateIndex, assign_duplicate_groups, band_keys, jaccard, minhash_signature, shingles,
+)
+
+
+def article(number: int, title: str) -> dict:
+    return {'제목': title, '링크': f"https://n.news.naver.com/mnews/article/001/{number:010d}"}
+
+
+def test_shingles_ignore_spacing():
+    assert shingles("삼성 전자") == shingles("삼성전자") == {'삼성전', '성전자'}
+    assert shingles("AB") == {'ab'}
+    assert shingles("") == set()
+
+
+def test_signature_is_deterministic():
+    signature = minhash_signature(shingles("코스피 3000 돌파"))
+    assert len(signature) == LSH_BANDS * LSH_ROWS
+    assert signature == minhash_signature(shingles("코스피 3000 돌파"))
+    assert minhash_signature(set()) == [0] * (LSH_BANDS * LSH_ROWS)
+
+
+def test_identical_titles_share_every_band():
+    a = band_keys(minhash_signature(shingles("반도체 수출 역대 최대")))
+    b = band_keys(minhash_signature(shingles("반도체 수출  역대 최대")))
+    assert a == b
+    assert len(a) == LSH_BANDS
+    assert all(key.startswith(f"{band}:") for band, key in enumerate(a))
+
+
+def test_unrelated_titles_share_no_band():
+    a = band_keys(minhash_signature(shingles("반도체 수출 역대 최대 기록")))
+    b = band_keys(minhash_signature(shingles("한국은행 기준금리 동결 결정")))
+    assert not set(a) & set(b)
+
+
+def test_jaccard():
+    assert jaccard({'a', 'b'}, {'b', 'c'}) == pytest.approx(1 / 3)
+    assert jaccard(set(), {'a'}) == 0.0
+
+
+def test_assign_groups_within_run():
+    items = [
+        article(1, "삼성전자, 2분기 영업이익 10조 돌파"),
+        article(2, "한국은행 기준금리 동결"),
+        article(3, "[속보] 삼성전자, 2분기 영업이익 10조 돌파"),
+    ]
+    stats = assign_duplicate_groups(items, "2026-01-28")
+    assert items[0]['중복그룹'] == items[2]['중복그룹'] == "001_0000000001"
+    assert items[1]['중복그룹'] == "001_0000000002"
+    assert stats['groups'] == 2
+    assert stats['duplicates'] == 1
+
+
+def test_assign_groups_inherits_from_index(tmp_path):
+    index = DuplicateIndex(str(tmp_path / "duplicates.sqlite"))
+    first = [article(1, "삼성전자, 2분기 영업이익 10조 돌파")]
+    assign_duplicate_groups(first, "2026-01-28", index)
+
+    second = [article(1, "삼성전자, 2분기 영업이익 10조 돌파"), article(5, "[종합] 삼성전자, 2분기 영업이익 10조 돌파")]
+    stats = assign_duplicate_groups(second, "2026-01-29", index)
+    assert [item['중복그룹'] for item in second] == ["001_0000000001", "001_0000000001"]
+    assert stats['cross_run'] == 1
+    index.close()
@@ -0,0 +1,80 @@
+"""news.outbox: 실패한 배치는 반씩 나눠 전송하고 반복해서 거부된 항목은 dead 상태로"""
+
+import pytest
+
+from news.outbox import Outbox, flush_outbox
+
+
+class FakeTable:
+    """bad 키가 들어간 배치는 통째로 거부하는 upsert 대상"""
+
+    def __init__(self, bad=(), down=False):
+        self.bad = set(bad)
+        self.down = down
+        self.rows = {}
+        self.calls = 0
+
+    def upsert(self, rows):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("서버 응답 없음")
+        if any(row['key'] in self.bad for row in rows):
+            raise ValueError("제약 조건 위반")
+        for row in rows:
+            self.rows[row['key']] = row
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    box = Outbox(str(tmp_path / "outbox.sqlite"))
+    yield box
+    box.close()
+
+
+def enqueue(outbox, keys):
+    for key in keys:
+        outbox.enqueue(key, {'key': key})
+
+
+def flush(outbox, table, **kwargs):
+    # 백오프로 예약된 재시도 시각을 무시하고 바로 다음 플러시처럼 실행
+    outbox._connect().execute("UPDATE outbox SET next_attempt_at = 0")
+    outbox._connect().commit()
+    return flush_outbox(outbox, table.upsert, batch_size=10, max_retries=0, base_delay=0, max_delay=0, **kwargs)
+
+
+def test_bad_row_does_not_block_the_batch(outbox):
+    keys = [f"2026-07-0{i}_01" for i in range(1, 8)]
+    enqueue(outbox, keys)
+    table = FakeTable(bad={keys[3]})
+
+    stats = flush(outbox, table)
+    assert stats['sent'] == 6 and stats['failed'] == 1 and stats['pending'] == 1
+    assert set(table.rows) == set(keys) - {keys[3]}
+
+
+def test_repeatedly_rejected_row_moves_to_dead(outbox):
+    enqueue(outbox, ["bad", "a"])
+    table = FakeTable(bad={"bad"})
+    assert flush(outbox, table, max_rejections=2)['failed'] == 1
+
+    enqueue(outbox, ["b"])
+    stats = flush(outbox, table, max_rejections=2)
+    assert stats['dead'] == 1 and stats['pending'] == 0
+    assert outbox.dead_count() == 1
+    assert outbox.due(10, now=float('inf')) == []
+
+    # 같은 키를 새 내용으로 다시 기록하면 다시 전송 대상
+    enqueue(outbox, ["bad"])
+    assert outbox.pending_count() == 1 and outbox.dead_count() == 0
+
+
+def test_outage_does_not_dead_letter(outbox):
+    enqueue(outbox, ["a", "b", "c"])
+    table = FakeTable(down=True)
+    for _ in range(5):
+        stats = flush(outbox, table, max_rejections=2)
+        assert stats['dead'] == 0 and stats['pending'] == 3
+
+    table.down = False
+    assert flush(outbox, table)['sent'] == 3
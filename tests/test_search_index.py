@@ -0,0 +1,137 @@
+"""news.search_index: varint 포스팅 인코딩, 조각 병합, 아카이브 변경 반영"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from news.archive import NewsArchive
+from news.body_fetcher import BodyCache
+from news.search_index import NewsSearchIndex, bigrams, decode_postings, encode_postings
+
+
+def article(number: int, title: str) -> dict:
+    return {'제목': title, '링크': f"https://n.news.naver.com/mnews/article/001/{number:010d}"}
+
+
+@pytest.fixture
+def index(tmp_path):
+    archive = NewsArchive(str(tmp_path / "archive"))
+    body_cache = BodyCache(str(tmp_path / "bodies"))
+    search_index = NewsSearchIndex(str(tmp_path / "search.sqlite"), archive=archive, body_cache=body_cache)
+    yield search_index
+    search_index.close()
+
+
+@pytest.mark.parametrize("doc_ids", [
+    [],
+    [1],
+    [1, 2, 3],
+    [0, 127, 128, 16383, 16384, 2 ** 21, 2 ** 35],
+])
+def test_postings_round_trip(doc_ids):
+    assert decode_postings(encode_postings(doc_ids)) == doc_ids
+
+
+def test_postings_use_deltas():
+    # 127 이하의 차이는 1바이트, 128부터 2바이트
+    assert encode_postings([100, 227]) == bytes([100, 127])
+    assert len(encode_postings([100, 228])) == 3
+    assert decode_postings(encode_postings([300, 301], previous=0)) == [300, 301]
+
+
+def test_bigrams():
+    assert bigrams("[속보] 삼성전자") == {'속보', '삼성', '성전', '전자'}
+    assert bigrams("A 주가") == {'a', '주가'}
+    assert bigrams("") == set()
+
+
+def test_refresh_appends_only_new_articles(index):
+    today = datetime.now().strftime('%Y-%m-%d')
+    index.archive.append(today, [article(1, "삼성전자 실적 발표"), article(2, "반도체 수출 증가")])
+    assert index.refresh(force=True) == 2
+
+    index.archive.append(today, [article(2, "반도체 수출 증가"), article(3, "삼성전자 신제품 공개")])
+    assert index.refresh(force=True) == 1
+    assert index.refresh(force=True) == 0
+
+    result = index.search("삼성전자")
+    assert result['total'] == 2
+    assert [item['title'] for item in result['results']] == ["삼성전자 신제품 공개", "삼성전자 실적 발표"]
+
+
+def test_compact_merges_batches_without_changing_results(index):
+    today = datetime.now().strftime('%Y-%m-%d')
+    for number in range(1, 6):
+        index.archive.append(today, [article(number, f"반도체 기사 {number}")])
+        index.refresh(force=True)
+
+    conn = index._connect()
+    assert conn.execute("SELECT COUNT(DISTINCT batch) FROM postings").fetchone()[0] == 5
+    before = index.search("반도체")
+
+    index.compact()
+    assert conn.execute("SELECT DISTINCT batch FROM postings").fetchall() == [(0,)]
+    data = conn.execute("SELECT data FROM postings WHERE term = '반도'").fetchone()[0]
+    assert decode_postings(data) == [1, 2, 3, 4, 5]
+    assert index.search("반도체") == before
+
+
+def test_body_added_after_indexing_is_searchable(index):
+    today = datetime.now().strftime('%Y-%m-%d')
+    index.archive.append(today, [article(1, "반도체 수출 증가")])
+    index.refresh(force=True)
+    assert index.search("하이닉스")['total'] == 0
+
+    index.body_cache.put("001_0000000001", "메모리 가격 상승으로 하이닉스 이익 개선")
+    index.refresh(force=True)
+    assert index.search("하이닉스")['total'] == 1
+
+    # 본문 용어가 기존 조각과 겹쳐도 병합 후 문서 번호는 한 번만 남음
+    index.compact()
+    assert index.search("하이닉스")['total'] == 1
+
+
+def test_pruned_days_are_removed(index):
+    today = datetime.now().strftime('%Y-%m-%d')
+    index.archive.append("2000-01-01", [article(1, "삼성전자 실적 발표")])
+    index.archive.append(today, [article(2, "삼성전자 신제품 공개")])
+    index.refresh(force=True)
+    assert index.search("삼성전자")['total'] == 2
+
+    index.archive.prune(30)
+    index.refresh(force=True)
+    assert index.search("삼성전자")['total'] == 1
+    conn = index._connect()
+    assert conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0] == 1
+    assert conn.execute("SELECT date FROM sources").fetchall() == [(today,)]
+
+
+def test_rewritten_segment_is_read_from_start(index):
+    today = datetime.now().strftime('%Y-%m-%d')
+    index.archive.append(today, [article(1, "삼성전자 실적 발표"), article(2, "반도체 수출 증가 전망")])
+    index.refresh(force=True)
+
+    # 세그먼트가 더 작은 파일로 다시 쓰이면 기록된 오프셋이 파일 크기보다 큼
+    os.remove(index.archive.segment_path(today))
+    os.remove(index.archive.index_path(today))
+    index.archive.append(today, [article(3, "새 기사")])
+    assert index.refresh(force=True) == 1
+    assert index.search("새 기사")['total'] == 1
+
+
+def test_two_instances_do_not_collide(tmp_path, index):
+    today = datetime.now().strftime('%Y-%m-%d')
+    other = NewsSearchIndex(index.path, archive=index.archive, body_cache=index.body_cache)
+    index.archive.append(today, [article(1, "삼성전자 실적 발표")])
+    assert index.refresh(force=True) == 1
+    assert other.refresh(force=True) == 0
+
+    index.archive.append(today, [article(2, "삼성전자 신제품 공개")])
+    assert other.refresh(force=True) == 1
+    assert index.refresh(force=True) == 0
+    other.close()
+
+    doc_ids = [row[0] for row in index._connect().execute("SELECT doc_id FROM docs ORDER BY doc_id")]
+    assert doc_ids == [1, 2]
+    assert index.search("삼성전자")['total'] == 2
@@ -0,0 +1,58 @@
+"""utils.snapshot_cache: Accept-Encoding 협상과 인코딩별 ETag"""
+
+import pytest
+
+from utils import snapshot_cache
+from utils.snapshot_cache import MIN_COMPRESS_SIZE, Snapshot, SnapshotCache
+
+
+@pytest.fixture
+def snapshot():
+    return Snapshot({}, b"x" * MIN_COMPRESS_SIZE, '"abc"')
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("GZIP ; Q=0.8", "gzip"),
+    ("gzip;q=0", None),
+    ("gzip;q=0.0, deflate", None),
+    ("*", "gzip"),
+    ("*;q=0", None),
+    ("*, gzip;q=0", None),
+])
+def test_choose_encoding_without_brotli(monkeypatch, snapshot, header, expected):
+    monkeypatch.setattr(snapshot_cache, "brotli", None)
+    assert snapshot.choose_encoding(header) == expected
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, br", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("gzip;q=0.5, br;q=0.4", "gzip"),
+    ("gzip;q=0.4, br;q=0.5", "br"),
+])
+def test_choose_encoding_with_brotli(monkeypatch, snapshot, header, expected):
+    monkeypatch.setattr(snapshot_cache, "brotli", object())
+    assert snapshot.choose_encoding(header) == expected
+
+
+def test_small_body_is_not_compressed():
+    assert Snapshot({}, b"x", '"abc"').choose_encoding("gzip") is None
+
+
+def test_encoded_bodies_have_their_own_etag(snapshot):
+    assert snapshot.etag_for(None) == '"abc"'
+    assert snapshot.etag_for("gzip") == '"abc-gzip"'
+    assert snapshot.matches('"abc-gzip"')
+    assert snapshot.matches('W/"abc", "zzz"')
+    assert not snapshot.matches('"abd"')
+
+
+def test_unchanged_content_keeps_snapshot():
+    cache = SnapshotCache(ttl=0)
+    first = cache.get("key", lambda: {"value": 1, "timestamp": "a"})
+    second = cache.get("key", lambda: {"value": 1, "timestamp": "b"})
+    assert second is first
+    assert cache.get("key", lambda: {"value": 2}).etag != first.etag
@@ -0,0 +1,62 @@
+"""news.stock_extractor: Aho-Corasick 매칭과 경계 규칙"""
+
+import pytest
+
+from news.stock_extractor import AhoCorasick, StockExtractor, format_stock_hint, format_topstock
+
+LISTING = """code,name,market,aliases
+005930,삼성전자,KOSPI,삼전
+005935,삼성전자우,KOSPI,
+000660,SK하이닉스,KOSPI,하이닉스
+034730,SK,KOSPI,
+003550,LG,KOSPI,
+"""
+
+
+@pytest.fixture(scope="module")
+def extractor(tmp_path_factory):
+    path = tmp_path_factory.mktemp("listing") / "listing.csv"
+    path.write_text(LISTING, encoding='utf-8')
+    return StockExtractor(str(path))
+
+
+def names(extractor, text):
+    return [match['name'] for match in extractor.find(text)]
+
+
+def test_automaton_finds_overlapping_patterns():
+    automaton = AhoCorasick()
+    for index, pattern in enumerate(["he", "she", "hers"]):
+        automaton.add(pattern, index)
+    automaton.build()
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+
+def test_longest_match_wins(extractor):
+    assert names(extractor, "삼성전자우 급등") == ["삼성전자우"]
+    assert names(extractor, "SK하이닉스 신고가") == ["SK하이닉스"]
+
+
+def test_alias_and_code(extractor):
+    assert names(extractor, "삼전 주가, 005930 거래량") == ["삼성전자", "삼성전자"]
+    # 더 긴 숫자 안의 종목코드는 제외
+    assert names(extractor, "1005930원") == []
+
+
+def test_short_ascii_name_boundaries(extractor):
+    # 조사는 허용, 다른 단어로 이어지면 제외
+    assert names(extractor, "SK는 반등, LG의 신사업") == ["SK", "LG"]
+    assert names(extractor, "SK증권 목표가") == []
+    assert names(extractor, "SKT 요금제, BLG 우승") == []
+
+
+def test_two_letter_hangul_alias_needs_word_start(extractor):
+    assert names(extractor, "삼전 반등") == ["삼성전자"]
+    assert names(extractor, "관삼전 개최") == []
+
+
+def test_rank_counts_titles_once(extractor):
+    ranked = extractor.rank(["삼성전자 삼성전자 실적", "삼전 반등", "하이닉스 급등"])
+    assert [(stock['name'], stock['count']) for stock in ranked] == [("삼성전자", 2), ("SK하이닉스", 1)]
+    assert format_topstock(ranked) == "삼성전자, SK하이닉스"
+    assert format_stock_hint(ranked) == "삼성전자(2), SK하이닉스(1)"
@@ -0,0 +1,52 @@
+"""news.trends: 새로 붙은 기사만 집계, 여러 프로세스가 같은 집계표를 갱신할 때 중복 집계 방지"""
+
+import pytest
+
+from news.archive import NewsArchive
+from news.trends import TrendCounter
+
+DATE = "2026-07-09"
+
+
+def article(number: int, title: str) -> dict:
+    return {'제목': title, '링크': f"https://n.news.naver.com/mnews/article/001/{number:010d}"}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return NewsArchive(str(tmp_path / "archive"))
+
+
+def term_count(counter: TrendCounter, term: str) -> int:
+    row = counter._connect().execute(
+        "SELECT count FROM term_counts WHERE date = ? AND term = ?", (DATE, term)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def test_refresh_counts_only_new_articles(tmp_path, archive):
+    counter = TrendCounter(str(tmp_path / "trends.sqlite"), archive=archive)
+    archive.append(DATE, [article(1, "반도체 수출 증가"), article(2, "반도체 가격 상승")])
+    assert counter.refresh(force=True) == 2
+    assert counter.refresh(force=True) == 0
+
+    archive.append(DATE, [article(3, "반도체 투자 확대")])
+    assert counter.refresh(force=True) == 1
+    assert term_count(counter, "반도체") == 3
+    counter.close()
+
+
+def test_overlapping_refresh_does_not_double_count(tmp_path, archive):
+    path = str(tmp_path / "trends.sqlite")
+    first = TrendCounter(path, archive=archive)
+    second = TrendCounter(path, archive=archive)
+    archive.append(DATE, [article(1, "반도체 수출 증가"), article(2, "반도체 가격 상승")])
+
+    # 두 번째 프로세스가 sources를 읽은 뒤 첫 번째 프로세스가 먼저 집계한 상황
+    assert first.refresh(force=True) == 2
+    assert second._count_date(DATE) == 0
+    assert second.refresh(force=True) == 0
+    assert term_count(first, "반도체") == 2
+    assert first._connect().execute("SELECT articles FROM day_totals").fetchone()[0] == 2
+    first.close()
+    second.close()
@@ -0,0 +1,106 @@
+"""
+열 저장소(.npy 메모리 맵)와 JSON 파싱의 과거 데이터 조회 시간 비교
+global_point_monthly.json을 날짜만 바꿔 --scale배로 늘린 임시 데이터(여러 해 분량)를 만들고,
+지수 하나의 전체 시계열을 읽는 시간을 JSON 전체 파싱과 메모리 맵 슬라이스로 비교합니다.
+
+사용법:
+    python tools/bench_columns.py
+    python tools/bench_columns.py --scale 40 --symbol nasdaq
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from crawlers.market_columns import HistoryColumns, export_history_columns, np  # noqa: E402
+from crawlers.market_history import MARKET_KEYS, MONTHLY_FILENAME  # noqa: E402
+from utils.fast_json import dump_file, load_file  # noqa: E402
+
+DEFAULT_FILE = os.path.join(PROJECT_ROOT, "data", MONTHLY_FILENAME)
+
+
+def build_dataset(source: str, scale: int, data_dir: str) -> int:
+    """월간 파일을 날짜만 바꿔 scale배로 이어 붙인 월간 파일 생성, 날짜 수 반환"""
+    days = [day for day in load_file(source)['data'] if day.get('has_data')]
+    start = datetime(2000, 1, 1)
+    scaled = []
+    for i in range(len(days) * scale):
+        day = days[i % len(days)]
+        date = (start + timedelta(days=i)).strftime('%Y-%m-%d')
+        scaled.append({
+            **day,
+            'date': date,
+            **{key: [{**record, 'date': date} for record in day[key]] for key in MARKET_KEYS},
+        })
+    dump_file({'collection_info': {}, 'data': scaled}, os.path.join(data_dir, MONTHLY_FILENAME), compact=True)
+    return len(scaled)
+
+
+def read_json_series(path: str, symbol: str) -> list:
+    """JSON 전체를 파싱해 지수 하나의 종가 시계열 추출"""
+    series = []
+    for day in load_file(path)['data']:
+        for key in MARKET_KEYS:
+            for record in day.get(key, []):
+                if record['symbol'] == symbol:
+                    series.append(record['current_price'])
+    return series
+
+
+def read_column_series(path: str, symbol: str):
+    """열 저장소를 새로 열어 지수 하나의 종가 시계열 추출"""
+    return HistoryColumns(path).series(symbol, ['current_price'])['current_price']
+
+
+def measure(func, runs: int) -> float:
+    """여러 번 실행한 중앙값 (밀리초)"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="열 저장소 / JSON 과거 데이터 조회 비교")
+    parser.add_argument("--file", default=DEFAULT_FILE, help="원본 월간 수집 파일")
+    parser.add_argument("--scale", type=int, default=20, help="데이터 확장 배수")
+    parser.add_argument("--symbol", default="dow", help="조회할 지수")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    args = parser.parse_args()
+
+    if np is None:
+        print("⚠️  numpy가 설치되어 있지 않아 열 저장소를 측정할 수 없습니다.")
+        exit(1)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        day_count = build_dataset(args.file, args.scale, data_dir)
+        json_path = os.path.join(data_dir, MONTHLY_FILENAME)
+
+        start = time.perf_counter()
+        columns_dir = export_history_columns(data_dir)
+        export_ms = (time.perf_counter() - start) * 1000
+
+        json_series = read_json_series(json_path, args.symbol)
+        column_series = read_column_series(columns_dir, args.symbol)
+        assert json_series == column_series.tolist(), "열 저장소 결과가 JSON과 다릅니다"
+
+        json_ms = measure(lambda: read_json_series(json_path, args.symbol), args.runs)
+        column_ms = measure(lambda: read_column_series(columns_dir, args.symbol), args.runs)
+
+        print("\n" + "="*60)
+        print(f"[DATA] {day_count:,}일 (JSON {os.path.getsize(json_path):,} bytes)")
+        print("="*60)
+        print(f"  열 저장소 내보내기      {export_ms:9.1f}ms")
+        print(f"  JSON 파싱 후 추출       {json_ms:9.2f}ms")
+        print(f"  메모리 맵 열기 + 슬라이스 {column_ms:9.2f}ms")
+        print(f"  → {json_ms / column_ms:.0f}배 빠름 ({args.symbol} {len(column_series):,}개 값)")
+        print("="*60 + "\n")
@@ -0,0 +1,87 @@
+"""
+newdata 모듈 콜드 import 시간 측정
+python -X importtime 출력을 파싱해 크롤링 함수만 쓸 때의 import 비용이
+예산 안에 있는지, openai/supabase 같은 무거운 패키지를 미리 불러오지 않는지 확인합니다.
+
+사용법:
+    python tools/bench_import.py
+    python tools/bench_import.py --budget-ms 300 --runs 7
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# 크롤링 함수만 import할 때 불러오면 안 되는 패키지
+FORBIDDEN_MODULES = ("openai", "supabase", "gotrue", "postgrest", "httpx")
+
+# 기본 예산 (밀리초)
+DEFAULT_BUDGET_MS = 350
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_once(module: str, statement: str) -> dict:
+    """새 인터프리터에서 한 번 import하여 누적 시간과 불러온 최상위 패키지 목록 반환"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "0"},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+
+    cumulative_us = None
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        packages.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(parts[1])
+    return {"cumulative_ms": (cumulative_us or 0) / 1000, "packages": packages}
+
+
+def run_benchmark(module: str, statement: str, runs: int, budget_ms: float) -> bool:
+    """여러 번 측정한 중앙값을 예산과 비교"""
+    # 첫 실행은 .pyc 생성 비용이 섞이므로 버림
+    measure_once(module, statement)
+    samples = [measure_once(module, statement) for _ in range(runs)]
+
+    times = [sample["cumulative_ms"] for sample in samples]
+    median_ms = statistics.median(times)
+    loaded = set().union(*(sample["packages"] for sample in samples))
+    forbidden = sorted(name for name in FORBIDDEN_MODULES if name in loaded)
+
+    print("\n" + "="*60)
+    print(f"[IMPORT] {statement}")
+    print(f"[측정] {runs}회, 중앙값 {median_ms:.1f}ms (최소 {min(times):.1f}ms / 최대 {max(times):.1f}ms)")
+    print(f"[예산] {budget_ms:.0f}ms → {'통과' if median_ms <= budget_ms else '초과'}")
+    if forbidden:
+        print(f"[경고] 지연 로딩 대상 패키지가 import됨: {', '.join(forbidden)}")
+    else:
+        print(f"[OK] {', '.join(FORBIDDEN_MODULES)} 미로딩 확인")
+    print("="*60 + "\n")
+
+    return median_ms <= budget_ms and not forbidden
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="newdata 콜드 import 시간 측정")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="허용 import 시간 (밀리초)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    args = parser.parse_args()
+
+    ok = run_benchmark(
+        "newdata",
+        "from newdata import fetch_news_list_from_page, fetch_all_pages_news",
+        args.runs,
+        args.budget_ms,
+    )
+    exit(0 if ok else 1)
@@ -0,0 +1,81 @@
+"""
+JSON 직렬화/파싱 속도 비교
+실제 데이터 파일(global_point_monthly.json, todaynews.json)로
+표준 json과 utils.fast_json(orjson)의 쓰기(들여쓰기/압축)·읽기 시간과 결과 크기를 비교합니다.
+
+사용법:
+    python tools/bench_json.py
+    python tools/bench_json.py --runs 50 data/2026-01-28_01.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import fast_json  # noqa: E402
+
+# 기본 측정 대상
+DEFAULT_FILES = (
+    os.path.join(PROJECT_ROOT, "data", "global_point_monthly.json"),
+    os.path.join(PROJECT_ROOT, "data", "todaynews.json"),
+)
+
+
+def measure(func, runs: int) -> float:
+    """여러 번 실행한 중앙값 (밀리초)"""
+    func()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_file(path: str, runs: int) -> None:
+    """파일 하나에 대해 방식별 시간과 크기 출력"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    obj = json.loads(raw)
+
+    cases = [
+        ("json 쓰기 (indent=2)", lambda: json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')),
+        ("fast 쓰기 (indent=2)", lambda: fast_json.dumps(obj, indent=True)),
+        ("json 쓰기 (압축)", lambda: json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')),
+        ("fast 쓰기 (압축)", lambda: fast_json.dumps(obj)),
+        ("json 읽기", lambda: json.loads(raw)),
+        ("fast 읽기", lambda: fast_json.loads(raw)),
+    ]
+
+    print("\n" + "="*60)
+    print(f"[FILE] {os.path.relpath(path, PROJECT_ROOT)} ({len(raw):,} bytes)")
+    print("="*60)
+    results = {}
+    for name, func in cases:
+        results[name] = measure(func, runs)
+        size = len(func()) if "쓰기" in name else len(raw)
+        print(f"  {name:<22} {results[name]:8.3f}ms  {size:>9,} bytes")
+
+    for label in ("쓰기 (indent=2)", "쓰기 (압축)", "읽기"):
+        base, fast = results[f"json {label}"], results[f"fast {label}"]
+        print(f"  → {label}: {base / fast:.1f}배")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON 직렬화/파싱 속도 비교")
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES, help="측정할 JSON 파일")
+    parser.add_argument("--runs", type=int, default=20, help="측정 횟수")
+    args = parser.parse_args()
+
+    print(f"[백엔드] {'orjson ' + fast_json.orjson.__version__ if fast_json.orjson else '표준 json (orjson 미설치)'}")
+    for path in args.files:
+        if not os.path.exists(path):
+            print(f"⚠️  파일 없음: {path}")
+            continue
+        bench_file(path, args.runs)
@@ -0,0 +1,65 @@
+"""
+지수 레코드 메모리 사용량 비교
+global_point_monthly.json의 지수 레코드를 여러 번 불러와(여러 달/여러 파일을 읽은 상황)
+dict 레코드와 Quote 레코드가 레코드당 차지하는 메모리를 tracemalloc으로 측정합니다.
+
+사용법:
+    python tools/bench_quote_memory.py
+    python tools/bench_quote_memory.py --repeat 200 data/global_point_monthly.json
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from crawlers.market_history import MARKET_KEYS  # noqa: E402
+from crawlers.quote import Quote  # noqa: E402
+from utils.fast_json import loads  # noqa: E402
+
+DEFAULT_FILE = os.path.join(PROJECT_ROOT, "data", "global_point_monthly.json")
+
+
+def iter_records(raw: bytes, repeat: int):
+    """파일을 repeat번 새로 파싱하여 지수 dict 레코드를 하나씩 반환 (파싱 결과는 파일마다 별도 객체)"""
+    for _ in range(repeat):
+        for day in loads(raw).get('data', []):
+            for market_key in MARKET_KEYS:
+                for record in day.get(market_key, []):
+                    yield {**record, 'date': record.get('date') or day.get('date')}
+
+
+def measure(build) -> tuple:
+    """build()가 만든 레코드 리스트가 차지하는 메모리 (바이트, 레코드 수)"""
+    gc.collect()
+    tracemalloc.start()
+    records = build()
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used, len(records)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="dict/Quote 레코드 메모리 비교")
+    parser.add_argument("file", nargs="?", default=DEFAULT_FILE, help="월간 수집 파일")
+    parser.add_argument("--repeat", type=int, default=100, help="파일을 다시 읽는 횟수")
+    args = parser.parse_args()
+
+    with open(args.file, 'rb') as f:
+        raw = f.read()
+
+    dict_bytes, count = measure(lambda: list(iter_records(raw, args.repeat)))
+    quote_bytes, _ = measure(lambda: [Quote.from_dict(record) for record in iter_records(raw, args.repeat)])
+
+    print("\n" + "="*60)
+    print(f"[FILE] {os.path.relpath(args.file, PROJECT_ROOT)} × {args.repeat} ({count:,}개 레코드)")
+    print("="*60)
+    print(f"  dict 레코드   {dict_bytes / 1024 / 1024:8.2f}MB  ({dict_bytes / count:6.0f} bytes/레코드)")
+    print(f"  Quote 레코드  {quote_bytes / 1024 / 1024:8.2f}MB  ({quote_bytes / count:6.0f} bytes/레코드)")
+    print(f"  → {dict_bytes / quote_bytes:.1f}배 감소")
+    print("="*60 + "\n")
@@ -0,0 +1,137 @@
+"""
+로컬 OpenAI Chat Completions 대역 서버
+실제 API 키 없이 요약 로직(단일/맵-리듀스)을 검증할 때 사용합니다.
+
+사용법:
+    # 대역 서버만 실행 (다른 터미널에서 OPENAI_BASE_URL=http://127.0.0.1:8765/v1 로 newdata.py 실행)
+    python tools/mock_openai_server.py --port 8765 --latency 1.0
+
+    # 대역 서버를 띄우고 200개 제목으로 맵-리듀스 요약을 바로 검증
+    python tools/mock_openai_server.py --selftest
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockChatCompletionsHandler(BaseHTTPRequestHandler):
+    """POST /v1/chat/completions 요청에 [요약]/[추천종목] 형식으로 응답"""
+
+    latency = 0.5
+    requests_seen = []
+    lock = threading.Lock()
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+        user_message = next(
+            (m['content'] for m in reversed(body.get('messages', [])) if m.get('role') == 'user'), ''
+        )
+
+        with self.lock:
+            self.requests_seen.append({'time': time.time(), 'user': user_message})
+
+        time.sleep(self.latency)
+
+        # 요청에 포함된 제목 수를 그대로 요약에 표시해 커버리지를 확인할 수 있게 함
+        title_count = len(re.findall(r'^- ', user_message, flags=re.M))
+        partial_count = len(re.findall(r'^\[부분 요약', user_message, flags=re.M))
+        content = (
+            f"[요약]\n대역 서버 요약: 제목 {title_count}개, 부분 요약 {partial_count}개를 받았습니다.\n\n"
+            f"[추천종목]\n삼성전자, SK하이닉스, 현대차, 기아, NAVER, 카카오, LG에너지솔루션, 셀트리온, POSCO홀딩스, KB금융"
+        )
+        payload = {
+            'id': f"chatcmpl-mock-{len(self.requests_seen)}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'mock'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': len(user_message), 'completion_tokens': len(content), 'total_tokens': len(user_message) + len(content)},
+        }
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port: int = 0, latency: float = 0.5) -> ThreadingHTTPServer:
+    """대역 서버를 백그라운드 스레드로 시작"""
+    MockChatCompletionsHandler.latency = latency
+    server = ThreadingHTTPServer(('127.0.0.1', port), MockChatCompletionsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_selftest(latency: float, title_count: int) -> bool:
+    """대역 서버로 맵-리듀스 요약의 커버리지와 지연 시간 확인"""
+    server = start_server(latency=latency)
+    os.environ['OPENAI_API_KEY'] = 'mock-key'
+    os.environ['OPENAI_BASE_URL'] = f"http://127.0.0.1:{server.server_port}/v1"
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import newdata
+    from openai import OpenAI
+    from news.llm_cache import LLMResultCache
+
+    newdata.openai_client = OpenAI(api_key='mock-key', base_url=os.environ['OPENAI_BASE_URL'])
+    newdata.summary_cache = LLMResultCache(path=':memory:')
+
+    titles = [f"테스트 뉴스 제목 {i:03d}" for i in range(title_count)]
+
+    start = time.perf_counter()
+    summary, topstock = newdata.get_summary_and_stocks_with_openai(titles)
+    elapsed = time.perf_counter() - start
+
+    # 토픽 압축을 쓰면 토픽 대표 제목 수가 전달되어야 할 제목 수
+    expected = len(newdata.cluster_prompt_titles(titles)) if newdata.SUMMARY_CLUSTER else title_count
+    covered = sum(len(re.findall(r'^- ', r['user'], flags=re.M)) for r in MockChatCompletionsHandler.requests_seen)
+    print("\n" + "="*60)
+    print(f"[요약] {summary}")
+    print(f"[추천종목] {topstock}")
+    print(f"[요청 수] {len(MockChatCompletionsHandler.requests_seen)}회")
+    print(f"[커버리지] {covered}/{expected}개 제목 전달 (원본 제목 {title_count}개)")
+    print(f"[소요 시간] {elapsed:.2f}초 (대역 서버 1회 지연 {latency:.2f}초)")
+    print("="*60)
+
+    server.shutdown()
+    return covered == expected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 OpenAI Chat Completions 대역 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.5, help="응답 지연 시간 (초)")
+    parser.add_argument('--selftest', action='store_true', help="맵-리듀스 요약 검증 실행")
+    parser.add_argument('--titles', type=int, default=200, help="검증에 사용할 제목 수")
+    args = parser.parse_args()
+
+    if args.selftest:
+        ok = run_selftest(args.latency, args.titles)
+        exit(0 if ok else 1)
+
+    server = start_server(args.port, args.latency)
+    print(f"🧪 OpenAI 대역 서버 실행 중: http://127.0.0.1:{args.port}/v1 (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,132 @@
+"""
+로컬 Supabase REST(PostgREST) 대역 서버
+아웃박스 일괄 전송(upsert, 재시도, 백오프)을 실제 DB 없이 검증할 때 사용합니다.
+
+사용법:
+    # 대역 서버만 실행 (SUPABASE_URL=http://127.0.0.1:8766 SUPABASE_KEY=a.b.c 로 newdata.py 실행)
+    python tools/mock_supabase_server.py --port 8766
+
+    # 처음 2번은 503으로 실패하는 대역 서버로 아웃박스 전송 검증
+    python tools/mock_supabase_server.py --selftest --fail-first 2
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class MockPostgrestHandler(BaseHTTPRequestHandler):
+    """POST /rest/v1/{table}?on_conflict=컬럼 요청을 메모리 테이블에 upsert"""
+
+    tables = {}
+    fail_remaining = 0
+    requests_seen = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        if not parsed.path.startswith('/rest/v1/'):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'[]')
+        rows = body if isinstance(body, list) else [body]
+        table_name = parsed.path[len('/rest/v1/'):]
+        conflict_column = (parse_qs(parsed.query).get('on_conflict') or [None])[0]
+
+        with self.lock:
+            MockPostgrestHandler.requests_seen += 1
+            if MockPostgrestHandler.fail_remaining > 0:
+                MockPostgrestHandler.fail_remaining -= 1
+                self._send_json(503, {'message': 'mock service unavailable'})
+                return
+
+            table = self.tables.setdefault(table_name, {})
+            saved = []
+            for row in rows:
+                key = row.get(conflict_column) if conflict_column else len(table)
+                row = {**table.get(key, {}), **row}
+                row.setdefault('id', len(table) + 1)
+                table[key] = row
+                saved.append(row)
+
+        self._send_json(201, saved)
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port: int = 0, fail_first: int = 0) -> ThreadingHTTPServer:
+    """대역 서버를 백그라운드 스레드로 시작"""
+    MockPostgrestHandler.fail_remaining = fail_first
+    server = ThreadingHTTPServer(('127.0.0.1', port), MockPostgrestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_selftest(fail_first: int, records: int) -> bool:
+    """대역 서버로 아웃박스 기록 → 일괄 upsert → 재시도 동작 확인"""
+    server = start_server(fail_first=fail_first)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from supabase import create_client
+    import newdata
+    from news.outbox import Outbox, flush_outbox
+
+    newdata.supabase_client = create_client(f"http://127.0.0.1:{server.server_port}", "mock.mock.mock")
+    outbox = Outbox(os.path.join(tempfile.mkdtemp(), 'outbox.sqlite'))
+
+    # 같은 cont_date를 두 번 기록해도 최신 내용 1건만 전송되어야 함
+    for i in range(records):
+        outbox.enqueue(f"2026-01-28_{i + 1:02d}", {'cont_date': f"2026-01-28_{i + 1:02d}", 'summary': 'v1', 'topstock': '', 'content': []})
+    outbox.enqueue("2026-01-28_01", {'cont_date': "2026-01-28_01", 'summary': 'v2', 'topstock': '', 'content': []})
+
+    start = time.perf_counter()
+    stats = flush_outbox(outbox, newdata.send_news_batch, batch_size=20, max_retries=fail_first, base_delay=0.05)
+    elapsed = time.perf_counter() - start
+
+    table = MockPostgrestHandler.tables.get('daily_new', {})
+    print("\n" + "="*60)
+    print(f"[전송 통계] {stats}")
+    print(f"[요청 수] {MockPostgrestHandler.requests_seen}회 (실패 {fail_first}회 포함)")
+    print(f"[저장 레코드] {len(table)}개, 2026-01-28_01 summary = {table.get('2026-01-28_01', {}).get('summary')}")
+    print(f"[소요 시간] {elapsed:.2f}초")
+    print("="*60)
+
+    server.shutdown()
+    return stats['pending'] == 0 and len(table) == records and table['2026-01-28_01']['summary'] == 'v2'
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 Supabase REST 대역 서버")
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--fail-first', type=int, default=0, help="처음 N번의 요청을 503으로 실패")
+    parser.add_argument('--selftest', action='store_true', help="아웃박스 일괄 전송 검증 실행")
+    parser.add_argument('--records', type=int, default=45, help="검증에 사용할 레코드 수")
+    args = parser.parse_args()
+
+    if args.selftest:
+        ok = run_selftest(args.fail_first, args.records)
+        exit(0 if ok else 1)
+
+    server = start_server(args.port, args.fail_first)
+    print(f"🧪 Supabase REST 대역 서버 실행 중: http://127.0.0.1:{args.port} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
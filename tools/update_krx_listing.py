@@ -0,0 +1,122 @@
+"""
+KRX 상장 종목 전체 목록으로 news/krx_listing.csv 갱신
+KIND(한국거래소 기업공시채널)의 상장법인 목록을 내려받아 KOSPI/KOSDAQ 종목을 모두 담고,
+기존 파일에 적어 둔 별칭(aliases)과 우선주 등 직접 추가한 종목은 그대로 유지합니다.
+기존 종목이 앞에 오고 새 종목은 종목코드 순으로 뒤에 붙습니다.
+
+KIND 다운로드 파일은 EUC-KR HTML 표이므로 네트워크가 막힌 환경에서는
+브라우저로 받은 파일을 --file로 넘겨도 됩니다.
+
+사용법:
+    python tools/update_krx_listing.py
+    python tools/update_krx_listing.py --file ~/Downloads/상장법인목록.xls
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+import requests
+from bs4 import BeautifulSoup
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from news.stock_extractor import LISTING_PATH  # noqa: E402
+
+# KIND 상장법인 목록 다운로드 주소 (searchType=13: 상장법인 전체)
+KIND_URL = "https://kind.krx.co.kr/corpgeneral/corpList.do?method=download&searchType=13"
+
+# KIND 시장구분 → 목록의 market 값 (코넥스 등 나머지는 제외)
+MARKET_NAMES = {'유가': 'KOSPI', '코스닥': 'KOSDAQ'}
+
+# 일반 단어와 겹쳐 제목에서 오탐이 많은 종목명 (목록에 넣지 않음, 필요하면 별칭과 함께 직접 추가)
+AMBIGUOUS_NAMES = {'대상', '레이', '서한', '동방', '선진', '우진', '대원', '영풍', '태영', '화신', '삼보', '세원'}
+
+FIELDNAMES = ['code', 'name', 'market', 'aliases']
+
+
+def fetch_kind_listing(path: str = None) -> str:
+    """KIND 상장법인 목록 HTML (path를 주면 로컬 파일 사용)"""
+    if path:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    else:
+        response = requests.get(KIND_URL, headers={'User-Agent': 'Mozilla/5.0'}, timeout=30)
+        response.raise_for_status()
+        raw = response.content
+    return raw.decode('euc-kr', errors='replace')
+
+
+def parse_kind_listing(html: str) -> list:
+    """KIND 목록 표에서 KOSPI/KOSDAQ 종목 추출 [{'code', 'name', 'market'}]"""
+    rows = BeautifulSoup(html, 'html.parser').find_all('tr')
+    if not rows:
+        return []
+    header = [cell.get_text(strip=True) for cell in rows[0].find_all(['th', 'td'])]
+    name_col, market_col, code_col = header.index('회사명'), header.index('시장구분'), header.index('종목코드')
+
+    stocks = []
+    for row in rows[1:]:
+        cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+        if len(cells) < len(header):
+            continue
+        market = MARKET_NAMES.get(cells[market_col])
+        if market is None:
+            continue
+        stocks.append({'code': cells[code_col].zfill(6), 'name': cells[name_col], 'market': market})
+    return stocks
+
+
+def merge_listing(existing: list, stocks: list) -> list:
+    """기존 목록(별칭 유지) 뒤에 새 종목을 종목코드 순으로 추가 (오탐이 많은 종목명 제외)"""
+    known_codes = {row['code'] for row in existing}
+    merged = list(existing)
+    for stock in sorted(stocks, key=lambda s: s['code']):
+        if stock['code'] in known_codes:
+            continue
+        if stock['name'] in AMBIGUOUS_NAMES:
+            continue
+        merged.append({**stock, 'aliases': ''})
+        known_codes.add(stock['code'])
+    return merged
+
+
+def read_listing(path: str) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [{field: (row.get(field) or '').strip() for field in FIELDNAMES} for row in csv.DictReader(f)]
+
+
+def write_listing(rows: list, path: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KRX 상장 종목 목록 갱신")
+    parser.add_argument("--file", help="미리 내려받은 KIND 상장법인 목록 파일")
+    parser.add_argument("--output", default=LISTING_PATH, help="종목 목록 CSV 경로")
+    args = parser.parse_args()
+
+    try:
+        stocks = parse_kind_listing(fetch_kind_listing(args.file))
+    except (requests.RequestException, OSError, ValueError) as e:
+        print(f"❌ 상장법인 목록을 가져오지 못했습니다: {e}")
+        exit(1)
+    if not stocks:
+        print("❌ 상장법인 목록에서 KOSPI/KOSDAQ 종목을 찾지 못했습니다.")
+        exit(1)
+
+    existing = read_listing(args.output) if os.path.exists(args.output) else []
+    merged = merge_listing(existing, stocks)
+    write_listing(merged, args.output)
+
+    print(f"✅ 종목 목록 갱신: {len(existing)}개 → {len(merged)}개 "
+          f"(KIND {len(stocks)}개, KOSPI {sum(s['market'] == 'KOSPI' for s in stocks)}개 / "
+          f"KOSDAQ {sum(s['market'] == 'KOSDAQ' for s in stocks)}개)")
+    print(f"   저장 위치: {os.path.relpath(args.output, PROJECT_ROOT)}")
@@ -0,0 +1 @@
+"""수집 스크립트 공통 유틸리티 패키지"""
@@ -0,0 +1,191 @@
+"""
+수집 데이터 폴더 저장소
+data/ 폴더의 수집 파일을 종류(해외시장 일자별/월간, 뉴스 실행 결과)와 날짜별로 색인해 둡니다.
+폴더 수정 시각이 바뀔 때만 다시 목록을 읽으므로 "최신 시장 파일", "특정 날짜의 뉴스 실행 파일"
+같은 조회는 glob 없이 바로 답하며, 파싱한 내용은 파일 수정 시각이 같으면 LRU 캐시에서 재사용합니다.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from utils.fast_json import load_file
+
+# 파일 종류별 파일명 형식 (첫 번째 그룹: 날짜, 두 번째 그룹: 실행 번호)
+FILE_KINDS = {
+    'market_daily': re.compile(r'^global_point_(\d{4}-\d{2}-\d{2})\.json$'),
+    'market_monthly': re.compile(r'^global_point_monthly\.json$'),
+    'news_run': re.compile(r'^(\d{4}-\d{2}-\d{2})_(\d+)\.json$'),
+}
+
+# 파싱 결과 캐시 기본 크기 (파일 수)
+DEFAULT_CACHE_SIZE = 16
+
+
+class DataFile:
+    """색인된 파일 하나"""
+
+    __slots__ = ('path', 'kind', 'date', 'number', 'mtime_ns', 'size')
+
+    def __init__(self, path: str, kind: str, date: Optional[str], number: Optional[int], mtime_ns: int, size: int):
+        self.path = path
+        self.kind = kind
+        self.date = date
+        self.number = number
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    def age(self) -> float:
+        """파일 수정 후 지난 시간 (초)"""
+        return time.time() - self.mtime_ns / 1e9
+
+    def __repr__(self) -> str:
+        return f"DataFile({self.name!r}, kind={self.kind!r})"
+
+
+class DataRepository:
+    """종류/날짜별 파일 색인 + 파싱 결과 LRU 캐시"""
+
+    def __init__(self, data_dir: str = "data", cache_size: int = DEFAULT_CACHE_SIZE):
+        self.data_dir = data_dir
+        self.cache_size = cache_size
+        self._dir_mtime_ns = None
+        self._by_kind: Dict[str, Dict[Optional[str], List[DataFile]]] = {}
+        self._latest: Dict[str, DataFile] = {}
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        폴더 수정 시각이 바뀌었으면 파일 목록을 다시 색인
+
+        Returns:
+            다시 색인했는지 여부
+        """
+        try:
+            dir_mtime_ns = os.stat(self.data_dir).st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+        if not force and dir_mtime_ns == self._dir_mtime_ns and self._dir_mtime_ns is not None:
+            return False
+
+        by_kind: Dict[str, Dict[Optional[str], List[DataFile]]] = {kind: {} for kind in FILE_KINDS}
+        if dir_mtime_ns is not None:
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    data_file = self._classify(entry)
+                    if data_file is not None:
+                        by_kind[data_file.kind].setdefault(data_file.date, []).append(data_file)
+
+        latest = {}
+        for kind, by_date in by_kind.items():
+            for files in by_date.values():
+                files.sort(key=lambda f: (f.number or 0, f.name))
+            if by_date:
+                # 날짜가 있는 종류는 가장 늦은 날짜의 마지막 파일, 없는 종류는 유일한 파일
+                last_date = max(by_date, key=lambda d: d or '')
+                latest[kind] = by_date[last_date][-1]
+
+        with self._lock:
+            self._by_kind = by_kind
+            self._latest = latest
+            self._dir_mtime_ns = dir_mtime_ns
+        return True
+
+    def _classify(self, entry: os.DirEntry) -> Optional[DataFile]:
+        """파일명으로 종류/날짜/번호 판별 (색인 대상이 아니면 None)"""
+        if not entry.is_file():
+            return None
+        for kind, pattern in FILE_KINDS.items():
+            match = pattern.match(entry.name)
+            if match is None:
+                continue
+            groups = match.groups()
+            stat = entry.stat()
+            return DataFile(
+                entry.path, kind,
+                groups[0] if groups else None,
+                int(groups[1]) if len(groups) > 1 else None,
+                stat.st_mtime_ns, stat.st_size,
+            )
+        return None
+
+    def files(self, kind: str, date: Optional[str] = None) -> List[DataFile]:
+        """종류별 파일 목록 (date를 주면 해당 날짜만, 날짜·번호 순)"""
+        self.refresh()
+        by_date = self._by_kind.get(kind, {})
+        if date is not None:
+            return list(by_date.get(date, ()))
+        return [f for d in sorted(by_date, key=lambda d: d or '') for f in by_date[d]]
+
+    def dates(self, kind: str) -> List[str]:
+        """종류별 파일이 있는 날짜 목록 (오름차순)"""
+        self.refresh()
+        return sorted(d for d in self._by_kind.get(kind, {}) if d)
+
+    def latest(self, kind: str) -> Optional[DataFile]:
+        """종류별 가장 최근 파일"""
+        self.refresh()
+        return self._latest.get(kind)
+
+    def news_runs(self, date: str) -> List[DataFile]:
+        """날짜별 뉴스 실행 파일 (실행 번호 순)"""
+        return self.files('news_run', date)
+
+    def next_run_number(self, date: str) -> int:
+        """날짜별 다음 뉴스 실행 번호 (1부터)"""
+        runs = self.news_runs(date)
+        return runs[-1].number + 1 if runs else 1
+
+    def load(self, data_file: DataFile) -> Any:
+        """
+        파일 내용 파싱 (수정 시각/크기가 같으면 캐시 사용)
+
+        반환값은 캐시와 공유하므로 수정하지 말아야 합니다.
+        """
+        stat = os.stat(data_file.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(data_file.path)
+            if cached is not None and cached[0] == signature:
+                self._cache.move_to_end(data_file.path)
+                return cached[1]
+
+        content = load_file(data_file.path)
+        with self._lock:
+            self._cache[data_file.path] = (signature, content)
+            self._cache.move_to_end(data_file.path)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return content
+
+    def remove(self, data_file: DataFile) -> None:
+        """파일 삭제 (색인과 캐시에서도 제거)"""
+        os.remove(data_file.path)
+        with self._lock:
+            self._cache.pop(data_file.path, None)
+            files = self._by_kind.get(data_file.kind, {}).get(data_file.date)
+            if files and data_file in files:
+                files.remove(data_file)
+        # 최신 파일 정보가 바뀔 수 있으므로 다음 조회 때 다시 색인
+        self._dir_mtime_ns = None
+
+
+# 폴더별 저장소 인스턴스
+_repositories: Dict[str, DataRepository] = {}
+
+
+def get_data_repository(data_dir: str = "data") -> DataRepository:
+    """폴더별 저장소 (최초 호출 시 한 번만 생성)"""
+    key = os.path.abspath(data_dir)
+    repository = _repositories.get(key)
+    if repository is None:
+        repository = _repositories.setdefault(key, DataRepository(data_dir))
+    return repository
@@ -0,0 +1,88 @@
+"""
+빠른 JSON 직렬화 경로
+orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 같은 결과(UTF-8, 한글 그대로)를 만듭니다.
+API 응답 본문(main.FastJSONResponse)과 데이터 파일 읽기/쓰기에 함께 사용합니다.
+
+데이터 파일은 기본적으로 사람이 읽기 쉬운 2칸 들여쓰기로 쓰며,
+환경 변수 JSON_COMPACT=1이면 공백 없는 압축 형식으로 씁니다.
+"""
+
+import json
+import os
+from datetime import date, datetime
+from typing import Any
+
+# orjson이 설치되어 있으면 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 데이터 파일을 공백 없이 쓸지 (기본: 들여쓰기)
+JSON_COMPACT = os.getenv("JSON_COMPACT", "0").lower() in ("1", "true", "yes")
+
+if orjson is not None:
+    _BASE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """기본 타입이 아닌 객체 변환 (to_dict()가 있는 레코드 객체는 dict로)"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        option = _BASE_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys, default=_default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys, default=_default)
+    return text.encode('utf-8')
+
+
+def loads(data) -> Any:
+    """JSON 바이트/문자열 파싱"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_file(obj: Any, path: str, compact: bool = None, sort_keys: bool = False) -> int:
+    """
+    JSON 파일 쓰기 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 반쯤 쓴 파일을 보지 않음)
+
+    Args:
+        obj: 저장할 객체
+        path: 파일 경로
+        compact: True면 공백 없이, False면 2칸 들여쓰기 (기본: JSON_COMPACT 설정)
+        sort_keys: 키 정렬 여부
+
+    Returns:
+        쓴 바이트 수
+    """
+    if compact is None:
+        compact = JSON_COMPACT
+    data = dumps(obj, indent=not compact, sort_keys=sort_keys)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def load_file(path: str) -> Any:
+    """JSON 파일 읽기"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
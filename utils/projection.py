@@ -0,0 +1,59 @@
+"""
+API 응답 필드 선택 / 열 형식 변환
+지수 레코드 리스트에서 요청한 필드만 남기거나(fields),
+레코드 리스트를 필드별 배열로 바꿔(format=compact) 반복되는 키 문자열을 없앱니다.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+# 지수 레코드 필드 (출력 순서)
+INDEX_FIELDS = (
+    'symbol', 'name', 'current_price', 'previous_close', 'change', 'change_percent',
+    'currency', 'market_state', 'timestamp', 'date',
+)
+
+# 응답 형식
+FORMATS = ('full', 'compact')
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str] = INDEX_FIELDS) -> Optional[List[str]]:
+    """
+    fields 쿼리("symbol,current_price")를 필드 리스트로 변환
+
+    Raises:
+        ValueError: 지원하지 않는 필드가 있을 때
+    """
+    if not fields:
+        return None
+    selected = list(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+    unknown = [field for field in selected if field not in allowed]
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(allowed)})")
+    return selected or None
+
+
+def project_records(records: List[Dict], fields: Optional[List[str]] = None, compact: bool = False):
+    """
+    레코드 리스트 변환
+
+    Returns:
+        compact=False: 선택한 필드만 남긴 레코드 리스트
+        compact=True: {필드: [값, ...]} 열 배열
+    """
+    if fields is None:
+        fields = [field for field in INDEX_FIELDS if any(field in record for record in records)]
+    if compact:
+        return {field: [record.get(field) for record in records] for field in fields}
+    return [{field: record[field] for field in fields if field in record} for record in records]
+
+
+def project_payload(payload: Dict, list_keys: Iterable[str], fields: Optional[List[str]] = None,
+                    compact: bool = False) -> Dict:
+    """응답 본문에서 list_keys에 해당하는 레코드 리스트만 변환한 새 본문 반환"""
+    projected = dict(payload)
+    for key in list_keys:
+        if key in projected:
+            projected[key] = project_records(projected[key], fields, compact)
+    if compact:
+        projected['format'] = 'compact'
+    return projected
@@ -0,0 +1,94 @@
+"""
+호스트 단위 요청 속도 제한
+같은 호스트에 대한 요청 간격을 최소 간격 이상으로 유지합니다.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격을 보장하는 스레드 안전 속도 제한기"""
+
+    def __init__(self, min_interval: float = 0.5, per_host: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            min_interval: 기본 최소 요청 간격 (초)
+            per_host: 호스트별 최소 요청 간격 (예: {'n.news.naver.com': 0.2})
+        """
+        self.min_interval = min_interval
+        self.per_host = per_host or {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def interval_for(self, host: str) -> float:
+        """호스트에 적용되는 최소 요청 간격 반환"""
+        return self.per_host.get(host, self.min_interval)
+
+    def reserve(self, host: str) -> float:
+        """
+        다음 요청 슬롯을 예약하고 기다려야 할 시간을 반환
+
+        Args:
+            host: 요청 대상 호스트
+
+        Returns:
+            요청 전에 대기해야 하는 시간 (초)
+        """
+        interval = self.interval_for(host)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + interval
+        return slot - now
+
+    def wait(self, url_or_host: str) -> None:
+        """URL 또는 호스트에 대한 요청 슬롯이 올 때까지 대기"""
+        host = urlparse(url_or_host).netloc or url_or_host
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+
+
+class SharedHostRateLimiter(HostRateLimiter):
+    """
+    여러 프로세스가 함께 쓰는 호스트별 속도 제한기
+
+    다음 요청 슬롯을 공유 메모리 배열에 저장하므로 ProcessPoolExecutor의
+    initializer 인자로 넘겨 모든 작업 프로세스가 같은 간격을 지키게 할 수 있습니다.
+    호스트는 고정 개수의 슬롯에 해시로 배정됩니다.
+    """
+
+    def __init__(self, min_interval: float = 0.5, per_host: Optional[Dict[str, float]] = None,
+                 slots: int = 16, context=None):
+        super().__init__(min_interval, per_host)
+        import multiprocessing
+        ctx = context or multiprocessing.get_context()
+        self._slot_count = slots
+        self._shared_slots = ctx.Array('d', slots, lock=False)
+        self._lock = ctx.Lock()
+
+    def _slot_index(self, host: str) -> int:
+        """호스트가 배정된 공유 슬롯 번호 (프로세스마다 같은 값이 나오도록 hash() 대신 합계 사용)"""
+        return sum(host.encode('utf-8')) % self._slot_count
+
+    def reserve(self, host: str) -> float:
+        """공유 슬롯에서 다음 요청 슬롯을 예약하고 기다려야 할 시간을 반환"""
+        interval = self.interval_for(host)
+        index = self._slot_index(host)
+        with self._lock:
+            # 프로세스 간에 비교 가능한 벽시계 시간 사용
+            now = time.time()
+            slot = max(now, self._shared_slots[index])
+            self._shared_slots[index] = slot + interval
+        return slot - now
+
+
+# 뉴스 수집용 공용 인스턴스 (네이버 호스트 기본 간격 0.5초, 기사 본문은 0.2초)
+news_rate_limiter = HostRateLimiter(
+    min_interval=0.5,
+    per_host={'n.news.naver.com': 0.2}
+)
@@ -0,0 +1,213 @@
+"""
+API 응답 스냅샷 캐시
+조회 결과를 TTL 동안 한 번만 직렬화해 두고, 내용 해시로 만든 ETag와
+미리 압축한 본문(gzip, brotli가 설치되어 있으면 brotli)을 함께 보관합니다.
+압축본은 본문 바이트가 다르므로 ETag 뒤에 인코딩 이름을 붙여 구분합니다.
+내용이 바뀌지 않았으면 이전 스냅샷을 그대로 유지하므로 같은 ETag에는 항상 같은 본문이 나갑니다.
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+from utils.fast_json import dumps
+
+# brotli가 설치되어 있으면 br 인코딩도 제공
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 이 크기 미만의 본문은 압축하지 않음 (바이트)
+MIN_COMPRESS_SIZE = 1024
+
+# 스냅샷 하나에 보관하는 최대 변형(필드 선택/형식) 수
+MAX_VARIANTS = 32
+
+
+class Snapshot:
+    """직렬화된 응답 본문과 ETag, 압축본"""
+
+    __slots__ = ('payload', 'body', 'etag', 'created_at', '_encoded', '_variants', '_base')
+
+    def __init__(self, payload: Dict, body: bytes, etag: str, base: Optional["Snapshot"] = None):
+        self.payload = payload
+        self.body = body
+        self.etag = etag
+        self.created_at = time.time()
+        self._encoded: Dict[str, bytes] = {}
+        self._variants: Dict[Hashable, "Snapshot"] = {}
+        self._base = base
+
+    def age(self) -> float:
+        """스냅샷 생성 후 지난 시간 (초, 변형은 원본 기준)"""
+        if self._base is not None:
+            return self._base.age()
+        return time.time() - self.created_at
+
+    def variant(self, key: Hashable, transform: Callable[[Dict], Dict]) -> "Snapshot":
+        """
+        같은 데이터를 다른 모양으로 만든 스냅샷 (필드 선택, 압축 형식 등)
+
+        변형도 원본처럼 한 번만 직렬화·압축하며, ETag는 원본 ETag에 변형 키 해시를 붙여 만듭니다.
+        """
+        derived = self._variants.get(key)
+        if derived is None:
+            payload = transform(self.payload)
+            body = dumps(payload)
+            suffix = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:8]
+            derived = Snapshot(payload, body, f'{self.etag[:-1]}-{suffix}"', base=self)
+            if len(self._variants) < MAX_VARIANTS:
+                self._variants[key] = derived
+        return derived
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """압축 방식별 ETag (압축본은 본문 바이트가 다르므로 인코딩 이름을 붙여 구분)"""
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더가 이 스냅샷의 ETag(압축본 포함)를 포함하는지"""
+        if not if_none_match:
+            return False
+        etags = {self.etag, self.etag_for('gzip'), self.etag_for('br')}
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag == '*' or tag.removeprefix('W/') in etags:
+                return True
+        return False
+
+    def choose_encoding(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """
+        Accept-Encoding과 본문 크기에 맞는 압축 방식 (압축하지 않으면 None)
+
+        q 값이 가장 큰 방식을 고르고(같으면 br 우선), q=0인 방식은 쓰지 않습니다.
+        """
+        if len(self.body) < MIN_COMPRESS_SIZE or not accept_encoding:
+            return None
+        weights = {}
+        for part in accept_encoding.split(','):
+            name, _, params = part.partition(';')
+            weight = 1.0
+            for param in params.split(';'):
+                param_name, _, value = param.partition('=')
+                if param_name.strip().lower() == 'q':
+                    try:
+                        weight = float(value)
+                    except ValueError:
+                        weight = 0.0
+            weights[name.strip().lower()] = weight
+
+        best, best_weight = None, 0.0
+        for encoding in ('br', 'gzip'):
+            if encoding == 'br' and brotli is None:
+                continue
+            weight = weights.get(encoding, weights.get('*', 0.0))
+            if weight > best_weight:
+                best, best_weight = encoding, weight
+        return best
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """압축 방식별 본문 (처음 요청될 때 한 번만 압축)"""
+        if encoding is None:
+            return self.body
+        data = self._encoded.get(encoding)
+        if data is None:
+            if encoding == 'br':
+                data = brotli.compress(self.body, quality=5)
+            else:
+                data = gzip.compress(self.body, compresslevel=6, mtime=0)
+            self._encoded[encoding] = data
+        return data
+
+
+class SnapshotCache:
+    """키별 응답 스냅샷을 TTL 동안 재사용하는 캐시"""
+
+    def __init__(self, ttl: float = 30.0, volatile_keys: Iterable[str] = ('timestamp', 'update_time')):
+        """
+        Args:
+            ttl: 스냅샷 유효 시간 (초)
+            volatile_keys: ETag 계산에서 제외할 최상위 키 (조회 시각처럼 매번 바뀌는 값)
+        """
+        self.ttl = ttl
+        self.volatile_keys = set(volatile_keys)
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def make_etag(self, payload: Dict) -> str:
+        """조회 시각을 뺀 내용의 해시로 ETag 생성"""
+        stable = {k: v for k, v in payload.items() if k not in self.volatile_keys}
+        digest = hashlib.sha1(dumps(stable, sort_keys=True)).hexdigest()
+        return f'"{digest[:20]}"'
+
+    def peek(self, key: str) -> Optional[Snapshot]:
+        """유효 기간과 관계없이 현재 스냅샷 반환"""
+        return self._snapshots.get(key)
+
+    def remaining_ttl(self, snapshot: Snapshot) -> int:
+        """스냅샷이 유효한 남은 시간 (초, Cache-Control max-age용)"""
+        return max(0, int(self.ttl - snapshot.age()))
+
+    def get(self, key: str, producer: Callable[[], Dict],
+            is_valid: Optional[Callable[[Dict], bool]] = None) -> Snapshot:
+        """
+        유효한 스냅샷을 반환하고, 없거나 만료되었으면 producer로 새로 만듦
+
+        같은 키를 동시에 요청하면 한 요청만 producer를 호출합니다.
+        is_valid가 False를 반환한 결과는 캐시하지 않습니다.
+        """
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.age() < self.ttl:
+            return snapshot
+
+        with self._lock_for(key):
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.age() < self.ttl:
+                return snapshot
+
+            payload = producer()
+            etag = self.make_etag(payload)
+            if is_valid is not None and not is_valid(payload):
+                return Snapshot(payload, dumps(payload), etag)
+
+            if snapshot is not None and snapshot.etag == etag:
+                # 내용이 같으면 기존 본문/압축본을 유지하고 유효 시간만 연장
+                snapshot.created_at = time.time()
+                return snapshot
+
+            snapshot = Snapshot(payload, dumps(payload), etag)
+            self._snapshots[key] = snapshot
+            return snapshot
+
+    def prime(self, key: str, payload: Dict, created_at: Optional[float] = None) -> Snapshot:
+        """
+        이미 가진 데이터(저장된 수집 파일 등)로 스냅샷을 미리 채움
+
+        Args:
+            created_at: 데이터 생성 시각 (epoch 초, 생략 시 현재) - 유효 시간은 이 시각부터 계산
+        """
+        etag = self.make_etag(payload)
+        with self._lock_for(key):
+            snapshot = self._snapshots.get(key)
+            if snapshot is None or snapshot.etag != etag:
+                snapshot = Snapshot(payload, dumps(payload), etag)
+                self._snapshots[key] = snapshot
+            # 내용이 같으면 기존 본문/압축본을 유지하고 유효 시간만 갱신
+            snapshot.created_at = created_at if created_at is not None else time.time()
+        return snapshot
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """키 하나 또는 전체 스냅샷 만료"""
+        if key is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(key, None)
@@ -0,0 +1,145 @@
+"""
+실시간 시세 스트림 허브
+하나의 생산자 작업이 주기적으로 시세를 가져와 이전 상태와 비교하고,
+바뀐 종목·필드만 담은 변경분을 구독자별 크기 제한 큐로 나눠 보냅니다.
+큐가 가득 찬 느린 구독자는 쌓인 변경분을 버리고 전체 스냅샷 하나로 합치며,
+계속 따라오지 못하면 연결을 끊어 다른 구독자를 붙잡지 않습니다.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+# (이벤트 이름, 직렬화된 JSON, 순번)
+StreamMessage = Tuple[str, str, int]
+
+
+class Subscriber:
+    """구독자 하나의 메시지 큐"""
+
+    __slots__ = ('queue', 'overflows')
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflows = 0
+
+
+class DeltaStreamHub:
+    """단일 생산자 → 다수 구독자 변경분 스트림"""
+
+    def __init__(self, fetch: Callable[[], List[Dict]], key: str = 'symbol', interval: float = 5.0,
+                 queue_size: int = 32, max_overflows: int = 3):
+        """
+        Args:
+            fetch: 현재 레코드 리스트를 반환하는 (블로킹) 함수
+            key: 레코드를 구분하는 필드
+            interval: 조회 주기 (초)
+            queue_size: 구독자별 최대 대기 메시지 수
+            max_overflows: 큐가 넘친 횟수가 이 값을 넘으면 연결 종료
+        """
+        self.fetch = fetch
+        self.key = key
+        self.interval = interval
+        self.queue_size = queue_size
+        self.max_overflows = max_overflows
+        self.state: Dict[str, Dict] = {}
+        self.seq = 0
+        self._subscribers = set()
+        self._task: Optional[asyncio.Task] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._snapshot_cache: Optional[StreamMessage] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def snapshot_message(self) -> StreamMessage:
+        """현재 전체 상태 메시지 (순번이 바뀔 때만 다시 직렬화)"""
+        if self._snapshot_cache is None or self._snapshot_cache[2] != self.seq:
+            data = dumps({'type': 'snapshot', 'seq': self.seq, 'data': self.state}).decode('utf-8')
+            self._snapshot_cache = ('snapshot', data, self.seq)
+        return self._snapshot_cache
+
+    async def subscribe(self) -> Subscriber:
+        """구독 시작 (첫 메시지는 전체 스냅샷)"""
+        if not self.state:
+            await self.refresh()
+        subscriber = Subscriber(self.queue_size)
+        subscriber.queue.put_nowait(self.snapshot_message())
+        self._subscribers.add(subscriber)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """구독 종료"""
+        self._subscribers.discard(subscriber)
+
+    async def _run(self) -> None:
+        """구독자가 있는 동안 주기적으로 조회하고 변경분 발행"""
+        while self._subscribers:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Stream refresh error: {e}")
+
+    async def refresh(self) -> Optional[Dict]:
+        """
+        한 번 조회하여 변경분을 계산하고 발행
+
+        Returns:
+            변경분 {키: {필드: 값}} (변경이 없으면 None)
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            records = await asyncio.get_running_loop().run_in_executor(None, self.fetch)
+            if not records:
+                # 조회 실패는 삭제로 보지 않고 이전 상태 유지
+                return None
+
+            changes = {}
+            for record in records:
+                record_key = record.get(self.key)
+                previous = self.state.get(record_key)
+                if previous is None:
+                    changes[record_key] = dict(record)
+                    continue
+                changed = {field: value for field, value in record.items() if previous.get(field) != value}
+                if changed:
+                    changes[record_key] = changed
+
+            if not changes:
+                return None
+
+            for record_key, changed in changes.items():
+                self.state.setdefault(record_key, {}).update(changed)
+            self.seq += 1
+            data = dumps({'type': 'delta', 'seq': self.seq, 'data': changes}).decode('utf-8')
+            self._publish(('delta', data, self.seq))
+            return changes
+
+    def _publish(self, message: StreamMessage) -> None:
+        """모든 구독자 큐에 메시지 추가 (기다리지 않음)"""
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(message)
+                continue
+            except asyncio.QueueFull:
+                pass
+
+            # 느린 구독자: 쌓인 변경분을 버리고 전체 스냅샷 하나로 합침
+            subscriber.overflows += 1
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            if subscriber.overflows > self.max_overflows:
+                # None은 연결 종료 신호
+                subscriber.queue.put_nowait(None)
+                self._subscribers.discard(subscriber)
+            else:
+                subscriber.queue.put_nowait(self.snapshot_message())